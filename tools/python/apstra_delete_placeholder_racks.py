@@ -46,12 +46,9 @@ def delete_racks(racks_by_blueprint):
             if bp_name in racks_by_blueprint:
                 racks_to_delete = racks_by_blueprint[bp_name]
 
-                for rack_name in racks_to_delete:
-                    rack_id = get_rack_id(bp_name, rack_name)
-                    
-                    if rack_id:
-                        if delete_rack(bp_name, rack_name):
-                            logger.info("🗑️  Deleted rack '%s' from blueprint '%s'", rack_name, bp_name)
+                # All the racks of the blueprint are deleted with a single request
+                for rack_name in delete_racks_from_bp(bp_name, racks_to_delete):
+                    logger.info("🗑️  Deleted rack '%s' from blueprint '%s'", rack_name, bp_name)
             else:
                 logger.info("ℹ️ No placeholder racks found for blueprint '%s'.", bp_name)
 
@@ -47,7 +47,7 @@ def get_cabling_maps():
             bp_cm_path = os.path.join(bp_cm_dir, cm_filename)
             cm_dict = get_cabling_map(bp_name)
             json_data = json.loads(cm_dict)
-            yaml_data = yaml.safe_dump(json_data, default_flow_style=False)
+            yaml_data = yaml.dump(json_data, Dumper=YamlSafeDumper, default_flow_style=False)
             create_output_file(yaml_data, bp_cm_path)
             rprint(f"Cabling Map downloaded from Apstra: {bp_cm_path}")
 
@@ -55,7 +55,7 @@ def get_device_models():
                 bp_dm_path = os.path.join(bp_dm_dir, dm_filename)
                 dm_dict = get_dev_model(device_key)
                 json_data = json.loads(dm_dict)
-                yaml_data = yaml.safe_dump(json_data, default_flow_style=False)
+                yaml_data = yaml.dump(json_data, Dumper=YamlSafeDumper, default_flow_style=False)
                 create_output_file(yaml_data, bp_dm_path)
                 logger.info("Device Model downloaded from Apstra: %s", bp_dm_path)
     except Exception as e:
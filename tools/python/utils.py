@@ -37,9 +37,12 @@ import logging
 import urllib3
 import json
 import difflib
+import filecmp
 import ipaddress
 import shutil
 import tarfile
+import mmap
+import io
 import tempfile
 import time
 import subprocess
@@ -47,11 +50,18 @@ import hashlib
 import csv
 import pty
 import shlex
+import threading
+import functools
+import copy
 
 # from tf import *
+from collections import Counter, defaultdict
 from collections.abc import Mapping, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from deepdiff import DeepDiff
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import rich.repr
 from rich import print as rprint
@@ -73,6 +83,12 @@ from aos.client import AosClient
 from aos.design import AosConfiglets
 from aos.design import AosPropertySets
 
+# Use the libyaml C parser and emitter when PyYAML has been built with it (falls back to the pure-Python ones otherwise)
+try:
+    from yaml import CSafeLoader as YamlSafeLoader, CSafeDumper as YamlSafeDumper
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader, SafeDumper as YamlSafeDumper
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
@@ -93,7 +109,7 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 # ---------------------------------------------------------------------------- #
 #                                    Classes                                   #
 # ---------------------------------------------------------------------------- #
-class NoAliasDumper(yaml.SafeDumper):
+class NoAliasDumper(YamlSafeDumper):
     def ignore_aliases(self, data):
         return True
 
@@ -156,6 +172,15 @@ class Scope_Manager:
         # 1/4 - Initialize all scope parameters to '-'
         self.initialize_vars(terraform_command)
 
+        # Maximum size of the project log file (in bytes) before it gets rotated
+        self.project_log_max_bytes = project_log_max_size_mb * 1024 * 1024
+
+        # Short-lived cache of the Time Voyager revisions of each blueprint ({bp_name: (timestamp, revisions, index)})
+        self.revision_list_cache = {}
+
+        # Execution ID stored in the execution data file, read once on demand
+        self.cached_execution_id = None
+
         # 2/4 - Update them with values from the global scope file (it is a global variable defined in utils.py)
         scope = yamldecode(scope_file_path)
         if scope:
@@ -206,12 +231,45 @@ class Scope_Manager:
             url = f'https://{aos_ip}/api/user/login'
             data = json.dumps({"username": aos_username, "password": aos_password})
             headers = {'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-            response = requests.post(url, data=data, headers=headers, verify=False)
+            response = self.get_aos_session().post(url, data=data, headers=headers)
             response.raise_for_status()
             self.aos_token = response.json()['token']
         except Exception as e:
             logger.error(f'❌ Error: Authentication failed - {e}')
 
+    def get_aos_session(self):
+        '''
+        Return a requests Session for the AOS API, so consecutive calls reuse pooled connections instead of
+        paying a new TCP/TLS handshake each time. The session is created once per process (shared by all the
+        Scope_Manager instances), so it does not hold any token: pass 'get_aos_headers' (or explicit headers) on each request.
+
+        Returns:
+            requests.Session: Session with the common AOS headers (content type, no cache) already set.
+        '''
+        global aos_session
+        with aos_session_lock:
+            if aos_session is None:
+                aos_session = requests.Session()
+                # Transient gateway errors are retried transparently; the final response is always returned to the caller
+                # (409 is not retried here, as the callers poll on it with their own cadence)
+                retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504], raise_on_status=False)
+                adapter = HTTPAdapter(pool_connections=aos_api_max_workers, pool_maxsize=aos_api_max_workers, max_retries=retries)
+                aos_session.mount('https://', adapter)
+                aos_session.verify = False
+                aos_session.headers.update({'Content-Type': 'application/json', 'Cache-Control': 'no-cache'})
+        return aos_session
+
+    def get_aos_headers(self):
+        '''
+        Return the per-request headers of the AOS API calls made through the shared session ('get_aos_session').
+        The token is sent with each request rather than stored in the session, since the session is shared by all the
+        Scope_Manager instances (and their worker threads), which may hold different tokens.
+
+        Returns:
+            dict: Headers with the AOS token of this scope manager.
+        '''
+        return {'AuthToken': self.get('aos_token')}
+
     def get_project_execution_history(self):
         '''
         Retrieves the execution history for a specific project.
@@ -427,7 +485,7 @@ class Scope_Manager:
                     try:
                         # -- Read the YAML execution file
                         with open(execution_file_path, "r", encoding="utf-8") as file:
-                            execution_data = yaml.safe_load(file)
+                            execution_data = yaml.load(file, Loader=YamlSafeLoader)
 
                         # -- Check if execution_id matches the selected rollback execution
                         if execution_data.get("execution_id") == rollback_execution_id:
@@ -576,7 +634,6 @@ class Scope_Manager:
             self.wip_execution_0_tfplan_generation_log = os.path.join(self.wip_execution_0_log_path, '01_tfplan_generation.log')
             self.wip_execution_0_tfplan_generation_error = os.path.join(self.wip_execution_0_log_path, '01_tfplan_generation_error.log')
 
-            self.wip_execution_0_tfplan_all_log = os.path.join(self.wip_execution_0_log_path, "tfplan_execution_all.log")
             self.wip_execution_0_tfplan_log = os.path.join(self.wip_execution_0_log_path, "02_tfplan_execution.log")
             self.wip_execution_0_tfplan_output = os.path.join(self.wip_execution_0_log_path, "02_tfplan_execution_output.log")
             self.wip_execution_0_tfplan_error = os.path.join(self.wip_execution_0_log_path, "02_tfplan_execution_error.log")
@@ -620,7 +677,7 @@ class Scope_Manager:
             # scope_file_path = os.path.join(scope_path, scope_filename)
             if os.path.exists(scope_file_path):
                 with open(scope_file_path, 'r') as file:            # Load the YAML data from the file
-                    scope_data = yaml.safe_load(file)
+                    scope_data = yaml.load(file, Loader=YamlSafeLoader)
                     scope_data['aos_target'] = self.aos_target
                     scope_data['customer'] = self.customer
                     scope_data['domain'] = self.domain
@@ -634,7 +691,8 @@ class Scope_Manager:
                     scope_data['first_execution_reverted'] = self.first_execution_reverted
                     scope_data['terraform_command'] = self.terraform_command
                 with open(scope_file_path, 'w') as file:
-                    yaml.dump(scope_data, file)
+                    # Plain data only (loaded from the scope file or set from strings/booleans), so the C safe emitter can be used
+                    yaml.dump(scope_data, file, Dumper=YamlSafeDumper)
                 # logger.info("Scope file updated successfully.")
                 if update_execution_data_file == True:
                     self.handle_execution_data_file("update", scope_data)
@@ -703,6 +761,10 @@ class Scope_Manager:
         try:
             yaml_file = os.path.join(self.wip_execution_data_path, execution_data_filename)
 
+            # The file is about to change, so the cached execution ID is no longer reliable
+            if action in ("create", "update"):
+                self.cached_execution_id = None
+
             if not os.path.exists(self.wip_execution_data_path):
                 os.makedirs(self.wip_execution_data_path)
             if action == "create":
@@ -734,7 +796,7 @@ class Scope_Manager:
                 for d in dicts:
                     data.update(d)
                 with open(yaml_file, 'w') as file:
-                    yaml.dump(data, file)
+                    yaml.dump(data, file, Dumper=YamlSafeDumper)
                 print("\n")
                 logger.info(f"🆔 Assigned APAF Execution ID: {self.execution_id}")
             elif action == "update":
@@ -742,7 +804,7 @@ class Scope_Manager:
             elif action == "read":
                 if os.path.exists(yaml_file):
                     with open(yaml_file, 'r') as file:
-                        return yaml.safe_load(file) or {}  # Return parsed YAML content or empty dict
+                        return yaml.load(file, Loader=YamlSafeLoader) or {}  # Return parsed YAML content or empty dict
                 else:
                     logger.error(f"❌ YAML file '{yaml_file}' not found.")
                     return {}
@@ -757,6 +819,19 @@ class Scope_Manager:
 
         return None
 
+    def get_original_execution_id(self):
+        '''
+        Get the original execution ID stored in the execution data file at the start of the execution.
+        The file is only read the first time; the ID is then cached until the file is created or updated again.
+
+        Returns:
+            str: The execution ID, or None if it is not available.
+        '''
+        if self.cached_execution_id is None:
+            execution_data = self.handle_execution_data_file("read", {}) or {}
+            self.cached_execution_id = execution_data.get('execution_id', None)
+        return self.cached_execution_id
+
     def get(self, attribute, default=None):
         '''
         Get the value of an attribute if it exists, otherwise return the default value.
@@ -951,7 +1026,7 @@ class Scope_Manager:
                         })
 
                         # Append the tmp_exec_log_file to the customer-wide log file.
-                        self.handle_project_log(10)
+                        self.handle_project_log()
 
                         # Remove the "tmp_log" directory
                         remove_directory(tmp_exec_log_path)
@@ -1347,38 +1422,49 @@ class Scope_Manager:
                 # Sort the folders by their numeric value
                 execution_dirs.sort(key=lambda x: int(x.split('_')[1]))
 
-                # Rename the folders, increasing each <x> by 1
-                for folder in reversed(execution_dirs):
-                    folder_num = int(folder.split('_')[1])
-                    new_dir_num = folder_num + 1
-                    new_dir_name = f"execution_{new_dir_num}"
+                # Open the "wip" folder once so that the renames below are resolved relative to it (if supported by the platform)
+                wip_dir_fd = os.open(self.wip_path, os.O_RDONLY | os.O_DIRECTORY) if os.rename in os.supports_dir_fd else None
 
-                    if new_dir_num > threshold:
-                        # Remove folders that exceed the threshold
-                        remove_directory(os.path.join(self.wip_path, folder))
-                    else:
-                        # Rename folders
-                        os.rename(os.path.join(self.wip_path, folder),
-                                os.path.join(self.wip_path, new_dir_name))
+                try:
+                    # Rename the folders, increasing each <x> by 1
+                    for folder in reversed(execution_dirs):
+                        folder_num = int(folder.split('_')[1])
+                        new_dir_num = folder_num + 1
+                        new_dir_name = f"execution_{new_dir_num}"
+
+                        if new_dir_num > threshold:
+                            # Remove folders that exceed the threshold
+                            remove_directory(os.path.join(self.wip_path, folder))
+                        elif wip_dir_fd is not None:
+                            # Rename folders
+                            os.rename(folder, new_dir_name, src_dir_fd=wip_dir_fd, dst_dir_fd=wip_dir_fd)
+                        else:
+                            # Rename folders
+                            os.rename(os.path.join(self.wip_path, folder),
+                                    os.path.join(self.wip_path, new_dir_name))
+                finally:
+                    if wip_dir_fd is not None:
+                        os.close(wip_dir_fd)
 
                 # The "execution_0" folder is now available for use
                 # Create the "execution_0" folder and the required subfolders
                 if not os.path.exists(self.wip_execution_0_path):
                     os.makedirs(self.wip_execution_0_path)
 
-                    scope_data = {}
-                    scope_data['aos_target'] = self.aos_target
-                    scope_data['customer'] = self.customer
-                    scope_data['domain'] = self.domain
-                    scope_data['project'] = self.project
-                    scope_data['pre_commit_action'] = self.pre_commit_action
-                    scope_data['pre_commit_comment'] = self.pre_commit_comment
-                    scope_data['post_commit_action'] = self.post_commit_action
-                    scope_data['post_commit_comment'] = self.post_commit_comment
-                    scope_data['post_rollback'] = self.post_rollback
-                    scope_data['interactive'] = self.interactive
-                    scope_data['first_execution_reverted'] = self.first_execution_reverted
-                    scope_data['terraform_command'] = self.terraform_command
+                    scope_data = {
+                        'aos_target': self.aos_target,
+                        'customer': self.customer,
+                        'domain': self.domain,
+                        'project': self.project,
+                        'pre_commit_action': self.pre_commit_action,
+                        'pre_commit_comment': self.pre_commit_comment,
+                        'post_commit_action': self.post_commit_action,
+                        'post_commit_comment': self.post_commit_comment,
+                        'post_rollback': self.post_rollback,
+                        'interactive': self.interactive,
+                        'first_execution_reverted': self.first_execution_reverted,
+                        'terraform_command': self.terraform_command,
+                    }
 
                     self.handle_execution_data_file("create", scope_data)
 
@@ -1431,34 +1517,45 @@ class Scope_Manager:
         except Exception as e:
             logger.error(f"❌ An error occurred while managing execution folders: {e}")
 
-    def handle_project_log(self, max_size_mb=10, tgz_backup_files=True):
+    def handle_project_log(self, max_size_mb=None, tgz_backup_files=True):
         '''
         Ensures the project log file is properly maintained.
 
         - If `self.project_log_file` does not exist, it is created by copying `tmp_exec_log_file`.
         - If `self.project_log_file` exists, `tmp_exec_log_file` is appended to it.
-        - If the size of `self.project_log_file` exceeds `max_size_mb`, it is backed up using `rename_backup_files`. Defaults to 10 MB.
+        - If the size of `self.project_log_file` exceeds the maximum size, it is backed up using `rename_backup_files`.
         - If `tgz_backup_files` is True, backup files are compressed into a `.tgz` archive. Defaults to True.
 
         Args:
-            max_size_mb (int, optional): Maximum log file size in MB before triggering a backup. Defaults to 10MB.
+            max_size_mb (int, optional): Maximum log file size in MB before triggering a backup. Defaults to `project_log_max_size_mb` (10MB).
             tgz_backup_files (bool, optional): If True, compress backup files into a `.tgz` archive.
         '''
         try:
+            # Use the threshold precomputed at init time unless explicitly overridden
+            max_bytes = self.project_log_max_bytes if max_size_mb is None else max_size_mb * 1024 * 1024
+
+            # Get the current log file size with a single stat call (None if the log file does not exist yet)
+            try:
+                project_log_size = os.stat(self.project_log_file).st_size
+            except FileNotFoundError:
+                project_log_size = None
+
             # Check log file size and rotate if necessary before anything else
-            if os.path.exists(self.project_log_file) and os.path.getsize(self.project_log_file) > (max_size_mb * 1024 * 1024):
-            # if os.path.exists(self.project_log_file) and os.path.getsize(self.project_log_file) > (max_size_mb):
+            if project_log_size is not None and project_log_size > max_bytes:
                 rename_backup_files(self.project_log_file, tgz_backup_files=tgz_backup_files)
+                if not os.path.exists(self.project_log_file):
+                    project_log_size = None  # The log file has been moved away as part of the backup
 
             # Handle creation or appending of the log file
-            if not os.path.exists(self.project_log_file):
+            if project_log_size is None:
                 # Create directories if they don't exist and copy the tmp log file to the project log
                 os.makedirs(os.path.dirname(self.project_log_file), exist_ok=True)
                 shutil.copy(tmp_exec_log_file, self.project_log_file)
             else:
                 # Append the content of tmp_exec_log_file to the existing project log file
-                with open(self.project_log_file, 'a') as project_log, open(tmp_exec_log_file, 'r') as tmp_log:
-                    shutil.copyfileobj(tmp_log, project_log)
+                # Opened without O_APPEND ('ab'), which sendfile rejects: append_file_contents writes from the end of the file itself
+                with open(self.project_log_file, 'r+b') as project_log, open(tmp_exec_log_file, 'rb') as tmp_log:
+                    append_file_contents(tmp_log, project_log)
 
         except Exception as e:
             logger.error(f"❌ Error handling project log file: {e}")
@@ -1491,8 +1588,11 @@ class Scope_Manager:
             os.chdir(terraform_path)
             print("\n")
 
+            # Parse the Terraform action ('apply', 'destroy', ...) once for the whole execution
+            tf_action = get_terraform_action(self.terraform_command)
+
             # Set the Terraform apply or destroy command based on the input
-            if "terraform apply" in self.terraform_command or "terraform destroy" in self.terraform_command:
+            if tf_action in terraform_actions_apply_destroy:
 
                 # Generate Terraform plan and check if changes exist
                 tfplan_changes = self.generate_terraform_plan()
@@ -1533,7 +1633,7 @@ class Scope_Manager:
 
                 # Delete blueprints via API before running Terraform destroy to prevent the "At least one rack should remain in the blueprint" error.
                 # IMPORTANT: TO BE DONE ONLY if the blueprints have not been created in parent projects.
-                if "terraform destroy" in self.terraform_command:
+                if tf_action == 'destroy':
                     for bp_name in (self.get('blueprints') or []):
                         inherited_bp =  False
 
@@ -1568,15 +1668,29 @@ class Scope_Manager:
                     terraform_command_tfplan = shlex.split(self.terraform_command)  # Convert string to list, preserving quoted arguments
 
             # Execute Terraform (based on the Terraform Plan if the action was 'apply' or 'destroy', not based on it if it is not)
-            result_tfplan_execution = run_command_and_save_stdout_stderr(terraform_command_tfplan, self.wip_execution_0_tfplan_all_log, self.wip_execution_0_tfplan_error)
+            # The output is split on the fly into two files (logs and outputs) while the command runs
+            # The first line reporting the completed resources is captured at the same time (no need to read the log again later)
+            completed_lines = []
+
+            def capture_completed_line(line):
+                if not completed_lines and "complete!" in line:
+                    completed_lines.append(line)
+
+            result_tfplan_execution = run_command_and_split_stdout_stderr(
+                terraform_command_tfplan,
+                "Outputs:",
+                self.wip_execution_0_tfplan_log,
+                self.wip_execution_0_tfplan_output,
+                self.wip_execution_0_tfplan_error,
+                handle_stdout_line=capture_completed_line
+            )
+            tfplan_execution_resources = completed_lines[0] if completed_lines else None
 
-            # Split the logfile of the execution into two files (logs and outputs) and remove the original logfile
-            if os.path.exists(self.wip_execution_0_tfplan_all_log):
-                split_file_on_first_match(self.wip_execution_0_tfplan_all_log, "Outputs:", self.wip_execution_0_tfplan_log, self.wip_execution_0_tfplan_output)
-                remove_file(self.wip_execution_0_tfplan_all_log)
+            # Terraform may have created or deleted any AOS object (blueprints included), drop the memoized catalogs
+            invalidate_aos_caches()
 
             # If Terraform action is neither 'apply' nor 'destroy', finish the execution
-            if "terraform apply" not in self.terraform_command and "terraform destroy" not in self.terraform_command:
+            if tf_action not in terraform_actions_apply_destroy:
                 self.exit_manager("TF_EXEC_NOT_APPLY_DESTROY")
 
             # If Terraform action is either 'apply' or 'destroy', a Terraform plan has been executed
@@ -1588,7 +1702,6 @@ class Scope_Manager:
             # Errors in the Terraform execution evaluation:
             if result_tfplan_execution == 0: # No errors during the Terraform execution
                 print("\n")
-                tfplan_execution_resources = find_first_match_in_file(self.wip_execution_0_tfplan_log,"complete!")
 
                 if tfplan_execution_resources:
                     logger.info(
@@ -1605,7 +1718,7 @@ class Scope_Manager:
                 logger.error(f"❌ Errors detected during the execution of the Terraform Plan.\n🔹 Details available in: {self.wip_execution_0_tfplan_error}\n🔍 Please review the file for further investigation.\n")
                 if self.post_rollback:
                     self.exit_manager("BLOCKED_EXECUTIONS")
-                elif "terraform destroy" in self.terraform_command:
+                elif tf_action == 'destroy':
                     self.exit_manager("TF_EXEC_W_ERRORS_DESTROY")
                 else:
                     # In interactive mode, prompt the user to press Enter to proceed with the Rollback
@@ -1641,23 +1754,31 @@ class Scope_Manager:
             # Retrieve blueprint data
             self.raw_blueprint_data = get_blueprint_data(blueprints, silent_mode = True)
 
+            # Bind the list appenders once to avoid attribute lookups on every iteration
+            append_uncommitted = self.uncommitted_bps.append
+            append_uncommitted_w_errors = self.uncommitted_bps_w_errors.append
+
             # Iterate through the blueprints to gather the facts
             for bp_name in blueprints:
                 bp_data = next((bp for bp in self.raw_blueprint_data if bp.get('label', None) == bp_name), None)
                 
                 if bp_data:
 
+                    # Read the relevant blueprint fields once per iteration
+                    has_uncommitted_changes = bp_data.get('has_uncommitted_changes')
+                    staged_version = bp_data.get('version')
+                    build_errors = bp_data.get('build_errors_count', 0)
+
                     # Check if blueprint has uncommitted changes
-                    if bp_data.get('has_uncommitted_changes'):
-                        self.uncommitted_bps.append({
+                    if has_uncommitted_changes:
+                        append_uncommitted({
                             'blueprint': bp_name,
-                            'staged_version': bp_data.get('version')
+                            'staged_version': staged_version
                         })
 
                     # Check if there are build errors            
-                    build_errors = bp_data.get('build_errors_count', 0)
                     if isinstance(build_errors, int) and build_errors > 0:
-                        self.uncommitted_bps_w_errors.append({
+                        append_uncommitted_w_errors({
                             'blueprint': bp_name,
                             'build_errors_count': build_errors
                         })
@@ -1667,16 +1788,19 @@ class Scope_Manager:
 
                         # Check if the blueprint has build warnings
                         build_warning_count = bp_data.get('build_warnings_count', 0)
+                        deploy_modes_summary = bp_data.get("deploy_modes_summary", {})
+                        deployment_status_summary = bp_data.get("deployment_status", {})
+
                         if build_warning_count > 0:
                             messages.append(f"Build Warning count: {build_warning_count}")
 
                         # Check deploy mode summary other than 'deploy'
-                        for deploy_mode, number_of_devices in bp_data.get("deploy_modes_summary", {}).items():
+                        for deploy_mode, number_of_devices in deploy_modes_summary.items():
                             if deploy_mode != 'deploy' and number_of_devices > 0:
                                 messages.append(f"Deployed devices in {deploy_mode.capitalize()} mode: {number_of_devices}")
 
                         # Check deployment status other than 'succeeded'
-                        for deployment_status, state in bp_data.get("deployment_status", {}).items():
+                        for deployment_status, state in deployment_status_summary.items():
                             for result, number_of_devices in state.items():
                                 if result != 'num_succeeded' and number_of_devices > 0:
                                     messages.append(f"Deployed devices in {deployment_status[:-7].capitalize()} state with {result[4:].capitalize()} configurations: {number_of_devices}")
@@ -1688,37 +1812,117 @@ class Scope_Manager:
                             for message in messages:
                                 logger.warning(f"   ➤ {message}")
 
-                    # If warnings were found, prompt exit after checking all blueprints
-                    if warnings_exist:
-                        print("\n")
-                        self.prompt_exit()
+            # If warnings were found, prompt exit after checking all blueprints
+            if warnings_exist:
+                print("\n")
+                self.prompt_exit()
 
         except Exception as e:
             logger.error(f"❌ An error occurred while scanning blueprints: {e}")
 
     def get_bp_revision_list(self, bp_name):
         '''
-        Get a list of revisions eligible to rollback to (time voyager) for a particular blueprint
+        Get a list of revisions eligible to rollback to (time voyager) for a particular blueprint.
 
         Args:
             bp_name (str): Blueprint name.
 
         Returns:
-            str: Blueprint ID.
+            list: Revisions of the blueprint.
         '''
         try:
             aos_ip = self.get('aos_ip')
-            aos_token = self.get('aos_token')
+            session = self.get_aos_session()
             bp_id = get_bp_id(bp_name)
             url = f'https://{aos_ip}/api/blueprints/{bp_id}/revisions'
-            headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-            response = requests.get(url, headers=headers, verify=False)
+            response = session.get(url, headers=self.get_aos_headers())
             response.raise_for_status()
             data = response.json()
             return data['items']
         except Exception as e:
             logger.error(f'❌ Error: Failed to retrieve blueprint revision IDs - {e}')
 
+    def get_bp_revision_lists(self, bp_names):
+        '''
+        Get the lists of revisions eligible to rollback to (time voyager) of several blueprints, fetched concurrently.
+
+        Args:
+            bp_names (list): Blueprint names.
+
+        Returns:
+            dict: Revisions of each blueprint ({blueprint name: list of revisions}).
+        '''
+        with ThreadPoolExecutor(max_workers=aos_api_max_workers) as executor:
+            return dict(zip(bp_names, executor.map(self.get_bp_revision_list, bp_names)))
+
+    def get_bp_revision_list_cached(self, bp_name, ttl=None):
+        '''
+        Get the list of revisions of a blueprint, reusing the last fetched list if it is younger than the TTL.
+        The cache entry of a blueprint is invalidated after any call that changes its revisions.
+
+        Args:
+            bp_name (str): Blueprint name.
+            ttl (int, optional): Maximum age (in seconds) of a cached list. Defaults to 'revision_list_cache_ttl'.
+
+        Returns:
+            list: Revisions of the blueprint.
+        '''
+        return self.get_bp_revision_cache_entry(bp_name, ttl)[1]
+
+    def get_bp_revision_index(self, bp_name, ttl=None):
+        '''
+        Get the revisions of a blueprint indexed by description and by revision ID, for constant-time lookups.
+        The index is built once per fetched revision list and shares its cache entry.
+
+        Args:
+            bp_name (str): Blueprint name.
+            ttl (int, optional): Maximum age (in seconds) of a cached list. Defaults to 'revision_list_cache_ttl'.
+
+        Returns:
+            dict: {'by_description': {description: revision}, 'by_id': {revision_id: revision}}.
+        '''
+        return self.get_bp_revision_cache_entry(bp_name, ttl)[2]
+
+    def get_bp_revision_cache_entry(self, bp_name, ttl=None):
+        '''
+        Get the cache entry (timestamp, revisions, index) of a blueprint, fetching its revisions again if the entry expired.
+
+        Args:
+            bp_name (str): Blueprint name.
+            ttl (int, optional): Maximum age (in seconds) of a cached entry. Defaults to 'revision_list_cache_ttl'.
+
+        Returns:
+            tuple: Fetch timestamp, list of revisions (None if they could not be retrieved) and index of the revisions.
+        '''
+        ttl = revision_list_cache_ttl if ttl is None else ttl
+        cached = self.revision_list_cache.get(bp_name)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached
+
+        revisions = self.get_bp_revision_list(bp_name)
+        index = {'by_description': {}, 'by_id': {}}
+        for rev in revisions or []:
+            # Parse the creation timestamp once, so sorting and formatting do not need to parse it again
+            rev['_created_ts'] = parse_revision_timestamp(rev.get('created_at'))
+            # Keep the first match, as a linear search would
+            index['by_description'].setdefault(rev.get('description'), rev)
+            index['by_id'].setdefault(rev.get('revision_id'), rev)
+
+        entry = (time.monotonic(), revisions, index)
+        # Failed requests are not cached
+        if revisions is not None:
+            self.revision_list_cache[bp_name] = entry
+        return entry
+
+    def invalidate_bp_revision_list(self, bp_name):
+        '''
+        Drop the cached list of revisions of a blueprint, so the next lookup fetches it again from the AOS API.
+
+        Args:
+            bp_name (str): Blueprint name.
+        '''
+        self.revision_list_cache.pop(bp_name, None)
+
     def prompt_revert(self):
         '''
         Prompts the user to revert changes. If confirmed, it triggers the execution rollback;
@@ -1836,47 +2040,51 @@ class Scope_Manager:
             bool: A flag indicating whether changes are detected (True) or not (False).
         '''
         try:
-            if "terraform apply" in self.terraform_command or "terraform destroy" in self.terraform_command:
+            # Parse the Terraform action ('apply', 'destroy', ...) once
+            tf_action = get_terraform_action(self.terraform_command)
+
+            if tf_action in terraform_actions_apply_destroy:
 
                 # Log the Terraform plan execution
                 logger.info(f"🧩 Generating the Terraform Plan...\n")
 
                 # Execute the Terraform plan with either 'apply' or 'destroy' options
-                plan_cmd = ["terraform", "plan", "-out=" + self.wip_execution_0_tfplan_file_bin]
-                if "terraform destroy" in self.terraform_command:
+                # With '-detailed-exitcode', the exit code is 0 if there are no changes, 1 if there are errors and 2 if there are changes
+                plan_cmd = ["terraform", "plan", "-detailed-exitcode", "-out=" + self.wip_execution_0_tfplan_file_bin]
+                if tf_action == 'destroy':
                     plan_cmd.insert(2, "-destroy")
 
                 result_tfplan = run_command_and_save_stdout_stderr(plan_cmd, self.wip_execution_0_tfplan_generation_log, self.wip_execution_0_tfplan_generation_error)
 
-                # Generate text and JSON outputs from the plan binary file
-                subprocess.check_call(f"terraform show -no-color {self.wip_execution_0_tfplan_file_bin} > {self.wip_execution_0_tfplan_file_txt}", shell=True)
-                json_result = subprocess.run(f"terraform show -json {self.wip_execution_0_tfplan_file_bin} > {self.wip_execution_0_tfplan_file_json}", shell=True)
+                if result_tfplan in (0, 2):
+                    print("\n")
+                    logger.info("✅ Terraform Plan generated successfully")
+
+                else:
+                    self.exit_manager("TF_PLAN_W_ERRORS")
 
-                if json_result.returncode == 0:
-                    with open(self.wip_execution_0_tfplan_file_json, "r") as json_file:
-                        plan_data = json.load(json_file)
+                # Generate text and JSON outputs from the plan binary file (also without changes, so every execution keeps its plan artifacts)
+                # Both 'terraform show' commands are independent, so they run in parallel and write straight to their files (no shell involved)
+                txt_cmd = ["terraform", "show", "-no-color", self.wip_execution_0_tfplan_file_bin]
+                json_cmd = ["terraform", "show", "-json", self.wip_execution_0_tfplan_file_bin]
+                with open(self.wip_execution_0_tfplan_file_txt, "wb") as txt_file, open(self.wip_execution_0_tfplan_file_json, "wb") as json_file:
+                    txt_process = subprocess.Popen(txt_cmd, stdout=txt_file)
+                    json_process = subprocess.Popen(json_cmd, stdout=json_file)
+                    txt_returncode = txt_process.wait()
+                    json_returncode = json_process.wait()
 
-                    # Check for resource changes
-                    resource_changes = plan_data.get("resource_changes", [])
-                    changes_exist = any(
-                        action in resource.get("change", {}).get("actions", [])
-                        for resource in resource_changes for action in ["create", "update", "delete"]
-                    )
+                if txt_returncode != 0:
+                    raise subprocess.CalledProcessError(txt_returncode, txt_cmd)
 
-                    # Return the binary plan file path and the changes flag
-                    result = changes_exist
+                if json_returncode == 0:
+                    # Check for resource changes (exit code 2 is also returned when only the outputs change) and return the changes flag
+                    # Exit code 0 means no changes at all, so the plan does not need to be scanned
+                    result = result_tfplan == 2 and tfplan_has_changes(self.wip_execution_0_tfplan_file_json)
 
                 else:
                     logger.error(f"❌ Failed to generate JSON from {self.wip_execution_0_tfplan_file_bin}.")
                     result = False
 
-                if result_tfplan == 0:
-                    print("\n")
-                    logger.info("✅ Terraform Plan generated successfully")
-
-                else:
-                    self.exit_manager("TF_PLAN_W_ERRORS")
-
                 return result
 
             else:
@@ -1945,9 +2153,11 @@ class Scope_Manager:
             # -- Check for uncommitted blueprints
             self.scan_blueprints()
             if self.uncommitted_bps:
+                # -- Fetch the revisions of all the uncommitted blueprints at once
+                bp_revisions = self.get_bp_revision_lists([bp.get('blueprint', None) for bp in self.uncommitted_bps])
                 for bp in self.uncommitted_bps:
                     bp_name = bp.get('blueprint', None)
-                    list_bp_revisions = self.get_bp_revision_list(bp_name)
+                    list_bp_revisions = bp_revisions.get(bp_name) or []
                     if len(list_bp_revisions) > 0:
                         logger.info(f"🔄 Previous revisions available in the Time Voyager of blueprint '{bp_name}'.\n")
                         # -- Previous revisions exist for this bp - remove uncommitted changes in the bp via API
@@ -1967,6 +2177,9 @@ class Scope_Manager:
         if list_non_bp_menus_w_changes and non_bp_diff:
             remove_non_bp_added(non_bp_diff)
 
+        # -- The input folder has been rolled back, so the memoized non-blueprint changes are no longer relevant
+        non_bp_changes_cache.clear()
+
     def generate_customer_history_report(self, option):
         '''
         Generates an execution history report based on the specified scope.
@@ -2033,12 +2246,8 @@ class Scope_Manager:
             print("\n")
             logger.info(f"💾 Saving blueprint data for stage '{self.execution_stage}':")
 
-            # Define the file path
-            self.raw_blueprint_data_path = os.path.join(self.snapshot_stage_path, f"raw_blueprint_data.yaml")
-
-            # Save blueprint data as a YAML file
-            with open(self.raw_blueprint_data_path, "w") as file:
-                yaml.dump(self.raw_blueprint_data, file, default_flow_style=False)
+            # Save blueprint data as a raw snapshot file (YAML or JSON, depending on 'raw_snapshot_format')
+            self.raw_blueprint_data_path = save_raw_snapshot(self.raw_blueprint_data, os.path.join(self.snapshot_stage_path, "raw_blueprint_data"))
 
             logger.info(f"💾📑 Raw blueprint data successfully saved at: {self.raw_blueprint_data_path}\n")
 
@@ -2067,12 +2276,8 @@ class Scope_Manager:
             print("\n")
             logger.info(f"💾 Saving device data for stage '{self.execution_stage}':")
 
-            # Define the file path
-            self.raw_device_data_path = os.path.join(self.snapshot_stage_path, f"raw_device_data.yaml")
-
-            # Save device data as a YAML file
-            with open(self.raw_device_data_path, "w") as file:
-                yaml.dump(self.raw_device_data, file, default_flow_style=False)
+            # Save device data as a raw snapshot file (YAML or JSON, depending on 'raw_snapshot_format')
+            self.raw_device_data_path = save_raw_snapshot(self.raw_device_data, os.path.join(self.snapshot_stage_path, "raw_device_data"))
             logger.info(f"💾📑 Raw device data successfully saved at: {self.raw_device_data_path}")
 
             self.save_device_config()
@@ -2088,32 +2293,55 @@ class Scope_Manager:
 
         try:
 
+            # Nothing to save (and no directories to create) if there is no data
+            if not getattr(self, "raw_device_data", None):
+                logger.info(f"ℹ️  No data available to save device config for stage '{self.execution_stage}'.")
+                return
+
             # Define stage directory and create it if it doesn't exist
             self.device_config_dir = os.path.join(self.snapshot_stage_path, 'device_config')
             os.makedirs(self.device_config_dir, exist_ok=True)
 
-            for device in self.raw_device_data:
-                blueprint_name = device.get("blueprint_name")
-                hostname = device.get("hostname")
-                config_data = device.get("config", {}).get("actual", {}).get("config")
+            # Create each blueprint directory once, rather than once per device
+            create_blueprint_dirs(self.device_config_dir, self.raw_device_data)
 
-                if not (blueprint_name and hostname and config_data):
-                    continue  # Skip if required data is missing
+            # Devices are independent from each other, so their files are written concurrently
+            with ThreadPoolExecutor(max_workers=device_io_max_workers) as executor:
+                saved_files = [path for path in executor.map(self.save_device_config_file, self.raw_device_data) if path]
 
-                self.device_config_blueprint_dir = os.path.join(self.device_config_dir, blueprint_name)
-                os.makedirs(self.device_config_blueprint_dir, exist_ok=True)  # Ensure blueprint directory exists
-                device_config_path = os.path.join(self.device_config_blueprint_dir, f"{hostname}.conf")
+            # Log a single summary line (the individual files are logged at debug level)
+            logger.info(f"💾🛠️  Config of {len(saved_files)} device(s) successfully saved at: {self.device_config_dir}")
 
-                try:
-                    with open(device_config_path, "w", encoding="utf-8") as file:
-                        file.write(config_data.replace("\\n", "\n"))  # Ensure proper newline formatting
-                    logger.info(f"💾🛠️  Config for '{hostname}' (blueprint '{blueprint_name}') successfully saved at: {device_config_path}")
-                except Exception as e:
-                    logger.warning(f"❌ Failed to save config for '{hostname}' (blueprint '{blueprint_name}'): {e}")
+        except Exception as e:
+            logger.error(f"❌ An error occurred while saving device config for stage '{self.execution_stage}': {e}")
+
+    def save_device_config_file(self, device):
+        '''
+        Save the configuration of a single device.
+
+        Args:
+            device (dict): Device data as retrieved by `get_device_data`.
+
+        Returns:
+            str: Path of the saved file, or None if nothing was saved.
+        '''
+        blueprint_name = device.get("blueprint_name")
+        hostname = device.get("hostname")
+        config_data = device.get("config", {}).get("actual", {}).get("config")
 
+        if not (blueprint_name and hostname and config_data):
+            return  # Skip if required data is missing
 
+        device_config_blueprint_dir = os.path.join(self.device_config_dir, blueprint_name)
+        device_config_path = os.path.join(device_config_blueprint_dir, f"{hostname}.conf")
+
+        try:
+            with open(device_config_path, "wb") as file:
+                file.write(config_data.encode("utf-8").replace(b"\\n", b"\n"))  # Ensure proper newline formatting
+            logger.debug(f"💾🛠️  Config for '{hostname}' (blueprint '{blueprint_name}') successfully saved at: {device_config_path}")
+            return device_config_path
         except Exception as e:
-            logger.error(f"❌ An error occurred while saving device config for stage '{stage}': {e}")
+            logger.warning(f"❌ Failed to save config for '{hostname}' (blueprint '{blueprint_name}'): {e}")
 
     def save_device_context(self):
         '''
@@ -2122,31 +2350,55 @@ class Scope_Manager:
 
         try:
 
+            # Nothing to save (and no directories to create) if there is no data
+            if not getattr(self, "raw_device_data", None):
+                logger.info(f"ℹ️  No data available to save device context for stage '{self.execution_stage}'.")
+                return
+
             # Define stage directory and create it if it doesn't exist
             self.device_context_dir = os.path.join(self.snapshot_stage_path, 'device_context')
             os.makedirs(self.device_context_dir, exist_ok=True)
 
-            for device in self.raw_device_data:
-                blueprint_name = device.get("blueprint_name")
-                hostname = device.get("hostname")
-                context_data = device.get("config_context", {}).get("context")
+            # Create each blueprint directory once, rather than once per device
+            create_blueprint_dirs(self.device_context_dir, self.raw_device_data)
 
-                if not (blueprint_name and hostname and context_data):
-                    continue  # Skip if required data is missing
+            # Devices are independent from each other, so their files are written concurrently
+            with ThreadPoolExecutor(max_workers=device_io_max_workers) as executor:
+                saved_files = [path for path in executor.map(self.save_device_context_file, self.raw_device_data) if path]
 
-                self.device_context_blueprint_dir = os.path.join(self.device_context_dir, blueprint_name)
-                os.makedirs(self.device_context_blueprint_dir, exist_ok=True)  # Ensure blueprint directory exists
-                device_context_path = os.path.join(self.device_context_blueprint_dir, f"{hostname}.yaml")
+            # Log a single summary line (the individual files are logged at debug level)
+            logger.info(f"💾🔧 Context of {len(saved_files)} device(s) successfully saved at: {self.device_context_dir}")
 
-                try:
-                    with open(device_context_path, "w", encoding="utf-8") as file:
-                        yaml.dump(json.loads(context_data), file, default_flow_style=False, sort_keys=False)
-                        logger.info(f"💾🔧 Context for '{hostname}' (blueprint '{blueprint_name}') successfully saved at: {device_context_path}")
-                except Exception as e:
-                    logger.warning(f"❌ Failed to save context for '{hostname}' (blueprint '{blueprint_name}'): {e}")
+        except Exception as e:
+            logger.error(f"❌ An error occurred while saving device context for stage '{self.execution_stage}': {e}")
+
+    def save_device_context_file(self, device):
+        '''
+        Save the device context of a single device.
+
+        Args:
+            device (dict): Device data as retrieved by `get_device_data`.
+
+        Returns:
+            str: Path of the saved file, or None if nothing was saved.
+        '''
+        blueprint_name = device.get("blueprint_name")
+        hostname = device.get("hostname")
+        context_data = device.get("config_context", {}).get("context")
+
+        if not (blueprint_name and hostname and context_data):
+            return  # Skip if required data is missing
 
+        device_context_blueprint_dir = os.path.join(self.device_context_dir, blueprint_name)
+        device_context_path = os.path.join(device_context_blueprint_dir, f"{hostname}.yaml")
+
+        try:
+            with open(device_context_path, "w", encoding="utf-8") as file:
+                yaml.dump(json.loads(context_data), file, Dumper=YamlSafeDumper, default_flow_style=False, sort_keys=False)
+            logger.debug(f"💾🔧 Context for '{hostname}' (blueprint '{blueprint_name}') successfully saved at: {device_context_path}")
+            return device_context_path
         except Exception as e:
-            logger.error(f"❌ An error occurred while saving device context for stage '{stage}': {e}")
+            logger.warning(f"❌ Failed to save context for '{hostname}' (blueprint '{blueprint_name}'): {e}")
 
     def save_commit_check(self):
         '''
@@ -2158,39 +2410,28 @@ class Scope_Manager:
             self.commit_check_stage_dir = os.path.join(self.wip_execution_0_snapshot_path, self.commit_check_stage)
             os.makedirs(self.commit_check_stage_dir, exist_ok=True)
 
+            blueprints = self.get('blueprints',[])
+
+            # Finish the execution if there are no blueprints
+            if not blueprints:
+                self.raw_commit_check = []
+                return
+
             # Retrieve device data if not done before
-            if not hasattr(self, "raw_device_data") or not self.raw_device_data:
-                devices = get_bp_devices(self.get('blueprints',[]))
+            if not getattr(self, "raw_device_data", None):
+                devices = get_bp_devices(blueprints)
             else:
                 devices = self.raw_device_data
 
-            self.raw_commit_check = []
-
-            for device in devices:
-
-                blueprint_name = device.get("blueprint_name")
-                blueprint_id = device.get("blueprint_id")
-                hostname = device.get("hostname")
-                device_id = device.get("device_id")
-
-                # Retrieve commit check data
-                print("\n")
-                logger.info(f"🔍 Retrieving commit check data for '{hostname}' (blueprint '{blueprint_name}') at stage '{self.commit_check_stage}'...")
-                if run_commit_check(blueprint_name, device_id, hostname):
-                    self.raw_commit_check.append({
-                        'blueprint_name': blueprint_name, # Blueprint identifier
-                        'blueprint_id': blueprint_id, # Blueprint identifier
-                        'hostname': hostname,  # Device hostname
-                        'device_id': device_id,  # Unique device identifier
-                        'commit_check': get_commit_check_result(blueprint_name, device_id, hostname),  # Full commit check device details
-                    })
-
-            # Define the file path
-            self.raw_commit_check_path = os.path.join(self.commit_check_stage_dir, f"raw_commit_check_data.yaml")
+            # Run the commit checks of all the devices concurrently (the order of the devices is preserved)
+            with ThreadPoolExecutor(max_workers=aos_api_max_workers) as executor:
+                self.raw_commit_check = [
+                    commit_check for commit_check in executor.map(self.get_device_commit_check, devices)
+                    if commit_check
+                ]
 
-            # Save commit check data as a YAML file
-            with open(self.raw_commit_check_path, "w") as file:
-                yaml.dump(self.raw_commit_check, file, default_flow_style=False)
+            # Save commit check data as a raw snapshot file (YAML or JSON, depending on 'raw_snapshot_format')
+            self.raw_commit_check_path = save_raw_snapshot(self.raw_commit_check, os.path.join(self.commit_check_stage_dir, "raw_commit_check_data"))
 
             print("\n")
             logger.info(f"💾📑 Raw commit check data successfully saved at: {self.raw_commit_check_path}")
@@ -2201,6 +2442,33 @@ class Scope_Manager:
         except Exception as e:
             logger.error(f"❌ An error occurred while saving commit check data for stage '{self.commit_check_stage}': {e}")
 
+    def get_device_commit_check(self, device):
+        '''
+        Run a commit check on a single device and retrieve its result.
+
+        Args:
+            device (dict): Device data including blueprint name/ID, hostname and device ID.
+
+        Returns:
+            dict: The commit check data of the device, or None if the commit check could not be executed.
+        '''
+        blueprint_name = device.get("blueprint_name")
+        blueprint_id = device.get("blueprint_id")
+        hostname = device.get("hostname")
+        device_id = device.get("device_id")
+
+        # Retrieve commit check data
+        logger.info(f"🔍 Retrieving commit check data for '{hostname}' (blueprint '{blueprint_name}') at stage '{self.commit_check_stage}'...")
+        if run_commit_check(blueprint_name, device_id, hostname):
+            return {
+                'blueprint_name': blueprint_name, # Blueprint identifier
+                'blueprint_id': blueprint_id, # Blueprint identifier
+                'hostname': hostname,  # Device hostname
+                'device_id': device_id,  # Unique device identifier
+                'commit_check': get_commit_check_result(blueprint_name, device_id, hostname),  # Full commit check device details
+            }
+        return None
+
     def save_config_diff(self):
         '''
         Fetch and save the config diff of some devices.
@@ -2208,33 +2476,57 @@ class Scope_Manager:
 
         try:
 
+            # Nothing to save (and no directories to create) if there is no data
+            if not getattr(self, "raw_commit_check", None):
+                logger.info(f"ℹ️  No data available to save device config diff for stage '{self.commit_check_stage}'.")
+                return
+
             # Define stage directory and create it if it doesn't exist
             self.device_config_diff_dir = os.path.join(self.commit_check_stage_dir, 'device_config_diff')
             os.makedirs(self.device_config_diff_dir, exist_ok=True)
 
-            for device in self.raw_commit_check:
-                blueprint_name = device.get("blueprint_name")
-                hostname = device.get("hostname")
-                config_diff = device.get("commit_check", {}).get("diff_string")
-                error = device.get("commit_check", {}).get("error")
+            # Create each blueprint directory once, rather than once per device
+            create_blueprint_dirs(self.device_config_diff_dir, self.raw_commit_check)
 
-                if not (blueprint_name and hostname and (config_diff or error)):
-                    continue  # Skip if required data is missing
+            # Devices are independent from each other, so their files are written concurrently
+            with ThreadPoolExecutor(max_workers=device_io_max_workers) as executor:
+                saved_files = [path for path in executor.map(self.save_config_diff_file, self.raw_commit_check) if path]
 
-                self.device_config_blueprint_dir = os.path.join(self.device_config_diff_dir, blueprint_name)
-                os.makedirs(self.device_config_blueprint_dir, exist_ok=True)  # Ensure blueprint directory exists
-                device_config_diff_path = os.path.join(self.device_config_blueprint_dir, f"{hostname}.diff")
+            # Log a single summary line (the individual files are logged at debug level)
+            logger.info(f"💾🆚 Config diff of {len(saved_files)} device(s) successfully saved at: {self.device_config_diff_dir}")
 
-                try:
-                    with open(device_config_diff_path, "w", encoding="utf-8") as file:
-                        file.write(config_diff.replace("\\n", "\n"))  # Ensure proper newline formatting
-                    logger.info(f"💾🆚 Config diff for '{hostname}' (blueprint '{blueprint_name}') successfully saved at: {device_config_diff_path}")
+        except Exception as e:
+            logger.error(f"❌ An error occurred while saving device config diff for stage '{self.commit_check_stage}': {e}")
+
+    def save_config_diff_file(self, device):
+        '''
+        Save the config diff of a single device.
+
+        Args:
+            device (dict): Commit check data of the device as collected by `save_commit_check`.
+
+        Returns:
+            str: Path of the saved file, or None if nothing was saved.
+        '''
+        blueprint_name = device.get("blueprint_name")
+        hostname = device.get("hostname")
+        config_diff = device.get("commit_check", {}).get("diff_string")
+        error = device.get("commit_check", {}).get("error")
 
-                except Exception as e:
-                    logger.warning(f"❌ Failed to save config diff for '{hostname}' (blueprint '{blueprint_name}'): {e}")
+        if not (blueprint_name and hostname and (config_diff or error)):
+            return  # Skip if required data is missing
+
+        device_config_blueprint_dir = os.path.join(self.device_config_diff_dir, blueprint_name)
+        device_config_diff_path = os.path.join(device_config_blueprint_dir, f"{hostname}.diff")
+
+        try:
+            with open(device_config_diff_path, "wb") as file:
+                file.write(config_diff.encode("utf-8").replace(b"\\n", b"\n"))  # Ensure proper newline formatting
+            logger.debug(f"💾🆚 Config diff for '{hostname}' (blueprint '{blueprint_name}') successfully saved at: {device_config_diff_path}")
+            return device_config_diff_path
 
         except Exception as e:
-            logger.error(f"❌ An error occurred while saving device config diff for stage '{stage}': {e}")
+            logger.warning(f"❌ Failed to save config diff for '{hostname}' (blueprint '{blueprint_name}'): {e}")
 
     def save_rendered_config(self):
         '''
@@ -2243,33 +2535,56 @@ class Scope_Manager:
 
         try:
 
+            # Nothing to save (and no directories to create) if there is no data
+            if not getattr(self, "raw_commit_check", None):
+                logger.info(f"ℹ️  No data available to save device rendered config for stage '{self.commit_check_stage}'.")
+                return
+
             # Define stage directory and create it if it doesn't exist
             self.device_rendered_config_dir = os.path.join(self.commit_check_stage_dir, 'device_rendered_config')
             os.makedirs(self.device_rendered_config_dir, exist_ok=True)
 
-            for device in self.raw_commit_check:
-                blueprint_name = device.get("blueprint_name")
-                hostname = device.get("hostname")
-                rendered_config = device.get("commit_check", {}).get("config_string")
+            # Create each blueprint directory once, rather than once per device
+            create_blueprint_dirs(self.device_rendered_config_dir, self.raw_commit_check)
 
-                if not (blueprint_name and hostname and rendered_config):
-                    continue  # Skip if required data is missing
+            # Devices are independent from each other, so their files are written concurrently
+            with ThreadPoolExecutor(max_workers=device_io_max_workers) as executor:
+                saved_files = [path for path in executor.map(self.save_rendered_config_file, self.raw_commit_check) if path]
 
-                self.device_config_blueprint_dir = os.path.join(self.device_rendered_config_dir, blueprint_name)
-                os.makedirs(self.device_config_blueprint_dir, exist_ok=True)  # Ensure blueprint directory exists
-                device_rendered_config_path = os.path.join(self.device_config_blueprint_dir, f"{hostname}.conf")
+            # Log a single summary line (the individual files are logged at debug level)
+            logger.info(f"💾🛠️  Rendered config of {len(saved_files)} device(s) successfully saved at: {self.device_rendered_config_dir}")
 
-                try:
-                    with open(device_rendered_config_path, "w", encoding="utf-8") as file:
-                        file.write(rendered_config.replace("\\n", "\n"))  # Ensure proper newline formatting
-                    logger.info(f"💾🛠️  Rendered config for '{hostname}' (blueprint '{blueprint_name}') successfully saved at: {device_rendered_config_path}")
+        except Exception as e:
+            logger.error(f"❌ An error occurred while saving device rendered config for stage '{self.commit_check_stage}': {e}")
+
+    def save_rendered_config_file(self, device):
+        '''
+        Save the rendered config of a single device.
 
-                except Exception as e:
-                    logger.warning(f"❌ Failed to save rendered config for '{hostname}' (blueprint '{blueprint_name}'): {e}")
+        Args:
+            device (dict): Commit check data of the device as collected by `save_commit_check`.
+
+        Returns:
+            str: Path of the saved file, or None if nothing was saved.
+        '''
+        blueprint_name = device.get("blueprint_name")
+        hostname = device.get("hostname")
+        rendered_config = device.get("commit_check", {}).get("config_string")
 
+        if not (blueprint_name and hostname and rendered_config):
+            return  # Skip if required data is missing
+
+        device_config_blueprint_dir = os.path.join(self.device_rendered_config_dir, blueprint_name)
+        device_rendered_config_path = os.path.join(device_config_blueprint_dir, f"{hostname}.conf")
+
+        try:
+            with open(device_rendered_config_path, "wb") as file:
+                file.write(rendered_config.encode("utf-8").replace(b"\\n", b"\n"))  # Ensure proper newline formatting
+            logger.debug(f"💾🛠️  Rendered config for '{hostname}' (blueprint '{blueprint_name}') successfully saved at: {device_rendered_config_path}")
+            return device_rendered_config_path
 
         except Exception as e:
-            logger.error(f"❌ An error occurred while saving device rendered config for stage '{stage}': {e}")
+            logger.warning(f"❌ Failed to save rendered config for '{hostname}' (blueprint '{blueprint_name}'): {e}")
 
     def print_panel_commit_check(self):
         '''
@@ -2326,17 +2641,17 @@ class Scope_Manager:
                 table.title_style = "cyan underline"
                 table.show_lines=True
                 for device in list_devices_diff_error:
-
                     table.add_row(device.get('blueprint_name'), device.get('hostname'), Text(device.get('error')))
 
-                    panel = Panel.fit(
-                        Columns([
-                            table,
-                        ]),
-                        title=f"[bold]COMMIT CHECK OVERVIEW ",
-                        border_style="red",
-                        title_align="left",
-                        )
+                # Build the panel once all the rows have been added
+                panel = Panel.fit(
+                    Columns([
+                        table,
+                    ]),
+                    title=f"[bold]COMMIT CHECK OVERVIEW ",
+                    border_style="red",
+                    title_align="left",
+                    )
 
                 print("\n")
                 rprint(panel)
@@ -2400,14 +2715,15 @@ class Scope_Manager:
                         table.add_row(device.get('blueprint_name', ''), device.get('hostname', ''), Text(device.get('config_diff', '')))
                         # table.add_row(device.get('blueprint_name'), device.get('hostname'), device.get('config_diff'))
 
-                        panel = Panel.fit(
-                            Columns([
-                                table,
-                            ]),
-                            title=f"[bold]COMMIT CHECK OVERVIEW ",
-                            border_style="red",
-                            title_align="left",
-                        )
+                # Build the panel once all the rows have been added
+                panel = Panel.fit(
+                    Columns([
+                        table,
+                    ]),
+                    title=f"[bold]COMMIT CHECK OVERVIEW ",
+                    border_style="red",
+                    title_align="left",
+                )
 
                 print("\n")
                 rprint(panel)
@@ -2462,17 +2778,9 @@ class Scope_Manager:
             commit_comment (str): Commit comment of the searched revision.
 
         Returns:
-            str: Template ID, or None if not found or an error occurs.
+            dict: The revision, or an empty dict if not found or an error occurs.
         '''
-        try:
-            list_bp_revisions = self.get_bp_revision_list(bp_name)
-            for item in list_bp_revisions:
-                if item.get('description') == commit_comment:
-                    return item
-            return {}
-        except Exception as e:
-            logger.error(f"❌ Error: Failed to retrieve a revision with the description '{commit_comment} for the blueprint '{bp_name}' - {e}")
-            return {}
+        return self.get_bp_revision_index(bp_name)['by_description'].get(commit_comment, {})
 
     def get_permanent_revisions(self, bp_name):
         '''
@@ -2485,23 +2793,45 @@ class Scope_Manager:
         Returns:
             list: A list of revision dictionaries where 'user_saved' is True.
         '''
+        permanent_revisions, _ = self.get_permanent_and_oldest_revisions(bp_name)
+        return permanent_revisions
+
+    def get_permanent_and_oldest_revisions(self, bp_name):
+        '''
+        Retrieve, in a single pass over the revision list, all the permanent revisions (user_saved=True)
+        of a given blueprint and the oldest of them (based on creation timestamp).
+
+        Args:
+            bp_name (str): Blueprint name.
+
+        Returns:
+            tuple: A list of permanent revision dictionaries and the oldest permanent revision (empty dict if there is none).
+        '''
         try:
-            list_bp_revisions = self.get_bp_revision_list(bp_name)
+            list_bp_revisions = self.get_bp_revision_list_cached(bp_name)
 
             if not list_bp_revisions:
-                return []
-
-            # Filter revisions where 'user_saved' is explicitly True
-            permanent_revisions = [rev for rev in list_bp_revisions if rev.get('user_saved') is True]
+                return [], {}
+
+            # Filter revisions where 'user_saved' is explicitly True, keeping track of the oldest one
+            permanent_revisions = []
+            oldest_revision = {}
+            oldest_timestamp = None
+            for rev in list_bp_revisions:
+                if rev.get('user_saved') is True:
+                    permanent_revisions.append(rev)
+                    rev_timestamp = rev.get('_created_ts', float('inf'))
+                    if oldest_timestamp is None or rev_timestamp < oldest_timestamp:
+                        oldest_revision, oldest_timestamp = rev, rev_timestamp
 
             # if not permanent_revisions:
             #     logger.info(f"ℹ️ No permanent revisions found for blueprint '{bp_name}'")
 
-            return permanent_revisions
+            return permanent_revisions, oldest_revision
 
         except Exception as e:
             logger.error(f"❌ Failed to retrieve permanent revisions for blueprint '{bp_name}': {e}")
-            return []
+            return [], {}
 
     def remove_revision(self, bp_name, revision):
         '''
@@ -2516,18 +2846,12 @@ class Scope_Manager:
         '''
         try:
             aos_ip = self.get('aos_ip')
-            aos_token = self.get('aos_token')
             bp_id = get_bp_id(bp_name)
             revision_id = revision.get('revision_id')
-            revision_timestamp = revision.get('created_at', None)
-            if revision_timestamp:
-                dt = datetime.strptime(revision_timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
-                formatted_revision_timestamp = dt.strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                formatted_revision_timestamp = "N/A"
+            formatted_revision_timestamp = format_revision_timestamp(revision)
             url = f'https://{aos_ip}/api/blueprints/{bp_id}/revisions/{revision_id}'
-            headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-            response = requests.delete(url, headers=headers, verify=False)
+            response = self.get_aos_session().delete(url, headers=self.get_aos_headers())
+            self.invalidate_bp_revision_list(bp_name)
             response.raise_for_status()
             if response.status_code == 202:                
                 logger.info(
@@ -2555,14 +2879,14 @@ class Scope_Manager:
             dict: The oldest revision entry, or an empty dict if not found or an error occurs.
         '''
         try:
-            list_bp_revisions = self.get_bp_revision_list(bp_name)
+            list_bp_revisions = self.get_bp_revision_list_cached(bp_name)
 
             if not list_bp_revisions:
                 logger.warning(f"❌ No revisions found for blueprint '{bp_name}'")
                 return {}
 
             # Find the revision with the earliest 'created_at' timestamp
-            oldest = min(list_bp_revisions, key=lambda r: r.get('created_at', '9999-12-31T23:59:59Z'))
+            oldest = min(list_bp_revisions, key=lambda r: r.get('_created_ts', float('inf')))
             return oldest
 
         except Exception as e:
@@ -2582,11 +2906,10 @@ class Scope_Manager:
         '''
         try:
             aos_ip = self.get('aos_ip')
-            aos_token = self.get('aos_token')
             bp_id = get_bp_id(bp_name)
             url = f'https://{aos_ip}/api/blueprints/{bp_id}/revisions/{revision_id}/keep'
-            headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-            response = requests.post(url, headers=headers, verify=False)
+            response = self.get_aos_session().post(url, headers=self.get_aos_headers())
+            self.invalidate_bp_revision_list(bp_name)
 
             # The API call returns a 400 error code regardless of the actual outcome of the operation.
             # A workaround is used to validate the true result of the operation.
@@ -2623,13 +2946,12 @@ class Scope_Manager:
 
         try:
             aos_ip = self.get('aos_ip')
-            aos_token = self.get('aos_token')
             bp_id = get_bp_id(bp_name)
             url = f'https://{aos_ip}/api/blueprints/{bp_id}/deploy'
 
             # Retrieve the original execution_id that was stored in the execution_data file at the start of execution.
             # Do not use self.execution_id, as it updates every time the Scope_Manager class is instantiated.
-            execution_id = self.handle_execution_data_file("read", {}).get('execution_id', None)
+            execution_id = self.get_original_execution_id()
 
             if execution_id:
                 deploy_comment_w_execution_id = "(" + execution_id +") " + deploy_comment
@@ -2641,39 +2963,42 @@ class Scope_Manager:
                 'description': deploy_comment_w_execution_id
             })
 
-            headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
+            aos_session = self.get_aos_session()
 
             max_retries = 3
             retry_delay = 5  # seconds
             max_poll_attempts = 10  # Number of times to poll for process completion
-            poll_delay = 3  # seconds between poll attempts
+            poll_delay = 3  # seconds before the first poll attempt, doubled after every attempt
+            max_poll_delay = 15  # maximum seconds between poll attempts
 
             commit_completed = False
+            deploy_status = {}
 
             # Retry mechanism for initial request
             for attempt in range(1, max_retries + 1):
                 if commit_completed:
                     break
-                response = requests.put(url, headers=headers, data=data, verify=False)
+                response = aos_session.put(url, headers=self.get_aos_headers(), data=data)
 
                 if response.status_code == 202:
 
                     logger.info("⏳ Initial commit request accepted. Polling for completion...")
-                    # Poll until the process completes
+                    # Poll the deploy status (lightweight GET) until the process completes, with exponential backoff
                     for poll_attempt in range(1, max_poll_attempts + 1):
-                        poll_response = requests.put(url, headers=headers, data=data, verify=False)
-
-                        if poll_response.status_code == 202:
+                        deploy_status = get_deploy_status(bp_name, self)
+                        deploy_state = deploy_status.get('state', None)
+                        deploy_version = deploy_status.get('version', None)
+
+                        # The status still refers to a previous deployment, or the deployment is ongoing
+                        if deploy_state in (None, 'in_progress') or deploy_version not in (None, version):
+                            current_poll_delay = min(poll_delay * 2 ** (poll_attempt - 1), max_poll_delay)
+                            logger.info(f"⏳ Polling attempt {poll_attempt}/{max_poll_attempts}: Process ongoing, retrying in {current_poll_delay} seconds...")
+                            time.sleep(current_poll_delay)
+                        else:
                             logger.info(f"🟢 Polling attempt {poll_attempt}/{max_poll_attempts}: Commit process completed")
                             # logger.info(f"🎯 Changes for blueprint '{bp_name}' version '{version}' committed\n")
                             commit_completed = True
                             break
-                        elif poll_response.status_code == 409:
-                            logger.info(f"⏳ Polling attempt {poll_attempt}/{max_poll_attempts}: Process ongoing, retrying in {poll_delay} seconds...")
-                            time.sleep(poll_delay)
-                        else:
-                            # Process finished successfully or unexpected status
-                            poll_response.raise_for_status()
                     
                     # If polling exhausts without success
                     if not commit_completed:
@@ -2687,7 +3012,9 @@ class Scope_Manager:
                     response.raise_for_status()
 
             if commit_completed:
-                deploy_status = get_deploy_status(bp_name)
+                # The commit creates a new revision
+                self.invalidate_bp_revision_list(bp_name)
+
                 if deploy_status.get('state', None) != 'success':
                     logger.error(
                         f"❌ Failed to commit changes for blueprint '{bp_name}' (version {version}).\n"
@@ -2699,12 +3026,7 @@ class Scope_Manager:
                 
                 revision = self.get_revision(bp_name, deploy_comment_w_execution_id)
                 if revision:
-                    revision_timestamp = revision.get('created_at', None)
-                    if revision_timestamp:
-                        dt = datetime.strptime(revision_timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
-                        formatted_revision_timestamp = dt.strftime("%Y-%m-%d %H:%M:%S")
-                    else:
-                        formatted_revision_timestamp = "N/A"
+                    formatted_revision_timestamp = format_revision_timestamp(revision)
                     print("\n")
                     logger.info(
                         f"🕰️  Revision '{revision.get('revision_id', 'N/A')}' of blueprint '{bp_name}' saved to the Time Voyager.\n"
@@ -2712,15 +3034,16 @@ class Scope_Manager:
                         f"💬 Description: '{revision.get('description', 'N/A')}'\n"
                     )
                     
-                    permanent_revisions = self.get_permanent_revisions(bp_name)
+                    permanent_revisions, oldest_revision = self.get_permanent_and_oldest_revisions(bp_name)
                     if len(permanent_revisions) >= max_permanent_revisions:
                         logger.info(
                             f"🧮 Time Voyager quota check for blueprint '{bp_name}': {len(permanent_revisions)} out of {max_permanent_revisions} permanent slots used.\n"
                             f"🧹 Removing the oldest saved revision to make room for the most recent one."
                         )
-                        oldest_revision = self.get_oldest_revision(bp_name)
                         self.remove_revision(bp_name, oldest_revision)
 
+                    # Not run concurrently with the removal above: when the quota is full, Apstra rejects the
+                    # new permanent revision until a slot has been freed, so the two calls must stay ordered.
                     self.keep_revision(bp_name, version, deploy_comment_w_execution_id)
 
                 return
@@ -2820,18 +3143,21 @@ def find_first_match_in_file(filepath, regex):
 
     Args:
         filepath (str): The path to the file.
-        regex (str): The regex pattern to search for.
+        regex (str or re.Pattern): The regex pattern to search for (or an already compiled pattern).
 
     Returns:
         str: The complete line containing the first match, or None if no match is found.
     '''
     try:
+        # Compile the pattern once, instead of looking it up in the 're' cache for every line
+        compiled_regex = re.compile(regex)
+
         # Open the file for reading
         with open(filepath, 'r') as file:
             # Read through each line
             for line in file:
                 # Search for the regex in the line
-                match = re.search(regex, line)
+                match = compiled_regex.search(line)
                 if match:
                     return line  # Return the complete line containing the match
 
@@ -2845,39 +3171,6 @@ def find_first_match_in_file(filepath, regex):
         logger.error(f"❌ Unexpected error: {e}")
         return None
 
-def split_file_on_first_match(input_filepath, pattern, output_before_filepath, output_after_filepath):
-    '''
-    Splits an input file into two output files based on the first occurrence of a regex pattern.
-
-    Args:
-        input_filepath (str): Path to the input file.
-        pattern (str): The regex pattern to match.
-        output_before_filepath (str): File to store content before the first match.
-        output_after_filepath (str): File to store content from the first match onward.
-    '''
-    regex = re.compile(pattern)
-    match_found = False
-
-    try:
-        with open(input_filepath, 'r') as input_file, \
-             open(output_before_filepath, 'w') as before_file, \
-             open(output_after_filepath, 'w') as after_file:
-
-            for line in input_file:
-                if not match_found and regex.search(line):
-                    match_found = True  # First match found, switch to writing in 'after_file'
-                if match_found:
-                    after_file.write(line)
-                else:
-                    before_file.write(line)
-
-    except FileNotFoundError:
-        logger.error(f"❌ Error: File '{input_filepath}' not found.")
-    except PermissionError:
-        logger.error(f"❌ Error: Permission denied when accessing one of the files.")
-    except Exception as e:
-        logger.error(f"❌ Unexpected error: {e}")
-
 def clean_up_directory(folder_path):
     '''
     Cleans up the specified directory by removing it (along with its contents)
@@ -2890,7 +3183,7 @@ def clean_up_directory(folder_path):
     try:
 
         # Remove the folder and all its contents
-        remove_directory(folder_path)
+        shutil.rmtree(folder_path, ignore_errors=True)
 
         # Recreate the folder as empty
         os.makedirs(folder_path, exist_ok=True)
@@ -2907,27 +3200,15 @@ def replace_directory_contents(directory_a, directory_b):
         directory_b (str): The path to directory B (contents to be copied).
     '''
     try:
-        # Ensure directory A exists, create if not
-        if not os.path.exists(directory_a):
-            os.makedirs(directory_a)
-        else:
-            # Now clean up directory A (removes contents but leaves directory structure)
-            clean_up_directory(directory_a)
-
+        abs_directory_a = os.path.abspath(directory_a)
 
-        # Copy contents of directory B into directory A
-        for item in os.listdir(directory_b):
-            source = os.path.join(directory_b, item)
-            destination = os.path.join(directory_a, item)
-
-            # Prevent copying directory_a into itself if it's inside directory_b
-            if os.path.commonpath([os.path.abspath(source), os.path.abspath(directory_a)]) == os.path.abspath(directory_a):
-                continue
+        # Prevent copying directory_a into itself if it's inside directory_b
+        def ignore_directory_a(folder, items):
+            return [item for item in items if os.path.abspath(os.path.join(folder, item)) == abs_directory_a]
 
-            if os.path.isfile(source):
-                shutil.copy2(source, destination)
-            elif os.path.isdir(source):
-                shutil.copytree(source, destination)
+        # Remove directory A (if it exists) and copy the whole tree of directory B in a single call
+        shutil.rmtree(directory_a, ignore_errors=True)
+        shutil.copytree(directory_b, directory_a, dirs_exist_ok=True, copy_function=shutil.copy2, ignore=ignore_directory_a)
 
         print("\n")
         logger.info(f"✅ Directory '{directory_a}' has been replaced with contents from '{directory_b}'.")
@@ -2938,13 +3219,16 @@ def replace_directory_contents(directory_a, directory_b):
 def parse_input_args():
     '''
     Parses the input arguments from the command line and returns them as a dictionary.
-    Each argument should be in the form key=value.
+    Each argument should be in the form key=value (the value itself may contain '=').
     '''
-    try:
-        return dict(arg.split('=') for arg in sys.argv[1:])
-    except ValueError as e:
-        logger.error(f"❌ Error: Invalid input argument format. Ensure arguments are in the form key=value.")
-        sys.exit(1)
+    input_args = {}
+    for arg in sys.argv[1:]:
+        key, separator, value = arg.partition('=')
+        if not separator:
+            logger.error(f"❌ Error: Invalid input argument format '{arg}'. Ensure arguments are in the form key=value.")
+            sys.exit(1)
+        input_args[key] = value
+    return input_args
 
 def move_file(source_file_path, destination_file_path):
     '''
@@ -2957,20 +3241,20 @@ def move_file(source_file_path, destination_file_path):
         destination_file_path (str): Path where the file should be moved.
     '''
     try:
-        # Check if the source file exists
-        if not os.path.isfile(source_file_path):
-            # logger.warning(f"❌ Source file {source_file_path} does not exist. Skipping operation.")
-            return  # Exit the function early if the source file doesn't exist
-
-        # Check if the directory of the destination file exists
-        destination_dir = os.path.dirname(destination_file_path)
-        if not os.path.isdir(destination_dir):
-            # logger.warning(f"🔧 Destination directory {destination_dir} does not exist. Creating it.")
-            os.makedirs(destination_dir)
-
-        # Move the file (override if the destination exists)
-        shutil.move(source_file_path, destination_file_path)
-        logger.info(f"✅ File moved successfully to {destination_file_path}.")
+        # Move the file (override if the destination exists), checking the paths only if the move fails
+        try:
+            shutil.move(source_file_path, destination_file_path)
+        except FileNotFoundError:
+            # Check if the source file exists
+            if not os.path.isfile(source_file_path):
+                # logger.warning(f"❌ Source file {source_file_path} does not exist. Skipping operation.")
+                return  # Exit the function early if the source file doesn't exist
+
+            # The directory of the destination file does not exist
+            os.makedirs(os.path.dirname(destination_file_path), exist_ok=True)
+            shutil.move(source_file_path, destination_file_path)
+
+        logger.info(f"✅ File moved successfully to {destination_file_path}.")
 
     except PermissionError as perm_error:
         logger.error(f"❌ Permission error: {perm_error}")
@@ -2989,19 +3273,21 @@ def copy_file(source_file_path, destination_file_path):
         destination_file_path (str): Path where the file should be copied.
     '''
     try:
-        # Check if the source file exists
-        if not os.path.isfile(source_file_path):
-            logger.warning(f"❌ Source file {source_file_path} does not exist. Skipping operation.")
-            return  # Exit the function early if the source file doesn't exist
-
-        # Check if the directory of the destination file exists
-        destination_dir = os.path.dirname(destination_file_path)
-        if not os.path.isdir(destination_dir):
+        # Copy the file (override if the destination exists), checking the paths only if the copy fails
+        try:
+            shutil.copy2(source_file_path, destination_file_path)  # copy2 preserves metadata
+        except FileNotFoundError:
+            # Check if the source file exists
+            if not os.path.isfile(source_file_path):
+                logger.warning(f"❌ Source file {source_file_path} does not exist. Skipping operation.")
+                return  # Exit the function early if the source file doesn't exist
+
+            # The directory of the destination file does not exist
+            destination_dir = os.path.dirname(destination_file_path)
             logger.warning(f"🔧 Destination directory {destination_dir} does not exist. Creating it.")
-            os.makedirs(destination_dir)
+            os.makedirs(destination_dir, exist_ok=True)
+            shutil.copy2(source_file_path, destination_file_path)
 
-        # Copy the file (override if the destination exists)
-        shutil.copy2(source_file_path, destination_file_path)  # copy2 preserves metadata
         logger.info(f"✅ File copied successfully to {destination_file_path}.")
 
     except PermissionError as perm_error:
@@ -3010,11 +3296,53 @@ def copy_file(source_file_path, destination_file_path):
     except Exception as e:
         logger.error(f"❌ Error while copying file: {e}")
 
+def run_command_and_stream_stdout(command, handle_stdout_line, stderr_file):
+    '''
+    Runs a shell command and displays stdout and stderr in real-time. Each stdout line, with its ANSI escape sequences
+    removed, is handed to a callback as it is produced (e.g. to save it to a log file), while stderr is saved
+    (without ANSI escape sequences) to a log file that is removed if empty. Exceptions are raised to the caller.
+
+    Args:
+        command (list or str): The shell command to execute.
+        handle_stdout_line (function): Called with each stdout line.
+        stderr_file (str): Path to the file where stderr will be saved.
+
+    Returns:
+        int: The exit code of the command.
+    '''
+    def save_stderr(stream, err_file):
+        for line in stream:
+            sys.stderr.write(line)  # Print to console in real-time
+            err_file.write(ansi_escape_regex.sub('', line))  # Write to stderr file
+
+    with open(stderr_file, 'w') as err_file:
+
+        # Start the subprocess with real-time output capturing
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+        # Drain stderr in a separate thread so that neither pipe can fill up and block the command
+        stderr_thread = threading.Thread(target=save_stderr, args=(process.stderr, err_file), daemon=True)
+        stderr_thread.start()
+
+        # Read stdout line by line
+        for line in process.stdout:
+            sys.stdout.write(line)  # Print to console in real-time
+            handle_stdout_line(ansi_escape_regex.sub('', line))
+
+        # Wait for the process to complete
+        process.wait()
+        stderr_thread.join()
+
+    if os.path.exists(stderr_file) and os.path.getsize(stderr_file) == 0:
+        os.remove(stderr_file)  # Remove empty file
+
+    return process.returncode
+
 def run_command_and_save_stdout_stderr(command, stdout_file, stderr_file):
     '''
     Runs a shell command, displays stdout and stderr in real-time,
-    and saves them to separate log files. Removes empty log files
-    and cleans ANSI escape sequences if necessary.
+    and saves them to separate log files. ANSI escape sequences are
+    removed from each line as it is saved, and empty log files are removed.
 
     Args:
         command (list or str): The shell command to execute.
@@ -3025,44 +3353,59 @@ def run_command_and_save_stdout_stderr(command, stdout_file, stderr_file):
         int: The exit code of the command.
     '''
     try:
-        # Open the output files for writing
-        with open(stdout_file, 'w') as out_file, open(stderr_file, 'w') as err_file:
+        with open(stdout_file, 'w') as out_file:
+            returncode = run_command_and_stream_stdout(command, out_file.write, stderr_file)
 
-            # Start the subprocess with real-time output capturing
-            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        if os.path.exists(stdout_file) and os.path.getsize(stdout_file) == 0:
+            os.remove(stdout_file)  # Remove empty file
 
-            # Read stdout and stderr line by line
-            for line in process.stdout:
-                sys.stdout.write(line)  # Print to console in real-time
-                out_file.write(line)  # Write to stdout file
+        return returncode
 
-            for line in process.stderr:
-                sys.stderr.write(line)  # Print to console in real-time
-                err_file.write(line)  # Write to stderr file
+    except FileNotFoundError:
+        logger.error(f"❌ Error: Command '{command}' not found.")
+        return 1
+    except Exception as e:
+        logger.error(f"❌ Unexpected error: {e}")
+        return 1
 
-            # Wait for the process to complete
-            process.wait()
+def run_command_and_split_stdout_stderr(command, pattern, stdout_before_file, stdout_after_file, stderr_file, handle_stdout_line=None):
+    '''
+    Runs a shell command, displays stdout and stderr in real-time, and saves them to log files as they are produced.
+    The stdout is split on the fly on the first line matching a regex pattern, so no intermediate log file has to be
+    written, read back and removed. ANSI escape sequences are removed from the saved lines and an empty stderr file is removed.
 
-        for filename in [stdout_file, stderr_file]:
-            if os.path.exists(filename):
-                if os.path.getsize(filename) == 0:
-                    os.remove(filename)  # Remove empty file
-                else:
-                    remove_ansi_escape_sequences(filename) # Remove ANSI escape sequences from the file
+    Args:
+        command (list or str): The shell command to execute.
+        pattern (str): The regex pattern on which stdout is split.
+        stdout_before_file (str): Path to the file where stdout before the first match will be saved.
+        stdout_after_file (str): Path to the file where stdout from the first match onward will be saved.
+        stderr_file (str): Path to the file where stderr will be saved.
+        handle_stdout_line (function, optional): Also called with each stdout line (e.g. to capture a line during the same pass). Defaults to None.
+
+    Returns:
+        int: The exit code of the command.
+    '''
+    regex = re.compile(pattern)
+
+    try:
+        # Open the output files for writing
+        with open(stdout_before_file, 'w') as before_file, open(stdout_after_file, 'w') as after_file:
+            out_files = [before_file]
 
-        # # Check the exit code and return it
-        # if process.returncode != 0:
-        #     logger.error(f"❌ Command failed with exit code {process.returncode}", file=sys.stderr)
-        # else:
-        #     logger.info("✅ Command executed successfully")
+            def split_stdout_line(line):
+                if out_files[0] is before_file and regex.search(line):
+                    out_files[0] = after_file  # First match found, switch to writing in 'stdout_after_file'
+                out_files[0].write(line)
+                if handle_stdout_line:
+                    handle_stdout_line(line)
 
-        return process.returncode
+            return run_command_and_stream_stdout(command, split_stdout_line, stderr_file)
 
     except FileNotFoundError:
-        logger.error(f"❌ Error: Command '{command}' not found.", file=sys.stderr)
+        logger.error(f"❌ Error: Command '{command}' not found.")
         return 1
     except Exception as e:
-        logger.error(f"❌ Unexpected error: {e}", file=sys.stderr)
+        logger.error(f"❌ Unexpected error: {e}")
         return 1
 
 def remove_ansi_escape_sequences(text_or_file):
@@ -3079,8 +3422,8 @@ def remove_ansi_escape_sequences(text_or_file):
         str: A cleaned string if input was text. If a filename was given, the function updates the file.
     '''
 
-    # Regular expression pattern to match ANSI escape sequences
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+    # Regular expression pattern to match ANSI escape sequences (compiled once at module load)
+    ansi_escape = ansi_escape_regex
 
     if os.path.isfile(text_or_file):
         # Process the file
@@ -3112,24 +3455,26 @@ def copy_from_pattern(input_file, output_file, pattern):
         bool: True if the pattern was found and content copied, False otherwise.
     '''
     try:
-        with open(input_file, 'r', encoding='utf-8') as infile:
-            lines = infile.readlines()
-
+        # Matched line by line before, so '^' and '$' keep anchoring to line boundaries
+        regex = re.compile(pattern.encode('utf-8'), re.MULTILINE)
         match_found = False
-        content_to_write = []
-
-        for line in lines:
-            if not match_found and re.search(pattern, line):
-                match_found = True
-            if match_found:
-                content_to_write.append(line)
-
-        # Only create the output file and write content if there is something to write
-        if match_found:
-            with open(output_file, 'w', encoding='utf-8') as outfile:
-                outfile.writelines(content_to_write)
-            # print(f"✅ Successfully copied content from '{input_file}' to '{output_file}' starting from pattern '{pattern}'.")
-        else:
+
+        # Search the whole input at once in a memory map (empty files cannot be mapped and never match)
+        with open(input_file, 'rb') as infile:
+            if os.fstat(infile.fileno()).st_size > 0:
+                with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    match = regex.search(mm)
+                    match_found = match is not None
+
+                    # Only create the output file and write content if there is something to write
+                    if match_found:
+                        # Copy from the start of the line containing the first match
+                        start = mm.rfind(b'\n', 0, match.start()) + 1
+                        with open(output_file, 'wb') as outfile:
+                            outfile.write(mm[start:])
+                        # print(f"✅ Successfully copied content from '{input_file}' to '{output_file}' starting from pattern '{pattern}'.")
+
+        if not match_found:
             # If no match was found, don't create the output file
             if os.path.exists(output_file):
                 os.remove(output_file)
@@ -3142,6 +3487,82 @@ def copy_from_pattern(input_file, output_file, pattern):
         print(f"❌ An error occurred: {e}")
         return False
 
+def save_raw_snapshot(data, file_path):
+    '''
+    Save a raw snapshot (data retrieved as is from the Apstra API) in the format set by `raw_snapshot_format`:
+
+    - 'yaml' (default): human-readable YAML file.
+    - 'json': JSON file, much faster to write for large snapshots. A YAML view can be generated on demand with `json2yaml`.
+
+    Args:
+        data: The data to save.
+        file_path (str): Path of the snapshot file, without extension.
+
+    Returns:
+        str: Path of the saved snapshot file.
+    '''
+    if raw_snapshot_format == 'json':
+        snapshot_path = f"{file_path}.json"
+        with open(snapshot_path, "w") as file:
+            json.dump(data, file, indent=2)
+    else:
+        snapshot_path = f"{file_path}.yaml"
+        with open(snapshot_path, "w") as file:
+            yaml.dump(data, file, Dumper=YamlSafeDumper, default_flow_style=raw_snapshot_flow_style)
+    return snapshot_path
+
+def tfplan_has_changes(tfplan_json_file):
+    '''
+    Check whether a Terraform plan in JSON format contains any resource to be created, updated or deleted.
+
+    Args:
+        tfplan_json_file (str): Path to the Terraform plan JSON file.
+
+    Returns:
+        bool: True if the plan contains resource changes, False otherwise.
+    '''
+    with open(tfplan_json_file, "rb") as json_file:
+        plan_data = json.load(json_file)
+
+    resource_changes = plan_data.get("resource_changes", [])
+    return any(
+        not tfplan_change_actions.isdisjoint(resource.get("change", {}).get("actions", ()))
+        for resource in resource_changes
+    )
+
+def load_tfplan_summary_data(tfplan_json_file):
+    '''
+    Extract from a Terraform plan in JSON format only the data needed to summarize it: the Terraform version,
+    the timestamp, the Apstra provider version and, for each resource change, its type, name, index and actions.
+
+    Args:
+        tfplan_json_file (str): Path to the Terraform plan JSON file.
+
+    Returns:
+        tuple: A tuple containing:
+            - dict: The 'terraform_version', 'timestamp' and 'provider_version' of the plan.
+            - list: A dict per resource change with its 'type', 'name', 'index' and 'actions'.
+    '''
+    metadata = {"terraform_version": "unknown", "timestamp": "unknown", "provider_version": None}
+    resource_changes = []
+
+    with open(tfplan_json_file, "rb") as json_file:
+        plan_data = json.load(json_file)
+
+    metadata["terraform_version"] = plan_data.get("terraform_version", "unknown")
+    metadata["timestamp"] = plan_data.get("timestamp", "unknown")
+    metadata["provider_version"] = (
+        ((plan_data.get("configuration") or {}).get("provider_config") or {}).get("apstra") or {}
+    ).get("version_constraint", None)
+    for resource in plan_data.get("resource_changes", []):
+        resource_changes.append({
+            "type": resource.get("type", "unknown"),
+            "name": resource.get("name", "unknown"),
+            "index": resource.get("index", "unknown"),
+            "actions": resource.get("change", {}).get("actions", []),
+        })
+    return metadata, resource_changes
+
 def create_tfplan_summary(tfplan_file_json, tfplan_summary):
     '''
     Parses a Terraform plan JSON file and generates a summary of the changes, adding
@@ -3156,14 +3577,13 @@ def create_tfplan_summary(tfplan_file_json, tfplan_summary):
         None
     '''
     try:
-        # Load the Terraform JSON plan
-        with open(tfplan_file_json, "r") as f:
-            plan_data = json.load(f)
+        # Load only the relevant data of the Terraform JSON plan
+        plan_metadata, resource_changes = load_tfplan_summary_data(tfplan_file_json)
 
         # Extract Terraform version and execution timestamp from metadata
-        terraform_version = plan_data.get("terraform_version", "unknown")
-        timestamp = plan_data.get("timestamp", "unknown")
-        provider_version = plan_data.get("configuration", None).get("provider_config", None).get("apstra", None).get("version_constraint", None)
+        terraform_version = plan_metadata["terraform_version"]
+        timestamp = plan_metadata["timestamp"]
+        provider_version = plan_metadata["provider_version"]
 
         # Convert timestamp to human-readable format
         try:
@@ -3172,21 +3592,21 @@ def create_tfplan_summary(tfplan_file_json, tfplan_summary):
             execution_datetime = timestamp
 
         # Extract changes summary
-        summary = {"create": 0, "update": 0, "delete": 0}
-        resource_changes = plan_data.get("resource_changes", [])
+        summary = Counter()
 
         # Grouped resource summaries
-        resource_summary = {"create": {}, "update": {}, "delete": {}}
+        resource_summary = {action: defaultdict(list) for action in ("create", "update", "delete")}
 
         for resource in resource_changes:
-            actions = resource.get("change", {}).get("actions", [])
-            resource_key = f"{resource.get('type', 'unknown')}.{resource.get('name', 'unknown')}"
-            resource_index = resource.get("index", "unknown")
+            resource_key = f"{resource['type']}.{resource['name']}"
+            resource_index = resource["index"]
 
-            for action in ["create", "update", "delete"]:
-                if action in actions:
+            # Only the actions of the resource are visited (e.g. 'no-op' and 'read' are skipped)
+            for action in resource["actions"]:
+                indices = resource_summary.get(action)
+                if indices is not None:
                     summary[action] += 1
-                    resource_summary[action].setdefault(resource_key, []).append(resource_index)
+                    indices[resource_key].append(resource_index)
 
         # Format the summary report
 
@@ -3206,24 +3626,21 @@ def create_tfplan_summary(tfplan_file_json, tfplan_summary):
             f"❌ Resources to be Deleted: {summary['delete']}\n\n"
         )
 
-        report = header
-
-        flag_report = False
-        for action in ["create", "update", "delete"]:
-            if resource_summary[action]:
-                flag_report = True
-                report += f"** {action.capitalize()} Resources **\n"
-                for resource, indices in resource_summary[action].items():
-                    report += f"\n{resource}:\n"
-                    for index in indices:
-                        report += f"    - {index}\n"
-                report += "\n"
-        if flag_report:
-            report += summary
-
-        # Save the summary to a file
-        with open(tfplan_summary, "w") as f:
-            f.write(report)
+        # Save the summary to a file, writing each piece of the report directly into a large write buffer
+        with open(tfplan_summary, "w", buffering=output_file_buffer_size) as f:
+            f.write(header)
+
+            flag_report = False
+            for action in ["create", "update", "delete"]:
+                if resource_summary[action]:
+                    flag_report = True
+                    f.write(f"** {action.capitalize()} Resources **\n")
+                    for resource, indices in resource_summary[action].items():
+                        f.write(f"\n{resource}:\n")
+                        f.writelines(f"    - {index}\n" for index in indices)
+                    f.write("\n")
+            if flag_report:
+                f.write(summary)
 
         print("\n")
         logger.info(f"💾 Terraform Plan Summary saved to: {tfplan_summary}")
@@ -3232,6 +3649,8 @@ def create_tfplan_summary(tfplan_file_json, tfplan_summary):
         logger.error(f"❌ Error: File {tfplan_file_json} not found.")
     except json.JSONDecodeError:
         logger.error("❌ Error parsing Terraform plan JSON output.")
+    except Exception as e:
+        logger.error(f"❌ Error parsing Terraform plan JSON output: {e}")
 
 def display_tfplan_summary(tfplan_file_summary):
     '''
@@ -3256,9 +3675,10 @@ def display_tfplan_summary(tfplan_file_summary):
     except Exception as e:
         logger.error(f"❌ An error occurred while reading the file: {e}")
 
-def monitor_command(command, rules):
+def monitor_command(command, rules, interactive=True):
     '''
     Runs a shell command, monitors its output for multiple patterns, and handles each according to its defined action.
+    The output is read in large blocks (instead of one read per line) and split into lines before being matched.
 
     Args:
         command (str): The shell command to execute.
@@ -3267,6 +3687,7 @@ def monitor_command(command, rules):
             - 'message' (str, optional): Message to show when pausing execution.
             - 'pattern_vs_message' (str, optional): Whether to stop 'before' or 'after' finding the pattern.
             - 'suppress_until' (str, optional): Regex pattern that resumes output display after suppression.
+        interactive (bool, optional): If True, prompt the user to press Enter to continue after each matched pattern. Defaults to True.
 
     Returns:
         None
@@ -3282,48 +3703,79 @@ def monitor_command(command, rules):
         for rule in rules
     ]
 
-    process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, stdin=sys.stdin, text=True)
+    # Single alternation of all the patterns, used to discard in one regex scan the lines that match no rule.
+    # The rules are still checked in order on the remaining lines, so that the first matching rule wins (a plain
+    # alternation would pick the leftmost match in the line instead). Patterns with backreferences cannot be combined.
+    try:
+        any_rule_pattern = re.compile("|".join(f"(?:{rule['pattern']})" for rule in rules)) if rules else None
+    except re.error:
+        any_rule_pattern = None
+
+    process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, stdin=sys.stdin, bufsize=0)
 
     suppressing = None  # Tracks active suppression rule
 
+    def handle_line(line):
+        nonlocal suppressing
+        pattern_matched = False
+
+        # Suppression: skip printing lines if suppressing is active
+        if suppressing:
+            # Check if the suppression pattern is found to stop suppressing
+            if suppressing.search(line):
+                suppressing = None  # Stop suppressing
+            return  # Skip printing the current line if suppression is active
+
+        # No rule matches the line, print it
+        if any_rule_pattern is not None and not any_rule_pattern.search(line):
+            print(line, end="")
+            return
+
+        for rule in compiled_rules:
+            if rule["pattern"].search(line):  # Pattern matched
+                pattern_matched = True
+
+                # Handle the action based on 'pattern_vs_message'
+                if rule["pattern_vs_message"] == "before":  # Display the line before message
+                    print(line, end="")
+                    if rule['message']:
+                        logger.info(f"{rule['message']}")
+                    # In interactive mode, prompt the user to press Enter to continue
+                    if interactive:
+                        input("⏭️  Press enter to continue...\n")
+                elif rule["pattern_vs_message"] == "after":  # Display the line after message
+                    if rule['message']:
+                        logger.info(f"{rule['message']}")
+                    print(line, end="")
+                    # In interactive mode, prompt the user to press Enter to continue
+                    if interactive:
+                        input("⏭️  Press enter to continue...\n")
+                # Apply suppression if 'suppress_until' is specified
+                if rule["suppress_until"]:
+                    suppressing = rule["suppress_until"]
+                break  # Stop checking other rules once a match is found
+
+        # If no pattern matched and no suppression, print the line
+        if not suppressing and not pattern_matched:
+            print(line, end="")
+
     try:
-        for line in process.stdout:
-            pattern_matched = False
-
-            # Suppression: skip printing lines if suppressing is active
-            if suppressing:
-                # Check if the suppression pattern is found to stop suppressing
-                if suppressing.search(line):
-                    suppressing = None  # Stop suppressing
-                continue  # Skip printing the current line if suppression is active
-
-            for rule in compiled_rules:
-                if rule["pattern"].search(line):  # Pattern matched
-                    pattern_matched = True
-
-                    # Handle the action based on 'pattern_vs_message'
-                    if rule["pattern_vs_message"] == "before":  # Display the line before message
-                        print(line, end="")
-                        if rule['message']:
-                            logger.info(f"{rule['message']}")
-                        # In interactive mode, prompt the user to press Enter to continue
-                        if self.interactive:
-                            input("⏭️  Press enter to continue...\n")
-                    elif rule["pattern_vs_message"] == "after":  # Display the line after message
-                        if rule['message']:
-                            logger.info(f"{rule['message']}")
-                        print(line, end="")
-                        # In interactive mode, prompt the user to press Enter to continue
-                        if self.interactive:
-                            input("⏭️  Press enter to continue...\n")
-                    # Apply suppression if 'suppress_until' is specified
-                    if rule["suppress_until"]:
-                        suppressing = rule["suppress_until"]
-                    break  # Stop checking other rules once a match is found
-
-            # If no pattern matched and no suppression, print the line
-            if not suppressing and not pattern_matched:
-                print(line, end="")
+        stdout_fd = process.stdout.fileno()
+        leftover = b""
+
+        # Read the output in blocks of up to 64 KiB and process every complete line
+        while True:
+            chunk = os.read(stdout_fd, 1 << 16)
+            if not chunk:
+                break
+            lines = (leftover + chunk).split(b"\n")
+            leftover = lines.pop()  # Incomplete last line (empty if the chunk ended with a newline)
+            for line in lines:
+                handle_line(line.decode("utf-8", errors="replace") + "\n")
+
+        # Process the last line if the output did not end with a newline
+        if leftover:
+            handle_line(leftover.decode("utf-8", errors="replace"))
 
         process.wait()  # Ensure the process completes
 
@@ -3390,7 +3842,33 @@ def remove_directory(directory):
     '''
     try:
         if os.path.exists(directory):
-            shutil.rmtree(directory, ignore_errors=True)
+            if os.name == 'nt' or os.path.islink(directory):
+                shutil.rmtree(directory, ignore_errors=True)
+            else:
+                def remove_entry(remove, path):
+                    # Best effort (as 'shutil.rmtree' with 'ignore_errors'): a failing entry does not stop the walk
+                    try:
+                        remove(path)
+                        return True
+                    except OSError:
+                        return False
+
+                # Bottom-up walk: the files of each directory are unlinked concurrently (the unlink syscalls overlap),
+                # then the directory itself is removed once it is empty (its subdirectories were visited before it)
+                all_removed = True
+                with ThreadPoolExecutor(max_workers=remove_directory_max_workers) as executor:
+                    for root, dirs, files in os.walk(directory, topdown=False):
+                        # Symlinks to directories are listed in 'dirs' but must be unlinked, not removed as directories
+                        names = files + [name for name in dirs if os.path.islink(os.path.join(root, name))]
+                        # All the unlinks are waited for (not just up to the first failure) before removing the directory
+                        if not all(list(executor.map(lambda name: remove_entry(os.unlink, os.path.join(root, name)), names))):
+                            all_removed = False
+                        if not remove_entry(os.rmdir, root):
+                            all_removed = False
+
+                # Some entries could not be removed: give them a last try, removing as much as possible
+                if not all_removed:
+                    shutil.rmtree(directory, ignore_errors=True)
             logging.info(f"🚮 Successfully removed directory: {directory}")
             return True
         else:
@@ -3421,6 +3899,21 @@ def remove_file(file_path):
         logging.error(f"❌ Failed to remove file {file_path}: {e}")
         return False
 
+def create_blueprint_dirs(base_dir, devices):
+    '''
+    Create one subdirectory per distinct blueprint name found in a list of devices.
+
+    Args:
+        base_dir (str): Directory in which the blueprint subdirectories are created.
+        devices (list): List of device dictionaries containing a 'blueprint_name' key.
+    '''
+    created_dirs = set()
+    for device in devices:
+        blueprint_name = device.get("blueprint_name")
+        if blueprint_name and blueprint_name not in created_dirs:
+            os.makedirs(os.path.join(base_dir, blueprint_name), exist_ok=True)
+            created_dirs.add(blueprint_name)
+
 def get_direct_subdirectories(input_directory):
     '''
     Get all the directories directly contained within the input directory.
@@ -3432,8 +3925,9 @@ def get_direct_subdirectories(input_directory):
         list: A list of folder names directly contained within the input folder.
 
     '''
-    subdirectories = [folder for folder in os.listdir(input_directory)
-                  if os.path.isdir(os.path.join(input_directory, folder))]
+    # os.scandir returns the entry types along with the names, avoiding a stat call per entry
+    with os.scandir(input_directory) as entries:
+        subdirectories = [entry.name for entry in entries if entry.is_dir()]
     return subdirectories
 
 def create_tgz_from_dir(folder_path, output_tgz_path):
@@ -3450,8 +3944,11 @@ def create_tgz_from_dir(folder_path, output_tgz_path):
     '''
 
     try:
-        with tarfile.open(output_tgz_path, "w:gz") as tar:
-            tar.add(folder_path, arcname=os.path.basename(folder_path))
+        # Prefer parallel compression with 'pigz' when available (same gzip format), falling back to 'tarfile'
+        if create_tgz_from_dir_with_pigz(folder_path, output_tgz_path):
+            return
+        with tarfile.open(output_tgz_path, "w:gz", compresslevel=tgz_compress_level) as tar:
+            add_dir_to_tar_with_prefetch(tar, folder_path, os.path.basename(folder_path))
     except FileNotFoundError as e:
         logger.error(f"❌ Error: The specified folder '{folder_path}' does not exist. {e}")
     except PermissionError as e:
@@ -3459,6 +3956,81 @@ def create_tgz_from_dir(folder_path, output_tgz_path):
     except Exception as e:
         logger.error(f"❌ An unexpected error occurred while crating a .tgz file: {e}")
 
+def create_tgz_from_dir_with_pigz(folder_path, output_tgz_path):
+    '''
+    Create a .tgz file from the specified folder using the system 'tar' command piped into 'pigz' (parallel gzip).
+
+    Args:
+        folder_path (str): The path to the folder to be tarred and gzipped.
+        output_tgz_path (str): The path where the output .tgz file should be saved.
+
+    Returns:
+        bool: True if the .tgz file was successfully created, False if 'tar' or 'pigz' are not available or the compression failed.
+    '''
+    tar_path = shutil.which("tar")
+    pigz_path = shutil.which("pigz")
+    if not tar_path or not pigz_path or not os.path.isdir(folder_path):
+        return False
+
+    try:
+        parent_dir, folder_name = os.path.split(os.path.abspath(folder_path))
+        with open(output_tgz_path, "wb") as tgz_file:
+            with subprocess.Popen([tar_path, "-cf", "-", "-C", parent_dir, folder_name], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as tar_process:
+                pigz_result = subprocess.run([pigz_path, f"-{tgz_compress_level}", "-c"], stdin=tar_process.stdout, stdout=tgz_file, stderr=subprocess.DEVNULL)
+                tar_process.stdout.close()
+        if tar_process.returncode == 0 and pigz_result.returncode == 0:
+            return True
+    except Exception as e:
+        logger.debug(f"An error occurred while creating {output_tgz_path} with 'pigz', falling back to 'tarfile': {e}")
+    return False
+
+def add_dir_to_tar_with_prefetch(tar, folder_path, arcname):
+    '''
+    Add a folder and all its contents to an open tar archive, like `tar.add`, but reading the small files
+    concurrently ahead of the (sequential) writes into the archive, so that their reads overlap.
+    Files bigger than 'tgz_prefetch_max_file_size' are streamed from disk as `tar.add` does.
+
+    Args:
+        tar (tarfile.TarFile): The tar archive opened for writing.
+        folder_path (str): The path to the folder to be added.
+        arcname (str): The name of the folder inside the archive.
+
+    Returns:
+        None
+    '''
+    def read_file(path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    # Build the list of entries to archive (each directory before its sorted contents)
+    entries = []
+    for root, dirs, files in os.walk(folder_path):
+        dirs.sort()
+        rel_root = os.path.relpath(root, folder_path)
+        root_arcname = arcname if rel_root == os.curdir else os.path.join(arcname, rel_root)
+        entries.append((root, root_arcname))
+        # Symlinks to directories are archived as links, not descended into
+        for name in sorted(files + [d for d in dirs if os.path.islink(os.path.join(root, d))]):
+            entries.append((os.path.join(root, name), os.path.join(root_arcname, name)))
+        dirs[:] = [d for d in dirs if not os.path.islink(os.path.join(root, d))]
+
+    with ThreadPoolExecutor(max_workers=device_io_max_workers) as executor:
+        for start in range(0, len(entries), tgz_prefetch_batch_size):
+            batch = [(path, tar.gettarinfo(path, arcname=name)) for path, name in entries[start:start + tgz_prefetch_batch_size]]
+            # Submit the reads of the whole batch before writing its first entry
+            contents = [
+                executor.submit(read_file, path) if tarinfo.isreg() and tarinfo.size <= tgz_prefetch_max_file_size else None
+                for path, tarinfo in batch
+            ]
+            for (path, tarinfo), content in zip(batch, contents):
+                if not tarinfo.isreg():
+                    tar.addfile(tarinfo)
+                elif content is not None:
+                    tar.addfile(tarinfo, io.BytesIO(content.result()))
+                else:
+                    with open(path, "rb") as f:
+                        tar.addfile(tarinfo, f)
+
 def extract_tgz_to_dir(tgz_path, extract_path):
     '''
     Extract the contents of a .tgz file to the specified folder.
@@ -3472,9 +4044,15 @@ def extract_tgz_to_dir(tgz_path, extract_path):
     '''
 
     if os.path.exists(tgz_path):
+        # Prefer the system 'tar' (with 'pigz' for parallel decompression when available), falling back to 'tarfile'
+        if extract_tgz_to_dir_with_tar(tgz_path, extract_path):
+            return True
         try:
             with tarfile.open(tgz_path, 'r:gz') as tar:
-                tar.extractall(path=extract_path)
+                if hasattr(tarfile, 'data_filter'):
+                    tar.extractall(path=extract_path, filter='data')
+                else:
+                    tar.extractall(path=extract_path)
             return True
         except Exception as e:
             logger.error(f"❌ An error occurred while extracting {tgz_path}: {e}")
@@ -3482,6 +4060,68 @@ def extract_tgz_to_dir(tgz_path, extract_path):
     else:
         return False
 
+def extract_tgz_to_dir_with_tar(tgz_path, extract_path):
+    '''
+    Extract the contents of a .tgz file using the system 'tar' command.
+    When 'pigz' is installed, the archive is decompressed by 'pigz' and piped into 'tar'.
+
+    Args:
+        tgz_path (str): The path to the .tgz file to be extracted.
+        extract_path (str): The path where the extracted files should be saved.
+
+    Returns:
+        bool: True if the .tgz file was successfully extracted, False if 'tar' is not available or the extraction failed.
+    '''
+    tar_path = shutil.which("tar")
+    if not tar_path:
+        return False
+
+    try:
+        os.makedirs(extract_path, exist_ok=True)
+        pigz_path = shutil.which("pigz")
+        if pigz_path:
+            with subprocess.Popen([pigz_path, "-dc", tgz_path], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as pigz_process:
+                tar_result = subprocess.run([tar_path, "-xf", "-", "-C", extract_path], stdin=pigz_process.stdout, stderr=subprocess.DEVNULL)
+                pigz_process.stdout.close()
+            return pigz_process.returncode == 0 and tar_result.returncode == 0
+        tar_result = subprocess.run([tar_path, "-xzf", tgz_path, "-C", extract_path], stderr=subprocess.DEVNULL)
+        return tar_result.returncode == 0
+    except Exception as e:
+        logger.debug(f"An error occurred while extracting {tgz_path} with 'tar', falling back to 'tarfile': {e}")
+        return False
+
+def read_tgz_members(tgz_path, member_names):
+    '''
+    Read the contents of some files of a .tgz file, without extracting the archive to disk.
+    The archive is read sequentially and only the requested members are decompressed into memory.
+
+    Args:
+        tgz_path (str): The path to the .tgz file.
+        member_names (iterable): Names of the members to read (e.g. 'input/design/design.yml').
+
+    Returns:
+        dict: {member name: contents (bytes)} for the requested members found in the archive (missing ones are left out),
+              or None if the .tgz file does not exist or could not be read.
+    '''
+    if not tgz_path or not os.path.exists(tgz_path):
+        return None
+
+    pending = set(member_names)
+    contents = {}
+    try:
+        with tarfile.open(tgz_path, 'r|gz') as tar:
+            for member in tar:
+                member_name = member.name[2:] if member.name.startswith('./') else member.name  # Archives created with 'tar -C dir .'
+                if member_name in pending and member.isfile():
+                    contents[member_name] = tar.extractfile(member).read()
+                    pending.discard(member_name)
+                    if not pending:
+                        break  # Skip the rest of the archive
+        return contents
+    except Exception as e:
+        logger.error(f"❌ An error occurred while reading {tgz_path}: {e}")
+        return None
+
 def update_yaml(yaml_file, *dicts):
     '''
     Update a YAML file by adding new dictionaries and replacing existing ones.
@@ -3497,11 +4137,11 @@ def update_yaml(yaml_file, *dicts):
         existing_data = {}
         if os.path.exists(yaml_file):
             with open(yaml_file, 'r') as f:
-                existing_data = yaml.safe_load(f) or {}
+                existing_data = yaml.load(f, Loader=YamlSafeLoader) or {}
         for d in dicts:
             existing_data.update(d)
         with open(yaml_file, 'w') as f:
-            yaml.dump(existing_data, f, default_flow_style=False)
+            yaml.dump(existing_data, f, Dumper=YamlSafeDumper, default_flow_style=False)
     except FileNotFoundError as e:
         logger.error(f"❌ Error: The file '{yaml_file}' was not found. {e}")
     except PermissionError as e:
@@ -3529,20 +4169,21 @@ def rename_backup_files(file_path, keep_file=False, max_backups=9, tgz_backup_fi
         # Ensure backup directory exists
         os.makedirs(backup_dir, exist_ok=True)
 
-        # Rotate existing backups (both `.bck.N` and `.bck.N.tgz`)
-        for i in range(max_backups, 0, -1):
-            current_backup = os.path.join(backup_dir, f"{filename}.bck.{i}")
-            new_backup = os.path.join(backup_dir, f"{filename}.bck.{i + 1}")
-            current_tgz = f"{current_backup}.tgz"
-            new_tgz = f"{new_backup}.tgz"
-
-            # Rotate backup files
-            if os.path.exists(current_backup):
-                os.rename(current_backup, new_backup)
-
-            # Rotate compressed backups
-            if os.path.exists(current_tgz):
-                os.rename(current_tgz, new_tgz)
+        # Find the existing backups (both `.bck.N` and `.bck.N.tgz`) with a single directory scan
+        backup_regex = re.compile(rf"^{re.escape(filename)}\.bck\.(\d+)(\.tgz)?$")
+        existing_backups = []
+        with os.scandir(backup_dir) as entries:
+            for entry in entries:
+                match = backup_regex.match(entry.name)
+                if match and 1 <= int(match.group(1)) <= max_backups:
+                    existing_backups.append((int(match.group(1)), match.group(2) or ""))
+
+        # Rotate them, starting from the highest index so that no backup is overwritten before being moved
+        for i, extension in sorted(existing_backups, reverse=True):
+            os.rename(
+                os.path.join(backup_dir, f"{filename}.bck.{i}{extension}"),
+                os.path.join(backup_dir, f"{filename}.bck.{i + 1}{extension}")
+            )
 
         # Move the current file as the first backup
         backup_path = os.path.join(backup_dir, f"{filename}.bck.1")
@@ -3554,13 +4195,42 @@ def rename_backup_files(file_path, keep_file=False, max_backups=9, tgz_backup_fi
         # If compression is enabled, create a .tgz archive for each backup file
         if tgz_backup_files:
             tgz_path = f"{backup_path}.tgz"
-            with tarfile.open(tgz_path, "w:gz") as tar:
+            with tarfile.open(tgz_path, "w:gz", compresslevel=tgz_compress_level) as tar:
                 tar.add(backup_path, arcname=os.path.basename(backup_path))
             os.remove(backup_path)  # Remove individual backup file after compression
 
     except Exception as e:
         logger.error(f"❌ Error in rename_backup_files: {e}")
 
+def append_file_contents(src_file, dst_file):
+    '''
+    Append the whole content of a source file to a destination file.
+    The copy is done in kernel space with `os.sendfile` when supported, falling back to `shutil.copyfileobj` otherwise.
+
+    Args:
+        src_file (file object): Source file opened in binary read mode.
+        dst_file (file object): Destination file opened in binary read/write mode ('r+b'). Not in append mode ('ab'):
+                                Linux sendfile rejects destinations opened with O_APPEND.
+    '''
+    dst_file.seek(0, os.SEEK_END)  # sendfile writes at the current position of the destination
+    src_fd = src_file.fileno()
+    dst_fd = dst_file.fileno()
+    offset = 0
+    remaining = os.fstat(src_fd).st_size
+
+    try:
+        while remaining > 0:
+            sent = os.sendfile(dst_fd, src_fd, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+    except (AttributeError, OSError):
+        # sendfile not available (or not supported between regular files on this platform) - copy the rest in user space
+        src_file.seek(offset)
+        dst_file.seek(0, os.SEEK_END)  # Resync the buffered position with what sendfile may have already written
+        shutil.copyfileobj(src_file, dst_file)
+
 def create_output_file(content, file_path):
     '''
     Create an output file with the given content.
@@ -3594,12 +4264,99 @@ def get_md5(file_path):
     Returns:
         str: The MD5 checksum of the file as a hexadecimal string.
     '''
-    hash_md5 = hashlib.md5()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        # hashlib.file_digest (Python 3.11+) hashes the file in C with a large internal buffer
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "md5").hexdigest()
+        hash_md5 = hashlib.md5()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
             hash_md5.update(chunk)
     return hash_md5.hexdigest()
 
+def get_content_hash(file_path, algorithm=None):
+    '''
+    Calculate a checksum of a file for content-identity checks (change detection, not security).
+
+    Args:
+        file_path (str): The path to the file for which the checksum is to be calculated.
+        algorithm (str, optional): 'blake2b' (128-bit digest) or any algorithm supported by `hashlib` (e.g. 'md5').
+            Defaults to 'content_hash_algorithm'.
+
+    Returns:
+        str: The checksum of the file as a hexadecimal string.
+    '''
+    algorithm = algorithm or content_hash_algorithm
+    if algorithm == 'blake2b':
+        hash_factory = lambda: hashlib.blake2b(digest_size=16)
+    else:
+        hash_factory = lambda: hashlib.new(algorithm)
+
+    with open(file_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, hash_factory).hexdigest()
+        file_hash = hash_factory()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+def load_text_file(file_path):
+    '''
+    Read a text file and return its contents (exceptions are raised to the caller).
+
+    Args:
+        file_path (str): The path to the text file.
+
+    Returns:
+        str: The contents of the file.
+    '''
+    with open(file_path, 'r') as file:
+        return file.read()
+
+def load_yaml_file(file_path):
+    '''
+    Parse a YAML file and return its contents (exceptions are raised to the caller).
+
+    Args:
+        file_path (str): The path to the YAML file.
+
+    Returns:
+        The contents of the YAML file.
+    '''
+    with open(file_path, 'r') as file:
+        return yaml.load(file, Loader=YamlSafeLoader)
+
+def load_file_cached(file_path, loader):
+    '''
+    Load a file with the given loader, reusing the previous result while the file is unchanged,
+    so that the same file is not parsed several times within a diff cycle (`compare_yaml` + `process_diff`).
+    Results are keyed on the loader and the file signature (path, mtime, size), and the cache is capped
+    to 'parsed_file_cache_max_entries' entries (the least recently used one is evicted first). The returned data is shared and must not be modified.
+
+    Args:
+        file_path (str): The path to the file.
+        loader (function): The function parsing the file (e.g. `load_yaml_file` or `load_text_file`).
+
+    Returns:
+        The contents of the file, as returned by the loader.
+    '''
+    signature = get_file_signature(file_path)
+    if signature[1] is None:
+        return loader(file_path)  # Not cached, let the loader raise the appropriate error
+
+    # The absolute path is used, so that the same file reached through different relative paths shares its entry
+    cache_key = (loader.__name__, os.path.abspath(file_path)) + signature[1:]
+    if cache_key in parsed_file_cache:
+        # Move the entry to the end, so that the files still in use are the last ones evicted
+        data = parsed_file_cache.pop(cache_key)
+        parsed_file_cache[cache_key] = data
+        return data
+
+    data = loader(file_path)
+    if len(parsed_file_cache) >= parsed_file_cache_max_entries:
+        parsed_file_cache.pop(next(iter(parsed_file_cache)))  # Evict the least recently used entry
+    parsed_file_cache[cache_key] = data
+    return data
+
 def read_j2(file_path):
     '''
     Read a Jinja2 file and return its contents as a string.
@@ -3611,8 +4368,7 @@ def read_j2(file_path):
         str: The contents of the Jinja2 file as a string.
     '''
     try:
-        with open(file_path, 'r') as file:
-            return file.read()
+        return load_file_cached(file_path, load_text_file)
     except FileNotFoundError:
         logger.error(f"❌ File not found: {file_path}")
         return None
@@ -3632,8 +4388,7 @@ def read_yaml(file_path):
     '''
 
     try:
-        with open(file_path, 'r') as file:
-            return yaml.safe_load(file)
+        return load_file_cached(file_path, load_yaml_file)
     except FileNotFoundError:
         logger.error(f"❌ File not found: {file_path}")
         return None
@@ -3655,9 +4410,8 @@ def compare_j2(file_a, file_b):
               and values describing the changes, or an 'error' key if any issue occurred.
     '''
     try:
-        with open(file_a, 'r') as fa, open(file_b, 'r') as fb:
-            template_a = fa.read()
-            template_b = fb.read()
+        template_a = load_file_cached(file_a, load_text_file)
+        template_b = load_file_cached(file_b, load_text_file)
         differences = DeepDiff(template_a, template_b, ignore_order=True).to_dict()
         return differences
     except FileNotFoundError as fnf_error:
@@ -3672,8 +4426,8 @@ def compare_yaml(file_a, file_b):
     Compare two YAML data (.yml or .yaml) files using DeepDiff and return the differences.
 
     Args:
-        file_a (str): The path to the first YAML file.
-        file_b (str): The path to the second YAML file.
+        file_a (str or bytes): The path to the first YAML file, or its contents (e.g. read from a .tgz file).
+        file_b (str or bytes): The path to the second YAML file, or its contents.
 
     Returns:
         dict: A dictionary containing the differences between the two YAML files.
@@ -3681,9 +4435,17 @@ def compare_yaml(file_a, file_b):
               'dictionary_item_added', etc.) and values describing the changes, or an 'error' key if any issue occurred.
     '''
     try:
-        with open(file_a, 'r') as fa, open(file_b, 'r') as fb:
-            data_a = yaml.safe_load(fa)
-            data_b = yaml.safe_load(fb)
+        data_a = yaml.load(file_a, Loader=YamlSafeLoader) if isinstance(file_a, bytes) else load_file_cached(file_a, load_yaml_file)
+        data_b = yaml.load(file_b, Loader=YamlSafeLoader) if isinstance(file_b, bytes) else load_file_cached(file_b, load_yaml_file)
+
+        # Identical contents: skip DeepDiff entirely
+        if data_a == data_b:
+            return {}
+
+        # Only hand DeepDiff the top-level objects that actually differ (the output is the same, with the same paths)
+        if isinstance(data_a, dict) and isinstance(data_b, dict):
+            data_a, data_b = prune_equal_top_level_keys(data_a, data_b)
+
         differences = DeepDiff(data_b, data_a, ignore_order=True).to_dict()
         return differences
     except FileNotFoundError as fnf_error:
@@ -3696,6 +4458,38 @@ def compare_yaml(file_a, file_b):
         logger.error(f"❌ An error occurred while comparing {file_a} and {file_b}: {e}")
         return {"error": f"An error occurred while comparing {file_a} and {file_b}: {e}"}
 
+def prune_equal_top_level_keys(data_a, data_b):
+    '''
+    Drop the top-level keys whose values are equal in both dictionaries, keeping the keys present in only one of them.
+    Diffing the pruned dictionaries gives the same result as diffing the original ones, with much less work
+    when only a few top-level objects changed.
+
+    Args:
+        data_a (dict): The first dictionary.
+        data_b (dict): The second dictionary.
+
+    Returns:
+        tuple: The two pruned dictionaries (new objects, the inputs are not modified).
+    '''
+    equal_keys = {key for key in data_a.keys() & data_b.keys() if data_a[key] == data_b[key]}
+    pruned_a = {key: value for key, value in data_a.items() if key not in equal_keys}
+    pruned_b = {key: value for key, value in data_b.items() if key not in equal_keys}
+    return pruned_a, pruned_b
+
+@functools.lru_cache(maxsize=4096)
+def parse_diff_path(path):
+    '''
+    Split a DeepDiff path into its dictionary keys and list indexes, e.g. "root['a'][0]['name']" gives ('a', 0, 'name').
+    Results are memoized, so a path walked several times (e.g. the name of each changed object) is only parsed once.
+
+    Args:
+        path (str): The DeepDiff path.
+
+    Returns:
+        tuple: The dictionary keys (str) and list indexes (int) of the path, in order.
+    '''
+    return tuple(int(index) if index else key for key, index in diff_path_regex.findall(path))
+
 def get_value_at_path(data, path):
     '''
     Retrieve the value from a nested dictionary or list based on a given string path.
@@ -3707,14 +4501,12 @@ def get_value_at_path(data, path):
     Returns:
         The value at the specified path, or None if any part of the path is invalid.
     '''
-    keys = re.findall(r"\['(.*?)'\]|\[(\d+)\]", path)
-
     try:
-        for key in keys:
-            if key[0]:  # it's a dictionary key
-                data = data.get(key[0])
-            else:  # it's a list index
-                data = data[int(key[1])]
+        for key in parse_diff_path(path):
+            if isinstance(key, int):  # it's a list index
+                data = data[key]
+            else:  # it's a dictionary key
+                data = data.get(key)
             if data is None:
                 return None
     except (KeyError, IndexError, TypeError) as e:
@@ -3722,6 +4514,25 @@ def get_value_at_path(data, path):
         return None
     return data
 
+@functools.lru_cache(maxsize=4096)
+def split_diff_path(path):
+    '''
+    Extract, in a single regex match, the top-level key and the last segment of a DeepDiff path.
+    E.g. "root['virtual_networks'][3]['name']" gives ('virtual_networks', "'name'").
+    Results are memoized, as the same paths recur across the change types of a diff and across repeated diffs.
+
+    Args:
+        path (str): The DeepDiff path.
+
+    Returns:
+        tuple: The top-level key (the Apstra object) and the contents of the last brackets (quotes included for keys).
+    '''
+    match = diff_path_segments_regex.match(path)
+    if not match:
+        raise ValueError(f"Unexpected DeepDiff path: {path}")
+    top_level_key, last_segment = match.groups()
+    return top_level_key, last_segment if last_segment is not None else f"'{top_level_key}'"
+
 def extract_segments(path, num_segments):
     '''
     Extract the contents of a string path up to the end of the specified number of closing brackets.
@@ -3734,8 +4545,14 @@ def extract_segments(path, num_segments):
         str: The substring up to the end of the specified number of closing brackets, or an error message if the path is invalid.
     '''
     try:
-        segments = path.split(']')
-        return ']'.join(segments[:num_segments]) + ']'
+        # Locate the closing bracket of the last requested segment without splitting the whole path
+        end = -1
+        for _ in range(num_segments):
+            end = path.find(']', end + 1)
+            if end == -1:
+                segments = path.split(']')
+                return ']'.join(segments[:num_segments]) + ']'
+        return path[:end + 1]
     except Exception as e:
         logger.error(f"❌ Error extracting segments: {e}")
         return path
@@ -3764,6 +4581,31 @@ def find_nested_dict_entry(nested_dict, object_key, key, value):
         logger.error(f"❌ Error processing the data: {e}")
         return None
 
+def index_nested_dict_entries(nested_dict, object_key, key):
+    '''
+    Index the second-level dictionaries of a nested dictionary structure by the value of a given key,
+    so that repeated lookups (see `find_nested_dict_entry`) do not need to scan the list every time.
+
+    Args:
+        nested_dict (dict): A dictionary where first-level keys are associated with lists of second-level dictionaries.
+        object_key (str): The first-level key whose list of dictionaries to index.
+        key (str): The key whose values are used as index.
+
+    Returns:
+        dict: The second-level dictionaries keyed by their value for the specified key (the first one wins on duplicates).
+    '''
+    index = {}
+    try:
+        for entry in nested_dict.get(object_key, []):
+            if isinstance(entry, dict) and key in entry:
+                try:
+                    index.setdefault(entry[key], entry)
+                except TypeError:
+                    pass  # Unhashable values cannot be indexed
+    except Exception as e:
+        logger.error(f"❌ Error processing the data: {e}")
+    return index
+
 def process_diff(diff, previous_file_path, current_file_path, configlet_name = None):
 
     '''
@@ -3785,18 +4627,40 @@ def process_diff(diff, previous_file_path, current_file_path, configlet_name = N
     added_types = ['dictionary_item_added', 'iterable_item_added', 'attribute_added', 'set_item_added']
     changed_types = ['values_changed', 'type_changes', 'repetition_change']
     removed_types = ['dictionary_item_removed', 'iterable_item_removed', 'attribute_removed', 'set_item_removed']
+    relevant_types = set(added_types + changed_types + removed_types)
 
-    if configlet_name:
-        previous_file = read_j2(previous_file_path)
-        current_file = read_j2(current_file_path)
-    else:
-        previous_file = read_yaml(previous_file_path)
-        current_file = read_yaml(current_file_path)
+    # Nothing to process
+    if not diff:
+        return {}
+
+    # The previous and current files are only read if a change needs them (renames, changed attributes, added/removed dictionary items)
+    read_file = read_j2 if configlet_name else read_yaml
+    file_paths = {'previous': previous_file_path, 'current': current_file_path}
+    loaded_files = {}
+
+    def get_file_data(data_label):
+        if data_label not in loaded_files:
+            loaded_files[data_label] = read_file(file_paths[data_label])
+        return loaded_files[data_label]
+
+    # Indexes of the entries by name, built on first use for each (file, Apstra object)
+    name_indexes = {}
+
+    def find_entry_by_name(data_label, apstra_object, name):
+        data = get_file_data(data_label)
+        index_key = (data_label, apstra_object)
+        if index_key not in name_indexes:
+            name_indexes[index_key] = index_nested_dict_entries(data, apstra_object, 'name')
+        try:
+            return name_indexes[index_key].get(name)
+        except TypeError:
+            return find_nested_dict_entry(data, apstra_object, 'name', name)
 
     try:
-        results = {}
+        # Each Apstra object gets its added/changed/removed lists on first access
+        results = defaultdict(lambda: {'added': [], 'changed': [], 'removed': []})
         for change_type, changes in diff.items():
-            if change_type in added_types + changed_types + removed_types:
+            if change_type in relevant_types:
                 list_objects_changed_names = []
                 # This matches nearly all DeepDiff types (except for dictionary_item_added and dictionary_item_removed),
                 # which are dictionaries containing the full contents of the modified fields.
@@ -3805,74 +4669,69 @@ def process_diff(diff, previous_file_path, current_file_path, configlet_name = N
                         # If this is the first execution of the project, all the changes are additions
                         if change_type == 'type_changes' and change == 'root':
                             for change_first_exec, details_first_exec in details.get('new_value').items():
-                                if change_first_exec not in results:
-                                    results[change_first_exec] = {'added': [], 'changed': [], 'removed': []}
+                                object_results = results[change_first_exec]
                                 if isinstance(details_first_exec, list):
-                                    results[change_first_exec]['added'].extend(details_first_exec)
+                                    object_results['added'].extend(details_first_exec)
                                 elif isinstance(details_first_exec, dict):
                                     if 'user_defined' in details_first_exec:
-                                        results[change_first_exec]['added'].extend(details_first_exec.get('user_defined'))
+                                        object_results['added'].extend(details_first_exec.get('user_defined'))
                         # If the diff to assess is between configlet versions
                         elif change_type == 'values_changed' and change == 'root':
                             if configlet_name:
                                 apstra_object = 'configlet_contents'
-                                if apstra_object not in results:
-                                    results[apstra_object] = {'added': [], 'changed': [], 'removed': []}
                                 change_detail = {'name': configlet_name} | details
                                 results[apstra_object]['changed'].append(change_detail)
                                 # results[apstra_object]['added'].append(change_detail)
                                 # results[apstra_object]['removed'].append(change_detail)
                         else:
-                            apstra_object = change.split("['")[1].split("']")[0]
-                            if apstra_object not in results:
-                                results[apstra_object] = {'added': [], 'changed': [], 'removed': []}
+                            apstra_object, changed_attribute = split_diff_path(change)
+                            object_results = results[apstra_object]
                             if change_type in changed_types:
-                                previous_object = extract_segments(change.split('root')[1], 2)
-                                changed_attribute = change.split('[')[-1].split(']')[0]
+                                previous_object = extract_segments(change[len('root'):], 2)
                                 # If the changed attribute is the name, this is not a change but a removal + addition
                                 if changed_attribute == "'name'":
                                     list_objects_changed_names.append(previous_object)
                                     previous_name = details.get('old_value', '')
                                     current_name = details.get('new_value', '')
-                                    previous_entry = find_nested_dict_entry(previous_file, apstra_object, 'name', previous_name)
-                                    current_entry = find_nested_dict_entry(current_file, apstra_object, 'name', current_name)
+                                    previous_entry = find_entry_by_name('previous', apstra_object, previous_name)
+                                    current_entry = find_entry_by_name('current', apstra_object, current_name)
                                     if previous_entry and current_entry:
-                                        results[apstra_object]['removed'].append(previous_entry)
-                                        results[apstra_object]['added'].append(current_entry)
+                                        object_results['removed'].append(previous_entry)
+                                        object_results['added'].append(current_entry)
                                 # If the changed attribute is NOT the name, this is a normal change, simply add the name to the details
                                 else:
                                     # Ignore value changes in renamed objects
                                     if previous_object not in list_objects_changed_names:
-                                        current_name = get_value_at_path(previous_file, previous_object + "['name']")
+                                        current_name = get_value_at_path(get_file_data('previous'), previous_object + "['name']")
                                         change_detail = {'name': current_name} | details
-                                        results[apstra_object]['changed'].append(change_detail)
+                                        object_results['changed'].append(change_detail)
                             elif change_type in added_types:
-                                results[apstra_object]['added'].append(details)
+                                object_results['added'].append(details)
                             elif change_type in removed_types:
-                                results[apstra_object]['removed'].append(details)
+                                object_results['removed'].append(details)
                 # This matches the two DeepDiff types (dictionary_item_added and dictionary_item_removed),
                 # which are lists that do not contain the full contents of the modified fields.
                 # As a result, it's necessary to access the specific entries in the diff and manually navigate through the nested items.
                 else:
                     if change_type == 'dictionary_item_added' or change_type == 'dictionary_item_removed':
+                        # Reuse the data already parsed above instead of loading the files again
                         if change_type == 'dictionary_item_added':
-                            with open(current_file_path, 'r') as f:
-                                data_from_yaml = yaml.safe_load(f)
+                            data_from_yaml = get_file_data('current')
                         if change_type == 'dictionary_item_removed':
-                            with open(previous_file_path, 'r') as f:
-                                data_from_yaml = yaml.safe_load(f)
+                            data_from_yaml = get_file_data('previous')
                         for change in changes:
-                            apstra_object = change.split("['")[1].split("']")[0]
-                            path = change.replace("root", "data_from_yaml")  # Convert DeepDiff path to Python dictionary path
-                            details = eval(path)  # Safely evaluate the path to get the added value
-                            if apstra_object not in results:
-                                results[apstra_object] = {'added': [], 'changed': [], 'removed': []}
+                            apstra_object, _ = split_diff_path(change)
+                            # Walk the parsed DeepDiff path (keys and list indexes) instead of evaluating it as Python code
+                            details = get_value_at_path(data_from_yaml, change)
+                            object_results = results[apstra_object]
                             if isinstance(details, list):
                                 if change_type == 'dictionary_item_added':
-                                    results[apstra_object]['added'].extend(details)
+                                    object_results['added'].extend(details)
                                 if change_type == 'dictionary_item_removed':
-                                    results[apstra_object]['removed'].extend(details)
-        return results
+                                    object_results['removed'].extend(details)
+        # The entries come from the parsed files (and DeepDiff output) shared by 'load_file_cached': return copies,
+        # so that the consumers of the results can modify them without corrupting the cache for the following diffs
+        return copy.deepcopy(dict(results))
     except Exception as e:
         logger.error(f"❌ Error processing the diff: {e}")
         return {}
@@ -3880,7 +4739,7 @@ def process_diff(diff, previous_file_path, current_file_path, configlet_name = N
 def rename_file_if_exists(source_path, target_path):
     '''
     Renames the source file to the target file name if the source file exists.
-    If the target file already exists, it will be removed before renaming.
+    If the target file already exists, it is atomically replaced.
 
     Args:
         source_path (str): The path to the file to be renamed.
@@ -3890,25 +4749,19 @@ def rename_file_if_exists(source_path, target_path):
         bool: True if the file was renamed successfully, False otherwise.
     '''
     try:
-        if os.path.exists(source_path):
-            # Remove the target file if it already exists
-            if os.path.exists(target_path):
-                os.remove(target_path)
-                logger.info(f"🗑️  Existing file removed: {target_path}")
-
-            # Rename the source file to the target file path
-            os.rename(source_path, target_path)
-            logger.info(f"📄 File renamed: {source_path} -> {target_path}")
-            return True
-        # else:
-        #     logger.error(f"❌ File not found: {source_path}")
-        #     return False
+        # Rename the source file to the target file path, overwriting the target file if it already exists
+        os.replace(source_path, target_path)
+        logger.info(f"📄 File renamed: {source_path} -> {target_path}")
+        return True
+    except FileNotFoundError as e:
+        if not os.path.exists(source_path):
+            return False  # Return False if source file does not exist
+        logger.error(f"❌ Error renaming file: {e}")
+        return False
     except Exception as e:
         logger.error(f"❌ Error renaming file: {e}")
         return False
 
-    return False  # Return False if source file does not exist
-
 def compare_directories(dir1, dir2):
     '''
     Compare the contents of two directories, including files and subdirectories.
@@ -3920,28 +4773,78 @@ def compare_directories(dir1, dir2):
         dir2 (str): The path to the second directory.
 
     Returns:
-        tuple: A tuple containing four lists:
+        tuple: A tuple containing four lists of paths relative to the compared directories (subdirectories included):
             - left_only (list): Files only in the first directory.
             - right_only (list): Files only in the second directory.
             - diff_files (list): Files that are in both directories but differ.
             - same_files (list): Files that are in both directories and are identical.
     '''
+    def list_entries(directory):
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries if entry.name not in filecmp.DEFAULT_IGNORES}
+
     # Compare the two directories
-    dir_comparison = filecmp.dircmp(dir1, dir2)
+    entries1 = list_entries(dir1)
+    entries2 = list_entries(dir2)
 
     # print(f"Comparing {dir1} and {dir2}\n")
 
     # Report differences in files
-    left_only = dir_comparison.left_only
-    right_only = dir_comparison.right_only
-    diff_files = dir_comparison.diff_files
-    same_files = dir_comparison.same_files
+    left_only = sorted(entries1.keys() - entries2.keys())
+    right_only = sorted(entries2.keys() - entries1.keys())
+    common = sorted(entries1.keys() & entries2.keys())
+    common_dirs = [name for name in common if entries1[name].is_dir() and entries2[name].is_dir()]
+    diff_files = []
+    same_files = []
+
+    def files_equal(name):
+        with open(os.path.join(dir1, name), 'rb') as f1, open(os.path.join(dir2, name), 'rb') as f2:
+            # Sample the head and the tail first, so that most differing files are detected without reading them whole
+            head = f1.read(compare_sample_size)
+            if head != f2.read(compare_sample_size):
+                return False
+            if len(head) < compare_sample_size:
+                return True  # Both files (of the same size) were read whole
+            f1.seek(-compare_sample_size, os.SEEK_END)
+            f2.seek(-compare_sample_size, os.SEEK_END)
+            if f1.read(compare_sample_size) != f2.read(compare_sample_size):
+                return False
+            # The samples match, which does not prove equality: compare the remaining contents chunk by chunk
+            f1.seek(compare_sample_size)
+            f2.seek(compare_sample_size)
+            for chunk in iter(lambda: f1.read(1 << 20), b''):
+                if chunk != f2.read(len(chunk)):
+                    return False
+            return True
+
+    # Like 'filecmp', files with different sizes differ and files with the same size and mtime are identical,
+    # only the remaining ones are read, and they are compared concurrently
+    files_to_compare = []
+    for name in common:
+        if not (entries1[name].is_file() and entries2[name].is_file()):
+            continue
+        stat1, stat2 = entries1[name].stat(), entries2[name].stat()
+        if stat1.st_size != stat2.st_size:
+            diff_files.append(name)
+        elif stat1.st_mtime == stat2.st_mtime:
+            same_files.append(name)
+        else:
+            files_to_compare.append(name)
 
-    # Recursively compare common subdirectories
-    for sub_dir in dir_comparison.common_dirs:
+    if files_to_compare:
+        with ThreadPoolExecutor(max_workers=device_io_max_workers) as executor:
+            for name, equal in zip(files_to_compare, executor.map(files_equal, files_to_compare)):
+                (same_files if equal else diff_files).append(name)
+        diff_files.sort()
+        same_files.sort()
+
+    # Recursively compare common subdirectories, their results being relative to the compared directories
+    for sub_dir in common_dirs:
         sub_dir1 = os.path.join(dir1, sub_dir)
         sub_dir2 = os.path.join(dir2, sub_dir)
-        compare_directories(sub_dir1, sub_dir2)
+        sub_results = compare_directories(sub_dir1, sub_dir2)
+        for results, sub_dir_results in zip((left_only, right_only, diff_files, same_files), sub_results):
+            results.extend(os.path.join(sub_dir, name) for name in sub_dir_results)
 
     return left_only, right_only, diff_files, same_files
 
@@ -3961,8 +4864,10 @@ def list_directory_contents(directory_path):
     try:
         # List all files and directories in the specified path
         with os.scandir(directory_path) as entries:
-            for entry in entries:
-                print(entry.name)
+            names = [entry.name for entry in entries]
+        # Written at once rather than with one print (and flush, on a terminal) per entry
+        if names:
+            sys.stdout.write('\n'.join(names) + '\n')
     except FileNotFoundError:
         print(f"The directory {directory_path} does not exist.")
     except PermissionError:
@@ -3970,49 +4875,170 @@ def list_directory_contents(directory_path):
     except Exception as e:
         print(f"An error occurred: {e}")
 
-def get_templates():
+def get_shared_scope_manager():
     '''
-    Get the Templates from the AOS API.
+    Get a Scope_Manager shared by the AOS API helpers (catalogs, blueprints, devices, cabling maps...), instead of
+    building a new one on each call: each construction re-reads and rewrites the scope file and logs into AOS again.
+    The shared instance is rebuilt whenever the scope file changes (e.g. new scope or token) or gets older than
+    'shared_scope_manager_ttl' seconds.
 
     Returns:
-        dict: Template data if successful, otherwise an empty dictionary.
+        Scope_Manager: The shared scope manager.
     '''
-    try:
+    global shared_scope_manager
+
+    def get_scope_file_key():
+        try:
+            scope_file_stat = os.stat(scope_file_path)
+            return (scope_file_stat.st_mtime_ns, scope_file_stat.st_size)
+        except OSError:
+            return None
+
+    with shared_scope_manager_lock:
+        if shared_scope_manager is not None:
+            created_ts, cached_key, sm = shared_scope_manager
+            if cached_key == get_scope_file_key() and time.monotonic() - created_ts < shared_scope_manager_ttl:
+                return sm
+
         sm = Scope_Manager()
+        # Building the scope manager rewrites the scope file, so its key is taken afterwards
+        shared_scope_manager = (time.monotonic(), get_scope_file_key(), sm)
+        return sm
+
+def get_aos_catalog(catalog):
+    '''
+    Get all the objects of an AOS catalog (e.g. all the Templates) from the AOS API.
+    The result is memoized, so that repeated name to ID lookups are served from memory instead of fetching the catalog again.
+    Cached results expire after 'aos_catalog_cache_ttl' seconds, when an object of the catalog is deleted (its version
+    in 'aos_catalog_versions' changes) or when 'invalidate_aos_caches' is called. Empty results (returned on errors) are not cached.
+
+    Args:
+        catalog (str): Name of the catalog, one of the keys of 'aos_catalogs'.
+
+    Returns:
+        dict: Catalog data if successful, otherwise an empty dictionary.
+    '''
+    version = aos_catalog_versions.get(catalog, 0)
+    cached = aos_catalog_cache.get(catalog)
+    if cached is not None and cached[2] == version and time.monotonic() - cached[0] < aos_catalog_cache_ttl:
+        return cached[1]
+
+    api_path, _, object_label, _ = aos_catalogs[catalog]
+    try:
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/design/templates'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
+        url = f'https://{aos_ip}/api/{api_path}'
 
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=sm.get_aos_headers())
         response.raise_for_status()  # Raise error for any bad status code
-        return response.json()
+        data = response.json()
 
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Error: Failed to retrieve Templates - {e}")
+    except Exception as e:
+        logger.error(f"❌ Error: Failed to retrieve {object_label}s - {e}")
         return {}
 
-def get_rack_types():
+    if data:
+        aos_catalog_cache[catalog] = (time.monotonic(), data, version)
+    return data
+
+def get_aos_catalog_id(catalog, name):
     '''
-    Get the Rack Type from the AOS API.
+    Get the ID of an object of an AOS catalog from its name.
+    A name to ID index is built once per fetched catalog (the memoized data object) for constant-time lookups.
+
+    Args:
+        catalog (str): Name of the catalog, one of the keys of 'aos_catalogs'.
+        name (str): Name of the object ('display_name' or 'label', depending on the catalog).
 
     Returns:
-        dict: Rack Type data if successful, otherwise an empty dictionary.
+        str: Object ID, or None if not found or an error occurs. When several objects share a name, the first one is kept.
     '''
+    _, name_key, object_label, _ = aos_catalogs[catalog]
     try:
-        sm = Scope_Manager()
+        data = get_aos_catalog(catalog)
+        cached = aos_catalog_index_cache.get(catalog)
+        if cached is None or cached[0] is not data:
+            index = {}
+            for item in data.get('items', []):
+                index.setdefault(item.get(name_key), item.get('id'))
+            cached = (data, index)
+            aos_catalog_index_cache[catalog] = cached
+        return cached[1].get(name)
+
+    except Exception as e:
+        logger.error(f"❌ Error: Failed to retrieve {object_label} ID for '{name}' - {e}")
+        return None
+
+def delete_aos_catalog_item(catalog, item_id, sm=None):
+    '''
+    Delete an object of an AOS catalog by its ID.
+
+    Args:
+        catalog (str): Name of the catalog, one of the keys of 'aos_catalogs'.
+        item_id (str): Object ID.
+        sm (Scope_Manager, optional): Scope manager whose AOS session is reused (useful when deleting concurrently). Defaults to the shared one.
+
+    Returns:
+        bool: True if deleted successfully (with the status code expected for the catalog), False otherwise.
+    '''
+    api_path, _, object_label, deleted_status_code = aos_catalogs[catalog]
+    try:
+        sm = sm or get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/design/rack-types'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
+        url = f'https://{aos_ip}/api/{api_path}/{item_id}'
 
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().delete(url, headers=sm.get_aos_headers())
         response.raise_for_status()  # Raise error for any bad status code
-        return response.json()
 
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Error: Failed to retrieve Rack Type - {e}")
-        return {}
+        deleted = response.status_code == deleted_status_code
+        if deleted:
+            invalidate_aos_catalog(catalog)
+        return deleted
+
+    except Exception as e:
+        logger.error(f"❌ Error: Failed to delete {object_label} - {e}")
+        return False
+
+def invalidate_aos_catalog(catalog):
+    '''
+    Mark a memoized AOS catalog (and its name index) as stale, e.g. after one of its objects was deleted, by bumping its version.
+    It is fetched again on next use, while the other catalogs stay cached.
+
+    Args:
+        catalog (str): Name of the catalog, one of the keys of 'aos_catalogs'.
+
+    Returns:
+        None
+    '''
+    aos_catalog_versions[catalog] = aos_catalog_versions.get(catalog, 0) + 1
+
+def invalidate_aos_caches():
+    '''
+    Drop all the AOS catalogs memoized by 'get_aos_catalog' (and their name indexes), e.g. after objects were created or deleted.
+
+    Returns:
+        None
+    '''
+    aos_catalog_cache.clear()
+    aos_catalog_index_cache.clear()
+
+def get_templates():
+    '''
+    Get the Templates from the AOS API.
+
+    Returns:
+        dict: Template data if successful, otherwise an empty dictionary.
+    '''
+    return get_aos_catalog('templates')
+
+def get_rack_types():
+    '''
+    Get the Rack Type from the AOS API.
+
+    Returns:
+        dict: Rack Type data if successful, otherwise an empty dictionary.
+    '''
+    return get_aos_catalog('rack_types')
 
 def get_logical_devices():
     '''
@@ -4021,20 +5047,7 @@ def get_logical_devices():
     Returns:
         dict: Logical Device data if successful, otherwise an empty dictionary.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/design/logical-devices'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.get(url, headers=headers, verify=False)
-        response.raise_for_status()  # Raise error for any bad status code
-        return response.json()
-
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Error: Failed to retrieve Logical Devices - {e}")
-        return {}
+    return get_aos_catalog('logical_devices')
 
 def get_interface_maps():
     '''
@@ -4043,20 +5056,7 @@ def get_interface_maps():
     Returns:
         dict: Interface Map data if successful, otherwise an empty dictionary.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/design/interface-maps'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.get(url, headers=headers, verify=False)
-        response.raise_for_status()  # Raise error for any bad status code
-        return response.json()
-
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Error: Failed to retrieve Interface Maps - {e}")
-        return {}
+    return get_aos_catalog('interface_maps')
 
 def get_property_sets():
     '''
@@ -4065,19 +5065,7 @@ def get_property_sets():
     Returns:
         dict: Property-set data if successful, otherwise an empty dictionary.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/property-sets'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-        response = requests.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        return response.json()
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve property-sets - {e}")
-        return {}
+    return get_aos_catalog('property_sets')
 
 def get_configlets():
     '''
@@ -4086,20 +5074,7 @@ def get_configlets():
     Returns:
         dict: Configlet data if successful, otherwise an empty dictionary.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/design/configlets'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.get(url, headers=headers, verify=False)
-        response.raise_for_status()  # Raises HTTPError for bad responses (4xx, 5xx)
-        return response.json()
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve configlets - {e}")
-        return {}
+    return get_aos_catalog('configlets')
 
 def get_ip_pools():
     '''
@@ -4108,20 +5083,7 @@ def get_ip_pools():
     Returns:
         dict: IP Pool data if successful, otherwise an empty dictionary.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/resources/ip-pools'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.get(url, headers=headers, verify=False)
-        response.raise_for_status()  # Will raise HTTPError for bad responses (4xx, 5xx)
-        return response.json()
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve IP Pools - {e}")
-        return {}
+    return get_aos_catalog('ip_pools')
 
 def get_ipv6_pools():
     '''
@@ -4130,20 +5092,7 @@ def get_ipv6_pools():
     Returns:
         dict: IPv6 Pool data if successful, otherwise an empty dictionary.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/resources/ipv6-pools'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.get(url, headers=headers, verify=False)
-        response.raise_for_status()  # Will raise HTTPError for bad responses (4xx, 5xx)
-        return response.json()
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve IPv6 Pools - {e}")
-        return {}
+    return get_aos_catalog('ipv6_pools')
 
 def get_vni_pools():
     '''
@@ -4152,20 +5101,7 @@ def get_vni_pools():
     Returns:
         dict: VNI Pool data if successful, otherwise an empty dictionary.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/resources/vni-pools'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.get(url, headers=headers, verify=False)
-        response.raise_for_status()  # Raise error for any bad status code
-        return response.json()
-
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Error: Failed to retrieve VNI Pools - {e}")
-        return {}
+    return get_aos_catalog('vni_pools')
 
 def get_asn_pools():
     '''
@@ -4174,20 +5110,7 @@ def get_asn_pools():
     Returns:
         dict: ASN Pool data if successful, otherwise an empty dictionary.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/resources/asn-pools'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.get(url, headers=headers, verify=False)
-        response.raise_for_status()  # Raise error for any bad status code
-        return response.json()
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve ASN Pools - {e}")
-        return {}
+    return get_aos_catalog('asn_pools')
 
 def get_template_id(template_name):
     '''
@@ -4199,16 +5122,7 @@ def get_template_id(template_name):
     Returns:
         str: Template ID, or None if not found or an error occurs.
     '''
-    try:
-        data = get_templates()
-        for item in data.get('items', []):
-            if item.get('display_name') == template_name:
-                return item.get('id')
-        return None
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve Template ID for '{template_name}' - {e}")
-        return None
+    return get_aos_catalog_id('templates', template_name)
 
 def get_rack_type_id(rack_type_name):
     '''
@@ -4220,16 +5134,7 @@ def get_rack_type_id(rack_type_name):
     Returns:
         str: Rack Type ID, or None if not found or an error occurs.
     '''
-    try:
-        data = get_rack_types()
-        for item in data.get('items', []):
-            if item.get('display_name') == rack_type_name:
-                return item.get('id')
-        return None
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve Rack Type ID for '{rack_type_name}' - {e}")
-        return None
+    return get_aos_catalog_id('rack_types', rack_type_name)
 
 def get_logical_device_id(logical_device_name):
     '''
@@ -4241,16 +5146,7 @@ def get_logical_device_id(logical_device_name):
     Returns:
         str: Logical Device ID, or None if not found or an error occurs.
     '''
-    try:
-        data = get_logical_devices()
-        for item in data.get('items', []):
-            if item.get('display_name') == logical_device_name:
-                return item.get('id')
-        return None
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve Logical Device ID for '{logical_device_name}' - {e}")
-        return None
+    return get_aos_catalog_id('logical_devices', logical_device_name)
 
 def get_interface_map_id(interface_map_name):
     '''
@@ -4262,16 +5158,7 @@ def get_interface_map_id(interface_map_name):
     Returns:
         str: Interface Map ID, or None if not found or an error occurs.
     '''
-    try:
-        data = get_interface_maps()
-        for item in data.get('items', []):
-            if item.get('label') == interface_map_name:
-                return item.get('id')
-        return None
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve Interface Map ID for '{interface_map_name}' - {e}")
-        return None
+    return get_aos_catalog_id('interface_maps', interface_map_name)
 
 def get_property_set_id(property_set_name):
     '''
@@ -4283,16 +5170,7 @@ def get_property_set_id(property_set_name):
     Returns:
         str: Property Set ID, or None if not found or an error occurs.
     '''
-    try:
-        data = get_property_sets()
-        for item in data.get('items', []):
-            if item.get('label') == property_set_name:
-                return item.get('id')
-        return None
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve Property Set ID for '{property_set_name}' - {e}")
-        return None
+    return get_aos_catalog_id('property_sets', property_set_name)
 
 def get_configlet_id(configlet_name):
     '''
@@ -4304,16 +5182,7 @@ def get_configlet_id(configlet_name):
     Returns:
         str: Configlet ID, or None if not found or an error occurs.
     '''
-    try:
-        data = get_configlets()
-        for item in data.get('items', []):
-            if item.get('display_name') == configlet_name:
-                return item.get('id')
-        return None
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve Configlet ID for '{configlet_name}' - {e}")
-        return None
+    return get_aos_catalog_id('configlets', configlet_name)
 
 def get_ip_pool_id(ip_pool_name):
     '''
@@ -4325,16 +5194,7 @@ def get_ip_pool_id(ip_pool_name):
     Returns:
         str: IP Pool ID, or None if not found or an error occurs.
     '''
-    try:
-        data = get_ip_pools()
-        for item in data.get('items', []):
-            if item.get('display_name') == ip_pool_name:
-                return item.get('id')
-        return None
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve IP Pool ID for '{ip_pool_name}' - {e}")
-        return None
+    return get_aos_catalog_id('ip_pools', ip_pool_name)
 
 def get_ipv6_pool_id(ipv6_pool_name):
     '''
@@ -4346,17 +5206,8 @@ def get_ipv6_pool_id(ipv6_pool_name):
     Returns:
         str: IP Pool ID, or None if not found or an error occurs.
     '''
-    try:
-        data = get_ipv6_pools()
-        for item in data.get('items', []):
-            if item.get('display_name') == ipv6_pool_name:
-                return item.get('id')
-        return None
+    return get_aos_catalog_id('ipv6_pools', ipv6_pool_name)
 
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve IPv6 Pool ID for '{ipv6_pool_name}' - {e}")
-        return None
-    
 def get_vni_pool_id(vni_pool_name):
     '''
     Get the VNI Pool ID from the AOS API for a given VNI Pool.
@@ -4367,16 +5218,7 @@ def get_vni_pool_id(vni_pool_name):
     Returns:
         str: VNI Pool ID, or None if not found or an error occurs.
     '''
-    try:
-        data = get_vni_pools()
-        for item in data.get('items', []):
-            if item.get('display_name') == vni_pool_name:
-                return item.get('id')
-        return None
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve VNI Pool ID for '{vni_pool_name}' - {e}")
-        return None
+    return get_aos_catalog_id('vni_pools', vni_pool_name)
 
 def get_asn_pool_id(asn_pool_name):
     '''
@@ -4388,253 +5230,137 @@ def get_asn_pool_id(asn_pool_name):
     Returns:
         str: ASN Pool ID, or None if not found or an error occurs.
     '''
-    try:
-        data = get_asn_pools()
-        for item in data.get('items', []):
-            if item.get('display_name') == asn_pool_name:
-                return item.get('id')
-        return None
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to retrieve ASN Pool ID for '{asn_pool_name}' - {e}")
-        return None
+    return get_aos_catalog_id('asn_pools', asn_pool_name)
 
-def delete_template(template_id):
+def delete_template(template_id, sm=None):
     '''
     Delete a template by its ID.
 
     Args:
         template_id (str): Template ID.
+        sm (Scope_Manager, optional): Scope manager whose AOS session is reused (useful when deleting concurrently). Defaults to the shared one.
 
     Returns:
         bool: True if deleted successfully, False otherwise.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/design/templates/{template_id}'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.delete(url, headers=headers, verify=False)
-        response.raise_for_status()  # Raise error for any bad status code
-
-        return response.status_code == 204
-
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Error: Failed to delete Template - {e}")
-        return False
+    return delete_aos_catalog_item('templates', template_id, sm)
 
-def delete_rack_type(rack_type_id):
+def delete_rack_type(rack_type_id, sm=None):
     '''
     Delete a rack_type by its ID.
 
     Args:
         rack_type_id (str): Rack Type ID.
+        sm (Scope_Manager, optional): Scope manager whose AOS session is reused (useful when deleting concurrently). Defaults to the shared one.
 
     Returns:
         bool: True if deleted successfully, False otherwise.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/design/rack-types/{rack_type_id}'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.delete(url, headers=headers, verify=False)
-        response.raise_for_status()  # Raise error for any bad status code
+    return delete_aos_catalog_item('rack_types', rack_type_id, sm)
 
-        return response.status_code == 204
-
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Error: Failed to delete Rack Type - {e}")
-        return False
-
-def delete_logical_device(logical_device_id):
+def delete_logical_device(logical_device_id, sm=None):
     '''
     Delete a logical_device by its ID.
 
     Args:
         logical_device_id (str): Logical Device ID.
+        sm (Scope_Manager, optional): Scope manager whose AOS session is reused (useful when deleting concurrently). Defaults to the shared one.
 
     Returns:
         bool: True if deleted successfully, False otherwise.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/design/logical-devices/{logical_device_id}'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.delete(url, headers=headers, verify=False)
-        response.raise_for_status()  # Raise error for any bad status code
-
-        return response.status_code == 200
-
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Error: Failed to delete Logical Device - {e}")
-        return False
+    return delete_aos_catalog_item('logical_devices', logical_device_id, sm)
 
-def delete_interface_map(interface_map_id):
+def delete_interface_map(interface_map_id, sm=None):
     '''
     Delete a interface_map by its ID.
 
     Args:
         interface_map_id (str): Interface Map ID.
+        sm (Scope_Manager, optional): Scope manager whose AOS session is reused (useful when deleting concurrently). Defaults to the shared one.
 
     Returns:
         bool: True if deleted successfully, False otherwise.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/design/interface-maps/{interface_map_id}'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.delete(url, headers=headers, verify=False)
-        response.raise_for_status()  # Raise error for any bad status code
-
-        return response.status_code == 200
+    return delete_aos_catalog_item('interface_maps', interface_map_id, sm)
 
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Error: Failed to delete Interface Map - {e}")
-        return False
-
-def delete_property_set(property_set_id):
+def delete_property_set(property_set_id, sm=None):
     '''
     Delete a property-set by its ID.
 
     Args:
         property_set_id (str): Property-set ID.
+        sm (Scope_Manager, optional): Scope manager whose AOS session is reused (useful when deleting concurrently). Defaults to the shared one.
 
     Returns:
         bool: True if the property set was deleted successfully (status code 204), False otherwise.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/property-sets/{property_set_id}'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
+    return delete_aos_catalog_item('property_sets', property_set_id, sm)
 
-        response = requests.delete(url, headers=headers, verify=False)
-
-        if response.status_code == 204:
-            return True
-        else:
-            response.raise_for_status()  # Raise an HTTPError for bad responses (4xx, 5xx)
-
-    except Exception as e:
-        logger.error(f"❌ Error: Failed to delete Property Set - {e}")
-        return None
-
-def delete_configlet(configlet_id):
+def delete_configlet(configlet_id, sm=None):
     '''
     Delete a configlet by its ID.
 
     Args:
         configlet_id (str): Configlet ID.
+        sm (Scope_Manager, optional): Scope manager whose AOS session is reused (useful when deleting concurrently). Defaults to the shared one.
 
     Returns:
         bool: True if the configlet is successfully deleted, False otherwise.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/design/configlets/{configlet_id}'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.delete(url, headers=headers, verify=False)
-        response.raise_for_status()  # Raises an HTTPError for bad responses (4xx, 5xx)
-
-        if response.status_code == 204:
-            # logger.info(f"✅ Configlet with ID '{configlet_id}' successfully deleted.")
-            return True
-        else:
-            return False
-
-    except Exception as e:
-        logger.error(f'❌ Error: Failed to delete configlet - {e}')
+    return delete_aos_catalog_item('configlets', configlet_id, sm)
 
-def delete_ip_pool(ip_pool_id):
+def delete_ip_pool(ip_pool_id, sm=None):
     '''
     Delete an IP Pool by its ID.
 
     Args:
         ip_pool_id (str): IP Pool ID.
+        sm (Scope_Manager, optional): Scope manager whose AOS session is reused (useful when deleting concurrently). Defaults to the shared one.
 
     Returns:
         bool: True if deleted successfully, False otherwise.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/resources/ip-pools/{ip_pool_id}'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
+    return delete_aos_catalog_item('ip_pools', ip_pool_id, sm)
 
-        response = requests.delete(url, headers=headers, verify=False)
-        response.raise_for_status()  # Raise error for any bad status code
+def delete_ipv6_pool(ipv6_pool_id, sm=None):
+    '''
+    Delete an IPv6 Pool by its ID.
 
-        return response.status_code == 202
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Error: Failed to delete IP Pool - {e}")
-        return False
+    Args:
+        ipv6_pool_id (str): IPv6 Pool ID.
+        sm (Scope_Manager, optional): Scope manager whose AOS session is reused (useful when deleting concurrently). Defaults to the shared one.
+
+    Returns:
+        bool: True if deleted successfully, False otherwise.
+    '''
+    return delete_aos_catalog_item('ipv6_pools', ipv6_pool_id, sm)
 
-def delete_vni_pool(vni_pool_id):
+def delete_vni_pool(vni_pool_id, sm=None):
     '''
     Delete a vni_pool by its ID.
 
     Args:
         vni_pool_id (str): VNI Pool ID.
+        sm (Scope_Manager, optional): Scope manager whose AOS session is reused (useful when deleting concurrently). Defaults to the shared one.
 
     Returns:
         bool: True if deleted successfully, False otherwise.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/resources/vni-pools/{vni_pool_id}'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.delete(url, headers=headers, verify=False)
-        response.raise_for_status()  # Raise error for any bad status code
+    return delete_aos_catalog_item('vni_pools', vni_pool_id, sm)
 
-        return response.status_code == 202
-
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Error: Failed to delete VNI Pool - {e}")
-        return False
-
-def delete_asn_pool(asn_pool_id):
+def delete_asn_pool(asn_pool_id, sm=None):
     '''
     Delete an ASN Pool by its ID.
 
     Args:
         asn_pool_id (str): ASN Pool ID.
+        sm (Scope_Manager, optional): Scope manager whose AOS session is reused (useful when deleting concurrently). Defaults to the shared one.
 
     Returns:
         bool: True if deleted successfully, False otherwise.
     '''
-    try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/resources/asn-pools/{asn_pool_id}'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.delete(url, headers=headers, verify=False)
-        response.raise_for_status()  # Raise error for any bad status code
-
-        return response.status_code == 202
-    except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Error: Failed to delete ASN Pool - {e}")
-        return False
+    return delete_aos_catalog_item('asn_pools', asn_pool_id, sm)
 
 def remove_non_bp_added(input_diff):
     '''
@@ -4654,7 +5380,11 @@ def remove_non_bp_added(input_diff):
         print("\n")
         logger.info("🗑️  Initiating the cleanup process for objects created in Design/Resources in this execution...")
 
-        interface_maps_to_remove = []  # Store interface maps to ensure they are removed first
+        # The catalogs may have changed since they were cached (e.g. by Terraform), so they are fetched again once
+        invalidate_aos_caches()
+
+        # Names of the objects to remove, per (menu, Apstra object)
+        objects_to_remove = {}
 
         for menu, apstra_objects in input_diff.items():
             for apstra_object, change_types in apstra_objects.items():
@@ -4662,87 +5392,58 @@ def remove_non_bp_added(input_diff):
                 changed_list = change_types.get('changed', [])
 
                 if added_list:
-
                     for added in added_list:
                         added_name = added.get('name', None)
                         if added_name:
-                            if menu == 'design':
-                                if apstra_object == 'interface_maps':
-                                    interface_maps_to_remove.append(added_name)  # Store interface maps first
+                            objects_to_remove.setdefault((menu, apstra_object), []).append(added_name)
 
-        # First, remove all interface_maps before logical_devices
-        for interface_map_name in interface_maps_to_remove:
-            interface_map_id = get_interface_map_id(interface_map_name)
-            if delete_interface_map(interface_map_id):
-                logger.info(f'🚮 Removed from Apstra via API: design -> interface_maps -> {interface_map_name}')
+                elif changed_list and apstra_object == 'configlet_contents':
+                    # Configlets which contents have changed in Design are removed as well
+                    objects_to_remove.setdefault((menu, apstra_object), []).extend(d["name"] for d in changed_list if "name" in d)
 
-        # Now, process the remaining objects
-        for menu, apstra_objects in input_diff.items():
-            for apstra_object, change_types in apstra_objects.items():
-                added_list = change_types.get('added', [])
-                changed_list = change_types.get('changed', [])
+        sm = get_shared_scope_manager()
 
-                if added_list:
-                    for added in added_list:
-                        added_name = added.get('name', None)
-                        if added_name:
-                            if menu == 'design':
-                                if apstra_object == 'templates':
-                                    template_id = get_template_id(added_name)
-                                    if delete_template(template_id):
-                                        logger.info(f'🚮 Removed from Apstra via API: {menu} -> {apstra_object} -> {added_name}')
-                                elif apstra_object == 'racks':
-                                    rack_type_id = get_rack_type_id(added_name)
-                                    if delete_rack_type(rack_type_id):
-                                        logger.info(f'🚮 Removed from Apstra via API: {menu} -> {apstra_object} -> {added_name}')
-                                elif apstra_object == 'logical_devices':  # Safe to delete after deleting interface_maps
-                                    logical_device_id = get_logical_device_id(added_name)
-                                    if delete_logical_device(logical_device_id):
-                                        logger.info(f'🚮 Removed from Apstra via API: {menu} -> {apstra_object} -> {added_name}')
-                                elif apstra_object == 'configlets':
-                                    configlet_id = get_configlet_id(added_name)
-                                    if delete_configlet(configlet_id):
-                                        logger.info(f'🚮 Removed from Apstra via API: {menu} -> {apstra_object} -> {added_name}')
-                                elif apstra_object == 'property_sets':
-                                    property_set_id = get_property_set_id(added_name)
-                                    if delete_property_set(property_set_id):
-                                        logger.info(f'🚮 Removed from Apstra via API: {menu} -> {apstra_object} -> {added_name}')
-                            elif menu == 'resources':
-                                if apstra_object == 'ipv4_pools':
-                                    ip_pool_id = get_ip_pool_id(added_name)
-                                    if delete_ip_pool(ip_pool_id):
-                                        logger.info(f'🚮 Removed from Apstra via API: {menu} -> {apstra_object} -> {added_name}')
-                                elif apstra_object == 'ipv6_pools':
-                                    ipv6_pool_id = get_ipv6_pool_id(added_name)
-                                    if delete_ipv6_pool(ipv6_pool_id):
-                                        logger.info(f'🚮 Removed from Apstra via API: {menu} -> {apstra_object} -> {added_name}')
-                                elif apstra_object == 'vni_pools':
-                                    vni_pool_id = get_vni_pool_id(added_name)
-                                    if delete_vni_pool(vni_pool_id):
-                                        logger.info(f'🚮 Removed from Apstra via API: {menu} -> {apstra_object} -> {added_name}')
-                                elif apstra_object == 'asn_pools':
-                                    asn_pool_id = get_asn_pool_id(added_name)
-                                    if delete_asn_pool(asn_pool_id):
-                                        logger.info(f'🚮 Removed from Apstra via API: {menu} -> {apstra_object} -> {added_name}')
+        # The objects of a tier are independent from each other and are removed concurrently, but a tier is only
+        # processed once the previous one is done: interface_maps and templates reference logical_devices and racks
+        for removal_tier in non_bp_removal_tiers:
+            tier_objects = [(menu, apstra_object) for menu, apstra_object in removal_tier if objects_to_remove.get((menu, apstra_object))]
+            if not tier_objects:
+                continue
 
-                elif changed_list and apstra_object == 'configlet_contents':
-                    print("\n")
-                    logger.info("🗑️  Removing configlets which contents have changed in Design:")
-                    for configlet_name in [d["name"] for d in changed_list if "name" in d]:
-                        configlet_id = get_configlet_id(configlet_name)
-                        if delete_configlet(configlet_id):
-                            logger.info(f'🚮 Removed from Apstra via API: {menu} -> {apstra_object} -> {configlet_name}')
+            with ThreadPoolExecutor(max_workers=aos_api_max_workers) as executor:
+                # The catalogs of the tier are fetched concurrently (once each), then the IDs are resolved from memory
+                list(executor.map(get_aos_catalog, {non_bp_removal_catalogs[apstra_object] for _, apstra_object in tier_objects}))
+
+                removals = []
+                for menu, apstra_object in tier_objects:
+                    if apstra_object == 'configlet_contents':
+                        print("\n")
+                        logger.info("🗑️  Removing configlets which contents have changed in Design:")
+                    catalog = non_bp_removal_catalogs[apstra_object]
+                    removals.extend(
+                        (menu, apstra_object, name, catalog, get_aos_catalog_id(catalog, name))
+                        for name in objects_to_remove[(menu, apstra_object)]
+                    )
+
+                results = list(executor.map(lambda removal: delete_aos_catalog_item(removal[3], removal[4], sm), removals))
+
+            for (menu, apstra_object, name, _, _), removed in zip(removals, results):
+                if removed:
+                    logger.info(f'🚮 Removed from Apstra via API: {menu} -> {apstra_object} -> {name}')
 
     except Exception as e:
         logger.error(f"❌ Error removing Apstra objects: {e}")
+    finally:
+        # Do not serve the objects removed above from the cached catalogs
+        invalidate_aos_caches()
 
 def revert_apstra_config_except_blueprints(current_tgz, previous_tgz):
     '''
     Roll back the configuration of the Apstra sections other than blueprints.
 
-    This function untars the provided current and previous tgz files,
-    and for each section ('resources' and 'design'), compares their YAML files
-    and performs the necessary rollback actions.
+    This function reads the YAML files of each section ('resources' and 'design') straight from
+    the provided current and previous tgz files (without extracting them to disk),
+    compares them and performs the necessary rollback actions.
 
     Args:
         current_tgz (str): Path to the current tgz file.
@@ -4752,46 +5453,21 @@ def revert_apstra_config_except_blueprints(current_tgz, previous_tgz):
         None
     '''
 
-    current_dir = tempfile.mkdtemp()
-    previous_dir = tempfile.mkdtemp()
-
-    try:
-        extract_tgz_to_dir(current_tgz, current_dir)
-
-        if not extract_tgz_to_dir(previous_tgz, previous_dir):
-            logger.warning(f"📝 {previous_tgz} not found. Creating temporary empty YAML files instead.")
+    menu_members = {menu: f"input/{menu}/{menu}.yml" for menu in non_blueprint_menus}
 
-            for menu in non_blueprint_menus:
-                empty_yaml_path = os.path.join(previous_dir, "input", menu, f"{menu}.yml")
-                os.makedirs(os.path.dirname(empty_yaml_path), exist_ok=True)
-                with open(empty_yaml_path, "w") as f:
-                    pass  # Creates an empty YAML file
+    current_members = read_tgz_members(current_tgz, menu_members.values()) or {}
+    previous_members = read_tgz_members(previous_tgz, menu_members.values())
 
-        for menu in non_blueprint_menus:
-            current_yaml = os.path.join(current_dir, "input", menu, f"{menu}.yml")
-            previous_yaml = os.path.join(previous_dir, "input", menu, f"{menu}.yml")
-
-            # print("*** CURRENT ***")
-            # print(current_yaml)
-            # with open(current_yaml, 'r') as file:
-            #     contents = yaml.safe_load(file)
-            #     print(yaml.dump(contents, default_flow_style=False))
+    if previous_members is None:
+        logger.warning(f"📝 {previous_tgz} not found. Using empty YAML contents instead.")
+        previous_members = {member_name: b'' for member_name in menu_members.values()}
 
-            # print("*** PREVIOUS ***")
-            # print(os.path.exists(current_yaml))
-            # print(previous_yaml)
-            # with open(previous_yaml, 'r') as file:
-            #     contents = yaml.safe_load(file)
-            #     print(yaml.dump(contents, default_flow_style=False))
-            # print(os.path.exists(previous_yaml))
+    for menu, member_name in menu_members.items():
+        current_yaml = current_members.get(member_name)
+        previous_yaml = previous_members.get(member_name)
 
-            if os.path.exists(current_yaml) and os.path.exists(previous_yaml):
-                compare_yaml(current_yaml, previous_yaml)
-
-    finally:
-        # Cleanup directories safely
-        for directory in [current_dir, previous_dir]:
-            remove_directory(directory)
+        if current_yaml is not None and previous_yaml is not None:
+            compare_yaml(current_yaml, previous_yaml)
 
 def filter_none_values(input_data):
     '''
@@ -4815,6 +5491,7 @@ def filter_none_values(input_data):
 def yamldecode(file_path):
     '''
     Decode a YAML file and return its contents as a dictionary.
+    The parsed file is cached while unchanged (see 'load_file_cached'), and a copy is returned since callers may modify it.
 
     Args:
         file_path (str): Path to the YAML file.
@@ -4823,8 +5500,7 @@ def yamldecode(file_path):
         dict: Contents of the YAML file as a dictionary or an empty dictionary if an error occurs.
     '''
     try:
-        with open(file_path, 'r') as file:
-            return yaml.safe_load(file) or {}  # Return an empty dict if YAML is empty
+        return copy.deepcopy(load_file_cached(file_path, load_yaml_file)) or {}  # Return an empty dict if YAML is empty
     except FileNotFoundError:
         logger.error(f"❌ Error: The file '{file_path}' was not found.")
     except yaml.YAMLError as e:
@@ -4850,9 +5526,7 @@ def merge_yaml_files(*args):
             if isinstance(arg, dict):
                 merged_yaml += yaml.dump(arg, Dumper=NoAliasDumper)
             elif isinstance(arg, str):
-                with open(arg, 'r') as file:
-                    for line in file:
-                        merged_yaml += line
+                merged_yaml += load_file_cached(arg, load_text_file)
     except Exception as e:
         raise ValueError(f'Error occurred while merging YAML files: {e}')
     return merged_yaml
@@ -4872,8 +5546,9 @@ def json2yaml(file_json, file_yaml):
         with open(file_json, 'r') as inp:
             jsonData = json.load(inp)
             # print(jsonData)
-        with open(file_yaml, 'w') as outp:
-            yaml.safe_dump(jsonData, outp, default_flow_style=False)
+        # Non-ASCII characters are written as is (instead of escaped), with the same key order as the YAML raw snapshots
+        with open(file_yaml, 'w', encoding='utf-8', buffering=output_file_buffer_size) as outp:
+            yaml.dump(jsonData, outp, Dumper=YamlSafeDumper, default_flow_style=False, allow_unicode=True)
         return True
     except Exception as e:
         logger.error(f'❌ Error: Failed to convert JSON to YAML - {e}')
@@ -4891,9 +5566,10 @@ def yaml2json(file_yaml, file_json):
         bool: True if the conversion was successful. False otherwise.
     '''
     try:
-        with open(file_yaml, 'r') as inp:
-            yamlData = yaml.safe_load(inp)
+        with open(file_yaml, 'rb') as inp:
+            yamlData = yaml.load(inp, Loader=YamlSafeLoader)
             # print(yamlData)
+        # ASCII-escaped JSON: the file is read back as text and uploaded as a str body (encoded as latin-1 by http.client)
         with open(file_json, 'w') as outp:
             json.dump(yamlData, outp, indent=4)
         return True
@@ -4964,10 +5640,7 @@ def get_design_switch_name(blueprint_device_name, blueprint_data):
         str or None: The design device name corresponding to the provided blueprint device name, or None if not found.
     '''
     try:
-        for switch in blueprint_data['switches']:
-            if switch['blueprint_device_name'].upper() == blueprint_device_name.upper():
-                initial_device_name = switch['initial_device_name']
-        return initial_device_name
+        return get_switch_name_indexes(blueprint_data)[1].get(blueprint_device_name.upper())
     except:
         return None
 
@@ -4983,14 +5656,37 @@ def get_blueprint_switch_name(initial_device_name, blueprint_data):
         str or None: The blueprint device name corresponding to the provided design device name, or None if not found.
     '''
     try:
-        for switch in blueprint_data['switches']:
-            if switch['initial_device_name'].upper() == initial_device_name.upper():
-                blueprint_device_name = switch['blueprint_device_name']
-        return blueprint_device_name
-
+        return get_switch_name_indexes(blueprint_data)[0].get(initial_device_name.upper())
     except:
         return None
 
+def get_switch_name_indexes(blueprint_data):
+    '''
+    Build the indexes between the design and blueprint device names of the switches of a blueprint, for constant-time lookups.
+    The indexes are built once per switches list (the same object, with the same length) and reused by the following calls.
+
+    Args:
+        blueprint_data (dict): The blueprint data obtained from decoding the blueprint yaml file.
+
+    Returns:
+        tuple: ({design device name (upper case): blueprint device name}, {blueprint device name (upper case): design device name}).
+               When several switches share a name, the last one is kept (as the former linear scans did).
+    '''
+    switches = blueprint_data['switches']
+    cached = switch_name_index_cache.get('indexes')
+    if cached is not None and cached[0] is switches and cached[1] == len(switches):
+        return cached[2]
+
+    initial_to_blueprint = {}
+    blueprint_to_initial = {}
+    for switch in switches:
+        initial_to_blueprint[switch['initial_device_name'].upper()] = switch['blueprint_device_name']
+        blueprint_to_initial[switch['blueprint_device_name'].upper()] = switch['initial_device_name']
+
+    indexes = (initial_to_blueprint, blueprint_to_initial)
+    switch_name_index_cache['indexes'] = (switches, len(switches), indexes)
+    return indexes
+
 def get_aos_variables(data, target_value):
     '''
     Extracts specific variables from a dictionary for a given target value.
@@ -5048,6 +5744,24 @@ def get_terraform_command(input_params):
         logger.error(f"❌ An unexpected error occurred while retrieving the Terraform command: {e}")
         sys.exit(1)
 
+def get_terraform_action(terraform_command):
+    '''
+    Extract the Terraform action (subcommand) from a Terraform command string.
+
+    Args:
+        terraform_command (str): The Terraform command (e.g., 'terraform apply -auto-approve').
+
+    Returns:
+        str: The Terraform action (e.g., 'apply', 'destroy', 'plan'), or an empty string if it cannot be determined.
+    '''
+    try:
+        command_args = shlex.split(terraform_command)
+        if len(command_args) > 1 and command_args[0] == 'terraform':
+            return command_args[1]
+    except Exception as e:
+        logger.error(f"❌ Unable to parse the Terraform command '{terraform_command}': {e}")
+    return ''
+
 def build_table_deploy(terraform_command, uncommitted_bps, action, commit_comment, stage, non_bp_menus_w_changes=None):
     '''
     Display the deployment information in a table format
@@ -5255,7 +5969,7 @@ def get_aos_token ():
     - str: Authentication token for AOS API.
     '''
     try:
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_username = sm.get('aos_username')
         aos_password = sm.get('aos_password')
@@ -5263,7 +5977,7 @@ def get_aos_token ():
         # url = f'https://{aos_ip}/api/user/login'
         data = json.dumps({"username": aos_username, "password": aos_password})
         headers = {'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-        response = requests.post(url, data=data, headers=headers, verify=False)
+        response = sm.get_aos_session().post(url, data=data, headers=headers)
         response.raise_for_status()
         return response.json()['token']
     except Exception as e:
@@ -5280,19 +5994,13 @@ def get_bp_id(bp_name):
         str: Blueprint ID.
     '''
     try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/blueprints'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-        response = requests.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        data = response.json()
-        if 'items' in data and isinstance(data['items'], list) and data['items']:
-            for item in data['items']:
-                if item['label'] == bp_name:
-                    return item['id']
-        return None
+        # The list of blueprints is memoized, so repeated lookups do not fetch it again
+        bp_id = get_aos_catalog_id('blueprints', bp_name)
+        if bp_id is None:
+            # The blueprint may have been created after the list was cached: look it up again in a fresh list
+            invalidate_aos_catalog('blueprints')
+            bp_id = get_aos_catalog_id('blueprints', bp_name)
+        return bp_id
     except Exception as e:
         logger.error(f'❌ Error: Failed to retrieve blueprint ID - {e}')
         return None
@@ -5308,17 +6016,13 @@ def get_bp_name(bp_id):
         str: Blueprint ID.
     '''
     try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        url = f'https://{aos_ip}/api/blueprints'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-        response = requests.get(url, headers=headers, verify=False)
-        response.raise_for_status()
-        data = response.json()
-        for item in data['items']:
-            if item['id'] == bp_id:
-                return item['label']
+        # The list of blueprints is memoized, and looked up again in a fresh list if the blueprint is not found
+        for refresh in (False, True):
+            if refresh:
+                invalidate_aos_catalog('blueprints')
+            for item in get_aos_catalog('blueprints').get('items', []):
+                if item['id'] == bp_id:
+                    return item['label']
     except Exception as e:
         logger.error(f'❌ Error: Failed to retrieve blueprint name - {e}')
 
@@ -5382,10 +6086,47 @@ def build_errors_in_uncommitted_bps(uncommitted_bps_w_errors):
     except Exception as e:
         logger.error(f"❌ An error occurred while analyzing if there are uncommitted blueprints with build errors: {e}")
 
+def parse_revision_timestamp(created_at):
+    '''
+    Parse the creation timestamp of a Time Voyager revision (UTC, e.g. '2024-01-31T10:20:30.123456Z') into epoch seconds.
+
+    Args:
+        created_at (str): The 'created_at' field of the revision.
+
+    Returns:
+        float: The timestamp in epoch seconds, or infinity if it is missing or cannot be parsed (sorts last).
+    '''
+    if not created_at:
+        return float('inf')
+    try:
+        return datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        try:
+            return datetime.fromisoformat(created_at.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            return float('inf')
+
+def format_revision_timestamp(revision):
+    '''
+    Format the creation timestamp of a Time Voyager revision as 'YYYY-MM-DD HH:MM:SS' (UTC).
+
+    Args:
+        revision (dict): The revision, optionally carrying the '_created_ts' field already parsed.
+
+    Returns:
+        str: The formatted timestamp, or 'N/A' if it is not available.
+    '''
+    created_ts = revision.get('_created_ts')
+    if created_ts is None:
+        created_ts = parse_revision_timestamp(revision.get('created_at'))
+    if created_ts == float('inf'):
+        return "N/A"
+    return datetime.fromtimestamp(created_ts, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
 def rollback_bp(bp_name, revision=1):
 
     try:
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = get_aos_token()
         bp_id = get_bp_id(bp_name)
@@ -5401,7 +6142,7 @@ def rollback_bp(bp_name, revision=1):
             url = f'https://{aos_ip}/api/blueprints/{bp_id}/rollback'
             data = json.dumps({'revision_id' : bp_revision['revision_id']})
             headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-            response = requests.post(url, headers=headers, data=data, verify=False)
+            response = sm.get_aos_session().post(url, headers=headers, data=data)
             response.raise_for_status()
             if response.status_code == 202:
                 logger.info(f'Blueprint {bp_name} rolled back to revision id {bp_revision["revision_id"]} created by {bp_revision["user"]} ({bp_revision["user_ip"]}) at {bp_revision["created_at"]} with the comment: {bp_revision["description"]}')
@@ -5423,28 +6164,37 @@ def get_rack_id(bp_name, rack_name):
         str: Rack ID.
     '''
     try:
-        sm = Scope_Manager()
-        aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
-        bp_id = get_bp_id(bp_name)
-        url = f'https://{aos_ip}/api/blueprints/{bp_id}/racks'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-
-        response = requests.get(url, headers=headers, verify=False)
-        response.raise_for_status()  # Ensure status code is 2xx
-
-        data = response.json()
-        for item in data['items']:
-            if item['label'] == rack_name:
-                return item['rack_id']  # Return the rack ID if found
-
-        # If rack_name not found in response
-        return None
+        return get_bp_rack_ids(bp_name).get(rack_name)  # None if rack_name is not found
 
     except Exception as e:
         logger.error(f"❌ Error: Failed to retrieve rack ID - {e}")
         return None
 
+def get_bp_rack_ids(bp_name):
+    '''
+    Get the IDs of all the racks of a blueprint from the AOS API (exceptions are raised to the caller).
+
+    Args:
+        bp_name (str): Blueprint name.
+
+    Returns:
+        dict: {rack name: rack ID}. When several racks share a name, the first one is kept.
+    '''
+    sm = get_shared_scope_manager()
+    aos_ip = sm.get('aos_ip')
+    aos_token = sm.get('aos_token')
+    bp_id = get_bp_id(bp_name)
+    url = f'https://{aos_ip}/api/blueprints/{bp_id}/racks'
+    headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
+
+    response = sm.get_aos_session().get(url, headers=headers)
+    response.raise_for_status()  # Ensure status code is 2xx
+
+    rack_ids = {}
+    for item in response.json()['items']:
+        rack_ids.setdefault(item['label'], item['rack_id'])
+    return rack_ids
+
 def get_dev_model(chassis_sn):
     '''
     Get the device model information from the AOS API for a given chassis serial number.
@@ -5456,12 +6206,12 @@ def get_dev_model(chassis_sn):
         str: Device model information.
     '''
     try:
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         url = f'https://{aos_ip}/webcons/Main/aos/v0/device/deployment/config/{chassis_sn}/field/deviceModel'
         headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=headers)
         response.raise_for_status()
         return response.text.split("\n", 4)[4].rsplit("\n", 4)[0]
     except Exception as e:
@@ -5478,13 +6228,13 @@ def get_cabling_map(bp_name):
         str: Cabling Map information.
     '''
     try:
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
         url = f'https://{aos_ip}/api/blueprints/{bp_id}/experience/web/cabling-map'
         headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=headers)
         response.raise_for_status()
         return response.text
     except Exception as e:
@@ -5501,13 +6251,13 @@ def get_subinterfaces(bp_name):
         str: Subinterface information.
     '''
     try:
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
         url = f'https://{aos_ip}/api/blueprints/{bp_id}/experience/web/subinterfaces'
         headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=headers)
         response.raise_for_status()
         if response.status_code == 200:
             return response.json()
@@ -5525,13 +6275,13 @@ def upload_cabling_map(bp_name, cabling_map_json):
         cabling_map_json (dict): JSON data containing the updated cabling map information.
     '''
     try:
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
         url = f'https://{aos_ip}/api/blueprints/{bp_id}/cabling-map'
         headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-        response = requests.patch(url, headers=headers, data=cabling_map_json, verify=False)
+        response = sm.get_aos_session().patch(url, headers=headers, data=cabling_map_json)
         return response.status_code == 204
     except Exception as e:
         logger.error(f'❌ Error: Failed to upload cabling map - {e}')
@@ -5539,7 +6289,7 @@ def upload_cabling_map(bp_name, cabling_map_json):
 
 def delete_rack(bp_name, rack_name):
     '''
-    Delete a rack from a blueprint by its ID.
+    Delete a rack from a blueprint by its name.
 
     Args:
         bp_name (str): Blueprint name.
@@ -5548,24 +6298,54 @@ def delete_rack(bp_name, rack_name):
     Returns:
         bool: True if the rack was successfully deleted, False otherwise.
     '''
+    return rack_name in delete_racks_from_bp(bp_name, [rack_name])
+
+def delete_racks_from_bp(bp_name, rack_names):
+    '''
+    Delete several racks from a blueprint with a single request, since the 'delete-racks' endpoint takes a list of rack IDs
+    (instead of one request per rack, each one looking up the racks of the blueprint again).
+    If Apstra rejects the batch (e.g. one of the racks cannot be deleted), the racks are deleted one by one instead,
+    so that a single rack does not block the deletion of the others.
+
+    Args:
+        bp_name (str): Blueprint name.
+        rack_names (list): Names of the racks to delete. Racks not found in the blueprint are skipped.
+
+    Returns:
+        list: Names of the deleted racks (empty if none was found or all the deletions failed).
+    '''
     try:
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
-        rack_id = get_rack_id(bp_name, rack_name)
         url = f'https://{aos_ip}/api/blueprints/{bp_id}/delete-racks'
-
-        data = json.dumps({'racks_to_delete': [rack_id]})
         headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
 
-        response = requests.post(url, headers=headers, data=data, verify=False)
+        # Resolve all the rack IDs from a single listing of the racks of the blueprint
+        rack_ids = get_bp_rack_ids(bp_name)
+        racks_to_delete = {rack_name: rack_ids[rack_name] for rack_name in rack_names if rack_name in rack_ids}
+        if not racks_to_delete:
+            return []
+
+        def post_delete_racks(rack_id_list):
+            response = sm.get_aos_session().post(url, headers=headers, data=json.dumps({'racks_to_delete': rack_id_list}))
+            if response.status_code != 201:
+                logger.error(f"❌ Error: Failed to delete racks {rack_id_list} from blueprint {bp_name} - {response.status_code} {response.text}")
+            return response.status_code == 201
+
+        if post_delete_racks(list(racks_to_delete.values())):
+            return list(racks_to_delete)
 
-        return response.status_code == 201
+        if len(racks_to_delete) == 1:
+            return []
+
+        # The batch was rejected as a whole: delete the racks one by one, keeping the ones that can be deleted
+        return [rack_name for rack_name, rack_id in racks_to_delete.items() if post_delete_racks([rack_id])]
 
     except Exception as e:
-        logger.error(f"❌ Error: An unexpected error occurred while deleting rack {rack_id} from blueprint {bp_id} - {e}")
-        return False
+        logger.error(f"❌ Error: An unexpected error occurred while deleting racks {rack_names} from blueprint {bp_name} - {e}")
+        return []
 
 def update_subinterfaces(bp_name, ip_dict):
     '''
@@ -5576,14 +6356,14 @@ def update_subinterfaces(bp_name, ip_dict):
         ip_dict (dict): Dictionary with the interface IDs and the IP addresses assigned to each of them.
     '''
     try:
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
         url = f'https://{aos_ip}/api/blueprints/{bp_id}/subinterfaces'
         data = json.dumps({'subinterfaces' : ip_dict})
         headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-        response = requests.patch(url, headers=headers, data=data, verify=False)
+        response = sm.get_aos_session().patch(url, headers=headers, data=data)
         response.raise_for_status()
         return response.status_code == 204
     except Exception as e:
@@ -5601,12 +6381,20 @@ def get_non_bp_changes_tgz(current_tgz, previous_tgz):
         non_bp_menus_with_changes (list): List of menu sections that have changes.
         all_non_bp_diff (dict): Dictionary where each key is a menu and its value categorizes changes into
                                 'added', 'changed', and 'removed'.
+
+    Note:
+        The result is memoized on the path, modification time and size of both TGZ files, so that the archives
+        are not extracted and compared again if they have not changed since the previous call.
     '''
 
     if not current_tgz:
         logger.warning("❌ Missing current TGZ file. No comparison will be performed.")
         return [], {}
 
+    cache_key = (get_file_signature(current_tgz), get_file_signature(previous_tgz))
+    if cache_key in non_bp_changes_cache:
+        return non_bp_changes_cache[cache_key]
+
     current_dir = tempfile.mkdtemp()
     previous_dir = tempfile.mkdtemp()
 
@@ -5618,12 +6406,31 @@ def get_non_bp_changes_tgz(current_tgz, previous_tgz):
 
         # Call function to get non-blueprint changes
         non_bp_menus_w_changes, all_non_bp_diff = get_non_bp_changes(current_dir, previous_dir)
+        non_bp_changes_cache[cache_key] = (non_bp_menus_w_changes, all_non_bp_diff)
         return non_bp_menus_w_changes, all_non_bp_diff
 
     except Exception as e:
         logger.error(f"❌ Error processing TGZ files: {e}")
         return [], {}
 
+def get_file_signature(file_path):
+    '''
+    Build a signature of a file made up of its path, modification time and size.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Returns:
+        tuple: (file_path, mtime_ns, size), with None for mtime_ns and size if the file does not exist.
+    '''
+    if not file_path:
+        return (file_path, None, None)
+    try:
+        file_stat = os.stat(file_path)
+        return (file_path, file_stat.st_mtime_ns, file_stat.st_size)
+    except OSError:
+        return (file_path, None, None)
+
 def get_non_bp_changes(current_dir, previous_dir):
     '''
     Identify and list the Apstra sections other than blueprints that have changes between two specific executions.
@@ -5668,7 +6475,7 @@ def get_non_bp_changes(current_dir, previous_dir):
                         previous_configlet = os.path.join(previous_dir, "input", "design", "configlets", configlet_filename)
 
                         if os.path.exists(previous_configlet) and os.path.exists(current_configlet):
-                            if get_md5(current_configlet) != get_md5(previous_configlet):
+                            if get_content_hash(current_configlet) != get_content_hash(previous_configlet):
                                 j2_comparison = compare_j2(previous_configlet, current_configlet)
                                 if j2_comparison:
                                     configlet_diff = process_diff(j2_comparison, previous_configlet, current_configlet, configlet_name=configlet_name)
@@ -5680,7 +6487,7 @@ def get_non_bp_changes(current_dir, previous_dir):
                                             all_configlet_diff["configlet_contents"].setdefault(key, []).extend(value)
 
                 # Detect changes in YAML files for both 'resources' and 'design' sections
-                if get_md5(current_yaml) != get_md5(previous_yaml):
+                if get_content_hash(current_yaml) != get_content_hash(previous_yaml):
                     non_bp_menus_with_changes.append(menu)
                     yaml_comparison = compare_yaml(current_yaml, previous_yaml)
                     if yaml_comparison:
@@ -5772,7 +6579,7 @@ def get_all_devices():
     # logger.info(f"🔍 Fetching device details.")
 
     try:
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
 
@@ -5783,7 +6590,7 @@ def get_all_devices():
             'Content-Type': 'application/json',
             'Cache-Control': 'no-cache'
         }
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=headers)
         response.raise_for_status()
 
         # Process the response and extract relevant device data
@@ -5887,7 +6694,7 @@ def get_bp_device_ids(bp_name):
         if not bp_name:
             return []
 
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
@@ -5902,7 +6709,7 @@ def get_bp_device_ids(bp_name):
             'Cache-Control': 'no-cache'
         }
 
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=headers)
         response.raise_for_status()
 
         # Process the response and extract relevant device data
@@ -5934,7 +6741,7 @@ def get_device_config_context(bp_name, device_id, hostname):
     try:
         logger.info(f"🔍🔧 Fetching context for '{hostname}' (blueprint '{bp_name}')...")
 
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
@@ -5945,7 +6752,7 @@ def get_device_config_context(bp_name, device_id, hostname):
             'Cache-Control': 'no-cache'
         }
 
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -5972,7 +6779,7 @@ def get_device_config_incremental(bp_name, device_id, hostname):
     try:
         logger.info(f"🔍📶 Fetching config_incremental for '{hostname}' (blueprint '{bp_name}')...")
 
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
@@ -5983,7 +6790,7 @@ def get_device_config_incremental(bp_name, device_id, hostname):
             'Cache-Control': 'no-cache'
         }
 
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -6009,7 +6816,7 @@ def get_device_config_rendering(bp_name, device_id, hostname):
     try:
         logger.info(f"🔍📸 Fetching config_rendering for '{hostname}' (blueprint '{bp_name}')...")
 
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
@@ -6020,7 +6827,7 @@ def get_device_config_rendering(bp_name, device_id, hostname):
             'Cache-Control': 'no-cache'
         }
 
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -6046,7 +6853,7 @@ def get_device_config(bp_name, device_id, hostname):
     try:
         logger.info(f"🔍🛠️  Fetching config for '{hostname}' (blueprint '{bp_name}')...")
 
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         url = f'https://{aos_ip}/api/systems/{device_id}/configuration'
@@ -6056,7 +6863,7 @@ def get_device_config(bp_name, device_id, hostname):
             'Cache-Control': 'no-cache'
         }
 
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -6120,12 +6927,12 @@ def get_all_blueprint_data():
         list: A list of dictionaries containing relevant blueprint data.
     '''
     try:
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_token = sm.get('aos_token')
         aos_ip = sm.get('aos_ip')
         url = f'https://{aos_ip}/api/blueprints'
         headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=headers)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -6189,13 +6996,13 @@ def get_bp_diff_status(bp_name):
             * staging_version
     '''
     try:
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
         url = f'https://{aos_ip}/api/blueprints/{bp_id}/diff-status'
         headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=headers)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -6245,13 +7052,13 @@ def get_bp_diff(bp_name, mode = 'full'):
             * virtual_network
     '''
     try:
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
         url = f'https://{aos_ip}/api/blueprints/{bp_id}/diff?mode={mode}'
         headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=headers)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -6476,24 +7283,23 @@ def print_panel_non_bp_diff(menu, table_changes_count, table_changes):
         # Handle any error that occurs while creating or printing the panel
         logger.error(f"❌ An error occurred while displaying the change overview for {menu}: {e}")
 
-def get_deploy_status(bp_name):
+def get_deploy_status(bp_name, sm=None):
     '''
     Get deploy status of the blueprint from the AOS API using a given blueprint name.
 
     Args:
         bp_name (str): Blueprint name.
+        sm (Scope_Manager, optional): Scope manager whose AOS session is reused (useful when polling). Defaults to the shared one.
 
     Returns:
         dic: deploy_status.
     '''
     try:
-        sm = Scope_Manager()
+        sm = sm or get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
-        aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
         url = f'https://{aos_ip}/api/blueprints/{bp_id}/deploy'
-        headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=sm.get_aos_headers())
         response.raise_for_status()
         data = response.json()
         return data
@@ -6516,7 +7322,7 @@ def revert_bp(bp_name):
 
     try:
         bp_id = get_bp_id(bp_name)
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         url = f'https://{aos_ip}/api/blueprints/{bp_id}/revert'
@@ -6529,14 +7335,14 @@ def revert_bp(bp_name):
 
         # Retry mechanism for initial request
         for attempt in range(1, max_retries + 1):
-            response = requests.post(url, headers=headers, verify=False)
+            response = sm.get_aos_session().post(url, headers=headers)
 
             if response.status_code == 202:
                 logger.info("⏳ Initial revert request accepted. Polling for completion...")
 
                 # Poll until the process completes
                 for poll_attempt in range(1, max_poll_attempts + 1):
-                    poll_response = requests.post(url, headers=headers, verify=False)
+                    poll_response = sm.get_aos_session().post(url, headers=headers)
 
                     if poll_response.status_code == 202:
                         logger.info(f"🟢 Polling attempt {poll_attempt}/{max_poll_attempts}: Revert process completed successfully!")
@@ -6580,7 +7386,7 @@ def delete_bp(bp_name):
     '''
 
     try:
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
@@ -6594,16 +7400,19 @@ def delete_bp(bp_name):
 
         # Retry mechanism for initial request
         for attempt in range(1, max_retries + 1):
-            response = requests.delete(url, headers=headers, verify=False)
+            response = sm.get_aos_session().delete(url, headers=headers)
 
             if response.status_code == 202:
                 # # Revert successful
                 # return True
 
+                # The blueprint is being removed, its ID must not be served from the memoized list of blueprints anymore
+                invalidate_aos_catalog('blueprints')
+
                 logger.info("⏳ Initial delete request accepted. Polling for completion...")
                 # Poll until the process completes
                 for poll_attempt in range(1, max_poll_attempts + 1):
-                    poll_response = requests.delete(url, headers=headers, verify=False)
+                    poll_response = sm.get_aos_session().delete(url, headers=headers)
 
                     if poll_response.status_code == 404:
                         logger.info(f"🟢 Polling attempt {poll_attempt}/{max_poll_attempts}: Removal process completed successfully!")
@@ -6670,7 +7479,7 @@ def run_commit_check(bp_name, device_id, hostname):
         max_poll_attempts = 10  # Maximum polling attempts
         poll_delay = 3  # Seconds between poll attempts
 
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
@@ -6681,7 +7490,7 @@ def run_commit_check(bp_name, device_id, hostname):
 
         # Polling loop for commit check execution completion
         for poll_attempt in range(1, max_poll_attempts + 1):
-            response = requests.post(url, headers=headers, verify=False)
+            response = sm.get_aos_session().post(url, headers=headers)
 
             if response.status_code == 202:
                 logger.info(f"🟢 Polling attempt {poll_attempt}/{max_poll_attempts}: Commit check execution for '{hostname}' (blueprint '{bp_name}') completed successfully!")
@@ -6725,7 +7534,7 @@ def get_commit_check_result(bp_name, device_id, hostname):
         max_poll_attempts = 10  # Maximum polling attempts
         poll_delay = 3  # Seconds between poll attempts
 
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
@@ -6736,7 +7545,7 @@ def get_commit_check_result(bp_name, device_id, hostname):
 
         # Polling loop for commit check retrieval completion
         for poll_attempt in range(1, max_poll_attempts + 1):
-            response = requests.get(url, headers=headers, verify=False)
+            response = sm.get_aos_session().get(url, headers=headers)
 
             if response.status_code != 200:
                 logger.error(f"❌ Polling attempt {poll_attempt}/{max_poll_attempts}: API request failed with status code {response.status_code}")
@@ -6773,7 +7582,7 @@ def get_placeholder_racks():
     '''
     placeholder_racks = {}
 
-    sm = Scope_Manager()
+    sm = get_shared_scope_manager()
     bp_list = sm.blueprints  # Get the list of blueprints
 
     if isinstance(bp_list, list):
@@ -6866,7 +7675,7 @@ def generate_execution_history(all_customers=False, customer=None, domain=None,
 
                     try:
                         with open(execution_data_file, 'r') as f:
-                            execution_data = yaml.safe_load(f) or {}
+                            execution_data = yaml.load(f, Loader=YamlSafeLoader) or {}
 
                         # Ensure 'execution_id' exists for sorting; otherwise, skip
                         if 'execution_id' not in execution_data:
@@ -6930,7 +7739,7 @@ def write_execution_history(execution_data, all_customers=False, customer=None,
 
         # Write execution data to YAML
         with open(yaml_filepath, 'w') as yamlfile:
-            yaml.safe_dump(execution_data, yamlfile, default_flow_style=False, sort_keys=False)
+            yaml.dump(execution_data, yamlfile, Dumper=YamlSafeDumper, default_flow_style=False, sort_keys=False)
 
         logger.info(f"📝 YAML file successfully created at '{yaml_filepath}'")
 
@@ -7049,7 +7858,7 @@ def get_bp_build_errors(bp_name):
     '''
 
     try:
-        sm = Scope_Manager()
+        sm = get_shared_scope_manager()
         aos_ip = sm.get('aos_ip')
         aos_token = sm.get('aos_token')
         bp_id = get_bp_id(bp_name)
@@ -7057,7 +7866,7 @@ def get_bp_build_errors(bp_name):
         url = f'https://{aos_ip}/api/blueprints/{bp_id}/errors'
         headers = {'AuthToken': aos_token, 'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
 
-        response = requests.get(url, headers=headers, verify=False)
+        response = sm.get_aos_session().get(url, headers=headers)
         response.raise_for_status()
         if response.status_code == 200:
             return response.json()
@@ -7160,7 +7969,7 @@ def print_build_errors(bps_w_errors):
                                 build_error_args[0].get('entity_type','-'),
                                 build_error_args[0].get('error_type','-'),
                                 build_error_args[0].get('message','-'),
-                                yaml.dump(build_error_args[0].get('resolutions','-'), default_flow_style=False, sort_keys=False),
+                                yaml.dump(build_error_args[0].get('resolutions','-'), Dumper=YamlSafeDumper, default_flow_style=False, sort_keys=False),
                             )
                     # else:
                     #     logger.info(f'Build Error Type {build_error_type} pending to be considered for display.\n')
@@ -7302,6 +8111,9 @@ def run_apaf_terraform(input_params):
             # -- Ensure the creation and management of "execution" folders in the "wip" staging area
             sm.manage_execution_dirs("initial_stage")
 
+            # -- The Terraform command is settled at this point, so parse its action ('apply', 'destroy', ...) once
+            tf_action = get_terraform_action(sm.terraform_command)
+
             if is_terraform_apply or is_terraform_destroy:
 
                 # ---------------------------------------------------------------------------- #
@@ -7344,7 +8156,7 @@ def run_apaf_terraform(input_params):
                 sm.run_terraform()
 
                 display = False
-                if 'terraform apply' in sm.terraform_command and not sm.post_rollback:
+                if tf_action == 'apply' and not sm.post_rollback:
                     display = True
                     print("\n")
                     logger.info("📊 Summary of the staged changes performed on Apstra as a result of applying the Terraform Plan:\n")
@@ -7371,7 +8183,7 @@ def run_apaf_terraform(input_params):
                             print("\n")
                             if sm.post_rollback:
                                 sm.exit_manager("BLOCKED_EXECUTIONS")
-                            elif "terraform destroy" in sm.terraform_command:
+                            elif tf_action == 'destroy':
                                 sm.exit_manager("TF_EXEC_W_ERRORS_DESTROY")
                             else:
                                 # -- In interactive mode, prompt the user to press Enter to initiate the rollback process
@@ -7387,14 +8199,14 @@ def run_apaf_terraform(input_params):
                 # -- Execute this section only if:
                 #    - Either it is a 'terraform destroy'
                 #    - Or it is a 'terraform apply' and there are changes either in the Non-blueprint menus or in the Blueprint menu
-                if 'terraform destroy' in sm.terraform_command or ('terraform apply' in sm.terraform_command and (list_non_bp_menus_w_changes_last_exec or sm.uncommitted_bps)):
+                if tf_action == 'destroy' or (tf_action == 'apply' and (list_non_bp_menus_w_changes_last_exec or sm.uncommitted_bps)):
 
                     # -- Get commit check status only if there are uncomitted blueprints
                     if sm.uncommitted_bps:
                         sm.commit_check(display)
 
                     while True:
-                        if 'terraform destroy' in sm.terraform_command:
+                        if tf_action == 'destroy':
                             table_final_deploy = build_table_deploy(sm.terraform_command, sm.uncommitted_bps, 'commit', sm.get('post_commit_comment'), 'final', list_non_bp_menus_w_changes_last_exec)
                             print('\r')
                             print_panel_deploy_handling_plan(table_final_deploy, "POST-EVENTS")
@@ -7423,7 +8235,7 @@ def run_apaf_terraform(input_params):
 
                         if opt == 1:
                             loop_again = False
-                            if 'terraform destroy' not in sm.terraform_command and sm.get('post_commit_action') == 'revert':
+                            if tf_action != 'destroy' and sm.get('post_commit_action') == 'revert':
                                 loop_again = sm.prompt_reconfirm_revert()
                             if not loop_again:
                                 break
@@ -7451,7 +8263,7 @@ def run_apaf_terraform(input_params):
                         sm.save_blueprint_data()
 
                 # Archive the executions if it is a Terraform destroy action
-                if 'terraform destroy' in sm.terraform_command:
+                if tf_action == 'destroy':
                     sm.exit_manager("USER_TF_EXEC_DESTROY")
                 else:
                     sm.exit_manager("USER_TF_EXEC_COMMIT")
@@ -7478,6 +8290,116 @@ def run_apaf_terraform(input_params):
 # Limit imposed by Apstra.
 max_permanent_revisions = 25
 
+# Maximum age (in seconds) of a cached list of Time Voyager revisions of a blueprint.
+revision_list_cache_ttl = 10
+
+# Regular expression matching ANSI escape sequences (terminal colors, bold, underlines, etc.) in command outputs.
+ansi_escape_regex = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Algorithm of the checksums used to detect content changes (see 'get_content_hash'): 'blake2b' or any 'hashlib' algorithm (e.g. 'md5').
+content_hash_algorithm = 'blake2b'
+
+# Regular expression matching the keys (['key']) and list indexes ([0]) of a DeepDiff path, e.g. "root['a'][0]['b']".
+diff_path_regex = re.compile(r"\['(.*?)'\]|\[(\d+)\]")
+
+# Regular expression capturing the top-level key and the last segment of a DeepDiff path, e.g. "root['a'][0]['name']".
+diff_path_segments_regex = re.compile(r"^root\['(.*?)'\](?:.*\[(.*?)\])?$")
+
+# Session shared by all the calls to the Apstra API (see 'Scope_Manager.get_aos_session'), and the lock guarding its creation.
+aos_session = None
+aos_session_lock = threading.Lock()
+
+# Order in which the objects added outside of the blueprints are removed by 'remove_non_bp_added': the objects of a tier
+# are removed concurrently, and a tier only starts once the previous one is done (referencing objects go first).
+non_bp_removal_tiers = [
+    [('design', 'interface_maps')],
+    [('design', 'templates'), ('design', 'configlets'), ('design', 'configlet_contents'), ('design', 'property_sets'),
+     ('resources', 'ipv4_pools'), ('resources', 'ipv6_pools'), ('resources', 'vni_pools'), ('resources', 'asn_pools')],
+    [('design', 'racks')],
+    [('design', 'logical_devices')],
+]
+
+# AOS catalog (see 'aos_catalogs') of each kind of object removed by 'remove_non_bp_added'.
+non_bp_removal_catalogs = {
+    'interface_maps': 'interface_maps',
+    'templates': 'templates',
+    'racks': 'rack_types',
+    'logical_devices': 'logical_devices',
+    'configlets': 'configlets',
+    'configlet_contents': 'configlets',
+    'property_sets': 'property_sets',
+    'ipv4_pools': 'ip_pools',
+    'ipv6_pools': 'ipv6_pools',
+    'vni_pools': 'vni_pools',
+    'asn_pools': 'asn_pools',
+}
+
+# Scope_Manager shared by the AOS API helpers (see 'get_shared_scope_manager'): (timestamp, scope file key, instance),
+# the lock guarding it and its maximum age (in seconds).
+shared_scope_manager = None
+shared_scope_manager_lock = threading.Lock()
+shared_scope_manager_ttl = 300
+
+# Maximum number of concurrent requests (and pooled connections) towards the Apstra API.
+aos_api_max_workers = 8
+
+# Maximum number of threads writing per-device snapshot files concurrently.
+device_io_max_workers = 16
+
+# Maximum number of threads unlinking files concurrently in 'remove_directory'.
+remove_directory_max_workers = 16
+
+# Size (in bytes) of the write buffer of the generated reports (e.g. the Terraform plan summary).
+output_file_buffer_size = 1 << 20
+
+# Number of files read ahead concurrently (and maximum size in bytes of each of them) when creating a .tgz file with 'tarfile'.
+tgz_prefetch_batch_size = 256
+tgz_prefetch_max_file_size = 2 << 20
+
+# AOS catalogs handled by the generic API helpers ('get_aos_catalog', 'get_aos_catalog_id' and 'delete_aos_catalog_item'):
+# {catalog: (API path, key holding the object names, object label used in the logs, status code of a successful deletion)}.
+aos_catalogs = {
+    'templates': ('design/templates', 'display_name', 'Template', 204),
+    'rack_types': ('design/rack-types', 'display_name', 'Rack Type', 204),
+    'logical_devices': ('design/logical-devices', 'display_name', 'Logical Device', 200),
+    'interface_maps': ('design/interface-maps', 'label', 'Interface Map', 200),
+    'property_sets': ('property-sets', 'label', 'Property Set', 204),
+    'configlets': ('design/configlets', 'display_name', 'Configlet', 204),
+    'ip_pools': ('resources/ip-pools', 'display_name', 'IP Pool', 202),
+    'ipv6_pools': ('resources/ipv6-pools', 'display_name', 'IPv6 Pool', 202),
+    'vni_pools': ('resources/vni-pools', 'display_name', 'VNI Pool', 202),
+    'asn_pools': ('resources/asn-pools', 'display_name', 'ASN Pool', 202),
+    'blueprints': ('blueprints', 'label', 'Blueprint', 202),
+}
+
+# AOS catalogs memoized by 'get_aos_catalog': {catalog: (timestamp, data, version)}.
+aos_catalog_cache = {}
+
+# Version of each AOS catalog, bumped by every successful deletion, so that only stale memoized catalogs are fetched again.
+aos_catalog_versions = {}
+
+# Name to ID indexes of the memoized AOS catalogs (see 'get_aos_catalog_id'): {catalog: (data, index)}.
+aos_catalog_index_cache = {}
+
+# Design/blueprint device name indexes of the last switches list looked up (see 'get_switch_name_indexes'): {'indexes': (switches, length, indexes)}.
+switch_name_index_cache = {}
+
+# Maximum age (in seconds) of a memoized AOS catalog.
+aos_catalog_cache_ttl = 60
+
+# Size (in bytes) of the head and tail samples compared before the whole contents in 'compare_directories'.
+compare_sample_size = 4096
+
+# Maximum size (in MB) of the project log file before it gets rotated.
+project_log_max_size_mb = 10
+
+# YAML flow style of the raw snapshots (raw blueprint, device and commit check data).
+# False keeps the fully expanded block style, None lets the emitter write leaf collections inline (smaller and faster to write/read).
+raw_snapshot_flow_style = False
+
+# File format of the raw snapshots: 'yaml' (human readable) or 'json' (faster to write, convert with `json2yaml` when needed).
+raw_snapshot_format = 'yaml'
+
 execution_history_options = [
     'all-customers',
     'customer-wide',
@@ -7508,6 +8430,11 @@ terraform_commands_destroy = {
     'da': 'terraform destroy -auto-approve',  # Handle with care!
 }
 
+terraform_actions_apply_destroy = frozenset({'apply', 'destroy'})
+
+# Terraform plan actions that represent an actual change of a resource
+tfplan_change_actions = frozenset({'create', 'update', 'delete'})
+
 list_successful_exit_codes = [
     "USER_TF_EXEC_COMMIT",
     "USER_TF_EXEC_DESTROY",
@@ -7561,3 +8488,13 @@ scope_file_path = os.path.join(scope_path, scope_filename)
 
 non_blueprint_menus = ['resources', 'design']
 
+# Memoized results of get_non_bp_changes_tgz, keyed on the signature (path, mtime, size) of both TGZ files
+non_bp_changes_cache = {}
+
+# gzip compression level of the .tgz archives (tarfile defaults to 9, which is much slower for a marginal size gain).
+tgz_compress_level = 6
+
+# Parsed contents of the files loaded through 'load_file_cached' (diff cycles, 'yamldecode', 'merge_yaml_files'), keyed on the loader and the file signature
+parsed_file_cache = {}
+parsed_file_cache_max_entries = 128
+